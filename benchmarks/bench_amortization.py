@@ -0,0 +1,76 @@
+"""Loan scenarios per second: month-by-month loop vs. closed form vs. batch schedule.
+
+Usage: python benchmarks/bench_amortization.py [--scenarios 1000000] [--months 360]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from amortization import batch_schedule, simulate, summarize_many  # noqa: E402
+
+
+def scenarios(count, seed=0):
+    rng = random.Random(seed)
+    principals = [rng.uniform(1_000, 500_000) for _ in range(count)]
+    rates = [rng.uniform(0, 12) for _ in range(count)]
+    payments = [p / rng.uniform(24, 400) + 10 for p in principals]
+    return principals, rates, payments
+
+
+def timed(label, count, func):
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<28} {seconds:>8.2f}s {count / seconds:>14,.0f} scenarios/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenarios", type=int, default=1_000_000)
+    parser.add_argument("--months", type=int, default=360)
+    parser.add_argument(
+        "--loop-sample", type=int, default=20_000, help="scenarios run through the loop"
+    )
+    parser.add_argument("--schedule-scenarios", type=int, default=100_000)
+    args = parser.parse_args()
+
+    principals, rates, payments = scenarios(args.scenarios)
+    sample = args.loop_sample
+    timed(
+        f"loop ({sample:,} sample)",
+        sample,
+        lambda: list(
+            map(
+                simulate,
+                principals[:sample],
+                rates[:sample],
+                payments[:sample],
+                [args.months] * sample,
+            )
+        ),
+    )
+    timed(
+        "closed form",
+        args.scenarios,
+        lambda: summarize_many(principals, rates, payments, args.months),
+    )
+    # a full schedule keeps months x scenarios doubles, so it runs on a subset
+    count = min(args.scenarios, args.schedule_scenarios)
+    timed(
+        f"batch schedule ({count:,})",
+        count,
+        lambda: batch_schedule(
+            principals[:count], rates[:count], payments[:count], args.months
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
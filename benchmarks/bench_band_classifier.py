@@ -0,0 +1,100 @@
+"""Temperature classification: the per-call if/elif chain vs. BandClassifier.
+
+Readings are uniform over -50..120 degrees, so every band is hit.
+
+* chain         the old condition_demo (one if/elif chain per reading), labels
+* label         BandClassifier.label per reading (bisect), labels
+* codes/pure    BandClassifier.codes on a list, map(bisect_right) path
+* codes/numpy   BandClassifier.codes on a list (includes the list -> ndarray copy)
+* codes/ndarray BandClassifier.codes on a float64 ndarray (sensor buffers)
+* counts        BandClassifier.counts over a generator stream, numpy path
+
+Usage: python benchmarks/bench_band_classifier.py [--size 1000000]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+import bandClassifier  # noqa: E402
+from bandClassifier import BandClassifier  # noqa: E402
+
+
+def chain(temperature):
+    if temperature < 0:
+        return "It's freezing!"
+    elif 0 <= temperature < 20:
+        return "It's cold."
+    elif 20 <= temperature < 30:
+        return "It's warm."
+    elif temperature >= 80:
+        return "It's too hot. Stay indoors."
+    else:
+        return "It's hot!"
+
+
+def best_of(function, repeat=3):
+    gc.disable()
+    try:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+    finally:
+        gc.enable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+    rng = random.Random(0)
+    readings = [rng.uniform(-50, 120) for _ in range(args.size)]
+    classifier = BandClassifier()
+    numpy = bandClassifier._np
+
+    def pure_codes():
+        bandClassifier._np = None
+        try:
+            return classifier.codes(readings)
+        finally:
+            bandClassifier._np = numpy
+
+    cases = [
+        ("chain", lambda: list(map(chain, readings))),
+        ("label", lambda: list(map(classifier.label, readings))),
+        ("codes/pure", pure_codes),
+    ]
+    if numpy is not None:
+        buffer = numpy.asarray(readings)
+        cases += [
+            ("codes/numpy", lambda: classifier.codes(readings)),
+            ("codes/ndarray", lambda: classifier.codes(buffer)),
+            ("counts", lambda: classifier.counts(r for r in readings)),
+        ]
+    expected = [classifier.code(r) for r in readings]
+    assert list(pure_codes()) == expected
+
+    print(f"{args.size:,} readings")
+    print(f"{'method':<14} {'seconds':>8} {'M readings/s':>13} {'vs chain':>9}")
+    baseline = None
+    for label, function in cases:
+        seconds = best_of(function)
+        baseline = baseline or seconds
+        print(
+            f"{label:<14} {seconds:>8.3f} {args.size / seconds / 1e6:>13.2f}"
+            f" {baseline / seconds:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""fileUtils: copy_file/move_file one at a time vs. bulk_copy/bulk_move.
+
+Two workloads are written to a temporary directory (or --dir) and removed
+afterwards: many small files and a few multi-GB files. Copies go to a second
+directory (--dest, default: next to the sources) so a different filesystem can
+be tried for the cross-device case.
+
+Usage: python benchmarks/bench_bulk_copy.py [--small 10000] [--small-kb 16]
+                                            [--large 3] [--large-gb 2]
+                                            [--workers 1 8] [--dir PATH]
+                                            [--dest PATH]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+import fileUtils  # noqa: E402
+
+
+def make_files(directory, count, size):
+    os.makedirs(directory)
+    block = os.urandom(min(size, 1 << 20))
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"file{i:06d}.bin")
+        with open(path, "wb") as file:
+            written = 0
+            while written < size:
+                written += file.write(block[: size - written])
+        paths.append(path)
+    return paths
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    files, total = func()
+    seconds = time.perf_counter() - start
+    print(
+        f"  {label:<30} {seconds:>8.2f}s {files / seconds:>10,.0f} files/s "
+        f"{total / seconds / 2**20:>9,.0f} MiB/s"
+    )
+
+
+def one_at_a_time(helper, pairs):
+    for src, dst in pairs:
+        helper(src, dst)
+    return len(pairs), sum(os.path.getsize(dst) for _, dst in pairs)
+
+
+def run(label, sources, dest_root, workers_list):
+    size = sum(map(os.path.getsize, sources))
+    print(f"{label}: {len(sources):,} files, {size / 2**20:,.0f} MiB")
+
+    def pairs(name):
+        target = os.path.join(dest_root, name)
+        os.makedirs(target, exist_ok=True)
+        return [(src, os.path.join(target, os.path.basename(src))) for src in sources]
+
+    def reset(name):
+        shutil.rmtree(os.path.join(dest_root, name), ignore_errors=True)
+
+    timed(
+        "copy_file (shutil.copy2)",
+        lambda: one_at_a_time(fileUtils.copy_file, pairs("a")),
+    )
+    reset("a")
+    for workers in workers_list:
+        timed(
+            f"bulk_copy workers={workers}",
+            lambda: tuple(fileUtils.bulk_copy(pairs("b"), workers)[:2]),
+        )
+        reset("b")
+    # moves: there and back again, so the sources stay in place
+    there = pairs("c")
+    timed("move_file (shutil.move)", lambda: one_at_a_time(fileUtils.move_file, there))
+    for dst, src in there:
+        shutil.move(src, dst)
+    there = pairs("c")
+    timed(
+        f"bulk_move workers={workers_list[-1]}",
+        lambda: tuple(fileUtils.bulk_move(there, workers_list[-1])[:2]),
+    )
+    fileUtils.bulk_move([(dst, src) for src, dst in there], workers_list[-1])
+    reset("c")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--small", type=int, default=10_000)
+    parser.add_argument("--small-kb", type=int, default=16)
+    parser.add_argument("--large", type=int, default=3)
+    parser.add_argument("--large-gb", type=float, default=2)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--dir", default=None, help="where to write the sources")
+    parser.add_argument("--dest", default=None, help="where to copy to")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="bench_bulk_copy_", dir=args.dir)
+    dest = tempfile.mkdtemp(prefix="bench_bulk_copy_dst_", dir=args.dest or root)
+    try:
+        small = make_files(os.path.join(root, "small"), args.small, args.small_kb << 10)
+        run("small files", small, dest, args.workers)
+        large = make_files(
+            os.path.join(root, "large"), args.large, int(args.large_gb * 2**30)
+        )
+        run("large files", large, dest, args.workers)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+        shutil.rmtree(dest, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Dice duels per second: one randint per roll vs. bulk-generated rolls.
+
+* randint       random.randint(1, sides) per die and a Python comparison per
+                duel, the way functions.py rolled its single duel
+* bulk/pure     diceDuel.simulate, randbytes + translate, map() sums
+* bulk/numpy    diceDuel.simulate, same rolls, numpy sums and winners
+
+Usage: python benchmarks/bench_dice_duel.py [--duels 1000000]
+                                            [--shapes 2x1d6 4x3d10]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+import diceDuel  # noqa: E402
+from diceDuel import simulate  # noqa: E402
+
+
+def randint_duels(duels, players, dice, sides, seed):
+    rng = random.Random(seed)
+    wins = [0] * players
+    ties = 0
+    for _ in range(duels):
+        totals = [
+            sum(rng.randint(1, sides) for _ in range(dice)) for _ in range(players)
+        ]
+        best = max(totals)
+        if totals.count(best) == 1:
+            wins[totals.index(best)] += 1
+        else:
+            ties += 1
+    return wins, ties
+
+
+def parse_shape(text):
+    # "4x3d10": 4 players, 3 dice of 10 sides each
+    players, dice = text.split("x")
+    dice, sides = dice.split("d")
+    return int(players), int(dice), int(sides)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duels", type=int, default=1_000_000)
+    parser.add_argument("--shapes", nargs="+", default=["2x1d6", "4x3d10"])
+    args = parser.parse_args()
+    numpy = diceDuel._np
+
+    def pure(*shape):
+        diceDuel._np = None
+        try:
+            return simulate(args.duels, *shape, seed=1)
+        finally:
+            diceDuel._np = numpy
+
+    print(f"{args.duels:,} duels")
+    print(f"{'shape':<8} {'method':<11} {'seconds':>8} {'duels/s':>12} {'speedup':>8}")
+    for text in args.shapes:
+        shape = parse_shape(text)
+        # the randint loop is slow: time a tenth of the duels and scale up
+        cases = [
+            ("randint", lambda: randint_duels(args.duels // 10, *shape, 1), 10),
+            ("bulk/pure", lambda: pure(*shape), 1),
+        ]
+        if numpy is not None:
+            cases.append(
+                ("bulk/numpy", lambda: simulate(args.duels, *shape, seed=1), 1)
+            )
+        baseline = None
+        for label, run, scale in cases:
+            start = time.perf_counter()
+            run()
+            seconds = (time.perf_counter() - start) * scale
+            baseline = baseline or seconds
+            print(
+                f"{text:<8} {label:<11} {seconds:>8.3f} {args.duels / seconds:>12,.0f}"
+                f" {baseline / seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
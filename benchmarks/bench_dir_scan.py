@@ -0,0 +1,148 @@
+"""dirScanner: one threaded scandir pass vs. file_demo's original repeated walks.
+
+A synthetic tree (``--files`` empty files spread over nested directories) is
+created in a temporary directory (or --dir) and removed afterwards. The
+"legacy" pass reproduces the old file_demo.main: two top-level scandir
+listings with ``os.path.getsize`` per file, plus a full ``os.walk`` (names
+only, no per-file metadata). "os.walk + os.stat" collects what ``scan_tree``
+collects - size and mtime of every file - the straightforward way.
+
+Usage: python benchmarks/bench_dir_scan.py [--files 1000000] [--fanout 32]
+                                           [--workers 1 4 16] [--dir PATH]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from dirScanner import scan_tree  # noqa: E402
+from dirSnapshot import Snapshot, refresh  # noqa: E402
+
+EXTENSIONS = (".txt", ".py", ".zip", ".csv", ".log")
+
+
+def make_tree(root, files, fanout, per_dir=100):
+    """Creates files empty files, per_dir per directory, fanout dirs per level."""
+    directories = max(1, files // per_dir)
+    created = 0
+    for d in range(directories):
+        # d -> nested path, e.g. fanout 32: d=1234 -> 1/6/18
+        parts, n = [], d
+        while True:
+            parts.append(str(n % fanout))
+            n //= fanout
+            if not n:
+                break
+        directory = os.path.join(root, *reversed(parts))
+        os.makedirs(directory, exist_ok=True)
+        for i in range(min(per_dir, files - created)):
+            open(
+                os.path.join(directory, f"f{i}{EXTENSIONS[i % len(EXTENSIONS)]}"), "wb"
+            ).close()
+        created += min(per_dir, files - created)
+    return created
+
+
+def legacy_pass(root):
+    count = 0
+    for _ in range(2):
+        for entry in os.scandir(root):
+            if entry.is_file():
+                os.path.getsize(entry.path)
+                os.path.splitext(entry.name)
+    for _, _, file_names in os.walk(root):
+        count += len(file_names)
+    return count
+
+
+def walk_stat_pass(root):
+    """Sizes and mtimes of every file the usual way: os.walk, then os.stat."""
+    count = 0
+    for directory, _, file_names in os.walk(root):
+        for name in file_names:
+            os.stat(os.path.join(directory, name))
+            os.path.splitext(name)
+            count += 1
+    return count
+
+
+def scanner_pass(root, workers):
+    return sum(1 for record in scan_tree(root, workers=workers) if not record.is_dir)
+
+
+def snapshot_benchmarks(root, snapshot_path):
+    exclude = {snapshot_path}
+    snapshot = Snapshot.take(root, exclude=exclude)
+    snapshot.save(snapshot_path)
+    entries = len(snapshot)
+    print(f"snapshot: {entries:,} entries, {os.path.getsize(snapshot_path):,} bytes")
+
+    def load():
+        Snapshot.load(snapshot_path, root)
+        return entries
+
+    def unchanged():
+        current, changes = refresh(Snapshot.load(snapshot_path, root), exclude=exclude)
+        assert not changes
+        return entries
+
+    timed(
+        "take snapshot (full walk)", lambda: len(Snapshot.take(root, exclude=exclude))
+    )
+    timed("load snapshot", load)
+    timed("refresh, nothing changed", unchanged)
+
+    files = [
+        p for p, is_dir in zip(snapshot.absolute_paths(), snapshot.dirs) if not is_dir
+    ]
+    for path in files[:: max(1, len(files) // 1000)]:
+        with open(path, "ab") as file:
+            file.write(b"changed")
+    open(os.path.join(os.path.dirname(files[0]), "added.txt"), "wb").close()
+
+    def changed():
+        _, changes = refresh(Snapshot.load(snapshot_path, root), exclude=exclude)
+        return entries
+
+    timed("refresh, ~0.1% changed", changed)
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    print(f"  {label:<28} {seconds:>8.2f}s {result / seconds:>12,.0f} files/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument("--fanout", type=int, default=32)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--dir", default=None, help="where to build the tree")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="bench_dir_scan_", dir=args.dir)
+    try:
+        start = time.perf_counter()
+        created = make_tree(root, args.files, args.fanout)
+        print(f"{created:,} files created in {time.perf_counter() - start:.1f}s")
+        timed("legacy (scandir x2 + walk)", lambda: legacy_pass(root))
+        timed("os.walk + os.stat", lambda: walk_stat_pass(root))
+        for workers in args.workers:
+            timed(f"scan_tree workers={workers}", lambda: scanner_pass(root, workers))
+        snapshot_benchmarks(root, os.path.join(root, "tree.snapshot"))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
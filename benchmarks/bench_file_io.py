@@ -0,0 +1,120 @@
+"""fileUtils: text-mode helpers vs. the binary / mmap helpers on large files.
+
+Synthetic log-like files are written to a temporary directory (or --dir) and
+removed afterwards.
+
+Usage: python benchmarks/bench_file_io.py [--sizes-mb 100 1024 10240] [--dir PATH]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from itertools import islice
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+import fileUtils  # noqa: E402
+
+LINE = b"2025-01-01T00:00:00 INFO worker-17 processed request id=%08d in 12ms\n"
+
+
+def make_file(path, size_mb):
+    block = b"".join(LINE % i for i in range(16_384))
+    target = size_mb * 2**20
+    with open(path, "wb") as file:
+        written = 0
+        while written < target:
+            file.write(block)
+            written += len(block)
+
+
+def timed(label, size, func):
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    print(
+        f"  {label:<34} {seconds:>8.2f}s {size / seconds / 2**20:>9.0f} MiB/s  -> {result}"
+    )
+
+
+def consume(iterable):
+    count = 0
+    for item in iterable:
+        count += len(item)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[100, 1024, 10240])
+    parser.add_argument(
+        "--dir", default=None, help="where to write the synthetic files"
+    )
+    parser.add_argument(
+        "--skip-slow", action="store_true", help="skip read_file/read_file_lines"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        for size_mb in args.sizes_mb:
+            path = os.path.join(tmp, f"synthetic_{size_mb}mb.log")
+            make_file(path, size_mb)
+            size = os.path.getsize(path)
+            print(f"{size / 2**20:,.0f} MiB file")
+            timed(
+                "count_lines_in_file (text)",
+                size,
+                lambda: fileUtils.count_lines_in_file(path),
+            )
+            timed(
+                "count_lines_fast (binary chunks)",
+                size,
+                lambda: fileUtils.count_lines_fast(path),
+            )
+            timed("count_lines_mmap", size, lambda: fileUtils.count_lines_mmap(path))
+            timed(
+                "lazy_read_file (text lines)",
+                size,
+                lambda: consume(fileUtils.lazy_read_file(path)),
+            )
+            timed(
+                "read_chunks (memoryview)",
+                size,
+                lambda: consume(fileUtils.read_chunks(path)),
+            )
+            lines = fileUtils.count_lines_fast(path)
+            timed(
+                "build_line_index", size, lambda: len(fileUtils.build_line_index(path))
+            )
+            middle = lines // 2
+            timed(
+                f"line {middle:,} via lazy_read_file",
+                size / 2,
+                lambda: next(
+                    islice(fileUtils.lazy_read_file(path), middle, None)
+                ).strip(),
+            )
+            timed(
+                f"line {middle:,} via get_line",
+                size / 2,
+                lambda: fileUtils.get_line(path, middle).strip(),
+            )
+            os.remove(path + fileUtils.LINE_INDEX_SUFFIX)
+            if not args.skip_slow and size_mb <= 1024:
+                # both hold the whole file in memory, skipped for the largest sizes
+                timed("read_file", size, lambda: len(fileUtils.read_file(path)))
+                timed(
+                    "read_file_lines",
+                    size,
+                    lambda: len(fileUtils.read_file_lines(path)),
+                )
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""glossaryStore: bulk import, lazy index load, lookups, upserts and compaction.
+
+A synthetic "ACR - definition" glossary of --entries lines is written to a
+temporary directory (or --dir) and removed afterwards.
+
+Usage: python benchmarks/bench_glossary.py [--entries 10000000] [--lookups 1000000]
+                                           [--dir PATH]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from glossaryStore import GlossaryStore  # noqa: E402
+
+
+def acronym(i):
+    return f"A{i:08X}"
+
+
+def make_glossary(path, entries):
+    with open(path, "w", buffering=1 << 20) as file:
+        for start in range(0, entries, 100_000):
+            file.write(
+                "".join(
+                    f"{acronym(i)} - Definition number {i} of the synthetic glossary\n"
+                    for i in range(start, min(entries, start + 100_000))
+                )
+            )
+
+
+def timed(label, count, func):
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(
+        f"  {label:<30} {seconds:>8.2f}s {count / seconds:>12,.0f} ops/s "
+        f"{seconds / count * 1e6:>8.2f} us/op"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=10_000_000)
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    parser.add_argument("--dir", default=None)
+    args = parser.parse_args()
+    rng = random.Random(1)
+
+    root = tempfile.mkdtemp(prefix="bench_glossary_", dir=args.dir)
+    try:
+        text, log = os.path.join(root, "input.txt"), os.path.join(root, "glossary.log")
+        make_glossary(text, args.entries)
+        store = GlossaryStore(log)
+        timed("import_file", args.entries, lambda: store.import_file(text))
+        store.close()
+        print(f"  log size {os.path.getsize(log) / 2**20:,.0f} MiB")
+
+        store = GlossaryStore(log)
+        timed(
+            "lazy index load (first get)", args.entries, lambda: store.get(acronym(0))
+        )
+        keys = [acronym(rng.randrange(args.entries)) for _ in range(args.lookups)]
+        timed("random get", args.lookups, lambda: list(map(store.get, keys)))
+        updates = args.lookups
+
+        def upserts():
+            for key in keys[:updates]:
+                store.upsert(key, "An updated definition")
+
+        timed("random upsert", updates, upserts)
+        timed(
+            "random delete",
+            updates // 10,
+            lambda: list(map(store.delete, keys[: updates // 10])),
+        )
+        store.flush()
+        print(
+            f"  log {os.path.getsize(log) / 2**20:,.0f} MiB, {store.garbage:,} garbage records"
+        )
+        timed("compact", len(store), store.compact)
+        print(f"  log after compaction {os.path.getsize(log) / 2**20:,.0f} MiB")
+        store.close()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""glossarySearch: index build time and query latency on a large glossary.
+
+A synthetic glossary of --entries unique acronyms (3-7 letters) with 3-6
+word definitions is built in memory. Queries are real acronyms with one or
+two typos, prefixes, and definition words.
+
+Usage: python benchmarks/bench_glossary_search.py [--entries 1000000] [--queries 20000]
+"""
+
+import argparse
+import random
+import resource
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from glossarySearch import GlossarySearch  # noqa: E402
+
+
+def make_entries(count, rng):
+    vocabulary = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+        for _ in range(20_000)
+    ]
+    acronyms = set()
+    while len(acronyms) < count:
+        acronyms.add("".join(rng.choices(string.ascii_uppercase, k=rng.randint(3, 7))))
+    return [
+        (acronym, " ".join(rng.choices(vocabulary, k=rng.randint(3, 6))).capitalize())
+        for acronym in acronyms
+    ]
+
+
+def typo(word, rng, edits):
+    for _ in range(edits):
+        i = rng.randrange(len(word))
+        op = rng.randrange(3)
+        letter = rng.choice(string.ascii_uppercase)
+        if op == 0:
+            word = word[:i] + letter + word[i + 1 :]
+        elif op == 1 and len(word) > 3:
+            word = word[:i] + word[i + 1 :]
+        else:
+            word = word[:i] + letter + word[i:]
+    return word
+
+
+def latency(label, func, queries):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    p50, p99 = timings[len(timings) // 2], timings[int(len(timings) * 0.99)]
+    print(
+        f"  {label:<30} p50 {p50 * 1e6:>8.1f} us   p99 {p99 * 1e6:>8.1f} us   "
+        f"mean {sum(timings) / len(timings) * 1e6:>8.1f} us"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=20_000)
+    args = parser.parse_args()
+    rng = random.Random(3)
+
+    entries = make_entries(args.entries, rng)
+    start = time.perf_counter()
+    search = GlossarySearch(entries)
+    print(
+        f"{len(entries):,} entries indexed in {time.perf_counter() - start:.1f}s, "
+        f"{sum(map(len, search.keys._variants)):,} acronym variants, "
+        f"{len(search.words.terms):,} distinct words, "
+        f"peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024:,} MiB"
+    )
+
+    sample = [acronym for acronym, _ in rng.sample(entries, args.queries)]
+    words = [
+        rng.choice(d.split()).lower() for _, d in rng.sample(entries, args.queries)
+    ]
+    latency("prefix (2 letters)", lambda q: search.prefix(q[:2]), sample)
+    latency("fuzzy, 1 typo", search.fuzzy, [typo(a, rng, 1) for a in sample])
+    latency(
+        "fuzzy, 2 typos (6+ letters)",
+        search.fuzzy,
+        [typo(a, rng, 2) for a in sample if len(a) >= 6],
+    )
+    latency("suggest, exact", search.suggest, sample)
+    latency("suggest, 1 typo", search.suggest, [typo(a, rng, 1) for a in sample])
+    latency(
+        "suggest, definition word",
+        search.suggest,
+        [typo(w, rng, 1).lower() for w in words],
+    )
+
+
+if __name__ == "__main__":
+    main()
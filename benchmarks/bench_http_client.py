@@ -0,0 +1,122 @@
+"""httpClient: requests.get per call vs. the pooled, caching client.
+
+Everything runs against a local stand-in server (http.server on 127.0.0.1)
+that answers a small JSON document, optionally after --latency ms to
+imitate a remote API, with an ETag so revalidation can be measured.
+
+Usage: python benchmarks/bench_http_client.py [--requests 2000]
+                                              [--endpoints 50] [--latency 50]
+                                              [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from httpClient import AsyncHttpClient, HttpClient  # noqa: E402
+
+BODY = json.dumps(
+    {
+        "number": 7,
+        "people": [{"name": f"Astronaut {i}", "craft": "ISS"} for i in range(7)],
+    }
+).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+    latency = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/slow"):
+            time.sleep(Handler.latency)
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+def rate(label, count, fetch):
+    start = time.perf_counter()
+    for _ in range(count):
+        fetch()
+    seconds = time.perf_counter() - start
+    print(
+        f"{label:<34} {count / seconds:>10,.0f} req/s  "
+        f"{seconds / count * 1e6:>9,.1f} us/req"
+    )
+
+
+def timed(label, fetch):
+    start = time.perf_counter()
+    fetch()
+    print(f"{label:<34} {time.perf_counter() - start:>10.3f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--endpoints", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=50.0, help="ms, /slow only")
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    Handler.latency = args.latency / 1000
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{httpd.server_port}"
+    url = base + "/astros.json"
+    n = args.requests
+
+    print(f"{n:,} requests of {len(BODY)} bytes each")
+    rate("requests.get (new connection)", n, lambda: requests.get(url, timeout=10))
+    with HttpClient(cache_ttl=0) as uncached:
+        rate("HttpClient, pooled, no cache", n, lambda: uncached.get(url))
+    with HttpClient(cache_ttl=1e-9) as revalidating:
+        revalidating.get(url)
+        rate("HttpClient, 304 revalidation", n, lambda: revalidating.get(url))
+    with HttpClient() as cached:
+        cached.get(url)
+        rate("HttpClient, cache hit", n * 100, lambda: cached.get(url))
+
+    urls = [f"{base}/slow/{i}" for i in range(args.endpoints)]
+    print(f"\n{args.endpoints} endpoints answering after {args.latency:g} ms")
+    with HttpClient(cache_ttl=0) as client:
+        timed("sequential", lambda: [client.get(u) for u in urls])
+        timed(
+            f"get_many, {args.concurrency} threads",
+            lambda: client.get_many(urls, args.concurrency),
+        )
+        fetcher = AsyncHttpClient(client, args.concurrency)
+        timed(
+            f"asyncio, {args.concurrency} in flight",
+            lambda: asyncio.run(fetcher.get_many(urls)),
+        )
+    httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
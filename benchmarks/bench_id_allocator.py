@@ -0,0 +1,156 @@
+"""IdAllocator under contention: 1 to 64 threads, then several processes.
+
+Threads (one process, --ids IDs in total, split evenly):
+
+* class attr   the old ``cls.sequence_number += 1`` (not thread-safe: lost
+               updates show up as duplicates)
+* locked       the same counter behind a threading.Lock
+* blocks       IdAllocator, per-thread blocks of --block-size IDs
+
+Processes (each draws --ids / processes IDs from its own IdAllocator):
+
+* shared       blocks from a multiprocessing.Value counter
+* file         blocks from a FileBlockSource (flock'ed counter file)
+* file/1       the file source with blocks of one ID (every ID takes the lock)
+
+Every run checks that no ID was handed out twice.
+
+Usage: python benchmarks/bench_id_allocator.py [--ids 1000000] [--block-size 1024]
+                                               [--threads 1 2 4 8 16 32 64]
+                                               [--processes 1 2 4 8]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from idAllocator import FileBlockSource, IdAllocator, SharedBlockSource  # noqa: E402
+
+
+class ClassCounter:
+    sequence_number = 0
+
+    @classmethod
+    def increment_sequence(cls):
+        cls.sequence_number += 1
+        return cls.sequence_number
+
+
+class LockedCounter:
+    def __init__(self):
+        self.value = 0
+        self.lock = threading.Lock()
+
+    def next_id(self):
+        with self.lock:
+            self.value += 1
+            return self.value
+
+
+def run_threads(next_id, threads, per_thread):
+    results = [None] * threads
+    barrier = threading.Barrier(threads + 1)
+
+    def work(index):
+        barrier.wait()
+        results[index] = [next_id() for _ in range(per_thread)]
+
+    workers = [threading.Thread(target=work, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start, [n for ids in results for n in ids]
+
+
+def process_worker(allocator, count, queue):
+    start = time.perf_counter()
+    ids = [allocator.next_id() for _ in range(count)]
+    queue.put((time.perf_counter() - start, ids))
+
+
+def run_processes(context, allocator, processes, per_process):
+    queue = context.Queue()
+    workers = [
+        context.Process(target=process_worker, args=(allocator, per_process, queue))
+        for _ in range(processes)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    results = [queue.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    wall = time.perf_counter() - start
+    busiest = max(seconds for seconds, _ in results)  # without process start-up
+    return wall, busiest, [n for _, ids in results for n in ids]
+
+
+def report(kind, workers, label, seconds, ids, extra=""):
+    duplicates = len(ids) - len(set(ids))
+    rate = len(ids) / seconds / 1e6
+    print(
+        f"{kind:<9} {workers:>3} {label:<11} {seconds:>8.3f}s {rate:>8.2f}M/s"
+        f" {duplicates:>10,} {extra}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ids", type=int, default=1_000_000)
+    parser.add_argument("--block-size", type=int, default=1024)
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64]
+    )
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+    print(f"{os.cpu_count()} CPUs, {args.ids:,} IDs per run")
+    print(
+        f"{'':<9} {'n':>3} {'allocator':<11} {'time':>9} {'IDs/s':>10} {'duplicates':>10}"
+    )
+
+    for threads in args.threads:
+        per_thread = args.ids // threads
+        ClassCounter.sequence_number = 0
+        cases = [
+            ("class attr", ClassCounter.increment_sequence),
+            ("locked", LockedCounter().next_id),
+            ("blocks", IdAllocator(block_size=args.block_size).next_id),
+        ]
+        for label, next_id in cases:
+            seconds, ids = run_threads(next_id, threads, per_thread)
+            report("threads", threads, label, seconds, ids)
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with tempfile.TemporaryDirectory() as directory:
+        for processes in args.processes:
+            per_process = args.ids // processes
+            path = Path(directory) / f"ids-{processes}"
+            cases = [
+                ("shared", SharedBlockSource(context=context), args.block_size),
+                ("file", FileBlockSource(path), args.block_size),
+                ("file/1", FileBlockSource(f"{path}-1"), 1),
+            ]
+            for label, source, block_size in cases:
+                count = per_process if block_size > 1 else per_process // 100
+                allocator = IdAllocator(source, block_size)
+                wall, busiest, ids = run_processes(context, allocator, processes, count)
+                report(
+                    "processes", processes, label, busiest, ids, f"(wall {wall:.3f}s)"
+                )
+
+
+if __name__ == "__main__":
+    main()
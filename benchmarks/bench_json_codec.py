@@ -0,0 +1,132 @@
+"""jsonCodec: throughput and peak memory per backend, whole-document vs. streaming.
+
+A {"number": N, "people": [...]} document of about --mb MB is written to a
+temporary directory, plus the same records as JSON lines. Every measurement
+runs in a fresh child process, so its peak RSS (ru_maxrss) is its own
+(the documents are written by a child as well: a child inherits the
+ru_maxrss of the process that started it):
+
+* dumps      encode the whole document (memory: on top of the objects)
+* loads      read and decode the whole document
+* iter_array decode "people" item by item (stdlib scanner for every backend)
+* iter_lines decode the JSON lines file line by line
+
+Usage: python benchmarks/bench_json_codec.py [--mb 200]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+import jsonCodec  # noqa: E402
+
+OPERATIONS = ("dumps", "loads", "iter_array", "iter_lines")
+
+
+def person(i):
+    return {
+        "id": i,
+        "name": f"Astronaut {i}",
+        "craft": "ISS" if i % 3 else "Tiangong",
+        "days_in_space": i % 400 + 0.5,
+        "missions": [f"M-{i % 97}", f"M-{i % 89}"],
+        "active": bool(i % 2),
+    }
+
+
+def write_documents(directory, mb):
+    count = mb * 1_000_000 // len(json.dumps(person(10**6)))
+    people = [person(i) for i in range(count)]
+    codec = jsonCodec.get_backend()
+    document = os.path.join(directory, "people.json")
+    with open(document, "wb") as file:
+        file.write(codec.dumps({"number": count, "people": people}))
+    lines = os.path.join(directory, "people.jsonl")
+    with open(lines, "wb") as file:
+        jsonCodec.dump_lines(people, file, codec)
+    return count, document, lines
+
+
+def rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(backend, operation, document, lines):
+    """Runs one operation and prints seconds and MiB of peak RSS it added."""
+    codec = jsonCodec.get_backend(backend)
+    if operation == "dumps":
+        with open(lines, "rb") as file:
+            count = sum(1 for _ in file)
+        # built directly: decoding the file would leave a higher peak behind
+        data = {"number": count, "people": [person(i) for i in range(count)]}
+        before = rss_mib()
+        start = time.perf_counter()
+        codec.dumps(data)
+    else:
+        before = rss_mib()
+        start = time.perf_counter()
+        if operation == "loads":
+            with open(document, "rb") as file:
+                count = len(codec.loads(file.read())["people"])
+        elif operation == "iter_array":
+            with open(document, "rb") as file:
+                count = sum(1 for _ in jsonCodec.iter_array(file, "people"))
+        else:
+            with open(lines, "rb") as file:
+                count = sum(1 for _ in jsonCodec.iter_lines(file, codec))
+        assert count > 0
+    print(json.dumps([time.perf_counter() - start, rss_mib() - before]))
+
+
+def run_child(*arguments):
+    return subprocess.run(
+        [sys.executable, __file__, *arguments],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=int, default=200)
+    parser.add_argument("--child", nargs=4, help=argparse.SUPPRESS)
+    parser.add_argument("--write", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(*args.child)
+    if args.write:
+        return print(json.dumps(write_documents(args.write, args.mb)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        count, document, lines = json.loads(
+            run_child("--write", directory, "--mb", str(args.mb))
+        )
+        size = os.path.getsize(document) / 2**20
+        print(f"{count:,} people, {size:,.0f} MiB document")
+        print(f"{'backend':<8} {'operation':<11} {'MiB/s':>8} {'peak MiB':>9}")
+        for backend in jsonCodec.available_backends():
+            for operation in OPERATIONS:
+                if operation == "iter_array" and backend != "json":
+                    continue  # always the stdlib scanner
+                seconds, peak = json.loads(
+                    run_child("--child", backend, operation, document, lines)
+                )
+                print(
+                    f"{backend:<8} {operation:<11} {size / seconds:>8,.0f} "
+                    f"{peak:>9,.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compares the object loop with the columnar PayrollTable.
+
+Usage: python benchmarks/bench_payroll.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from company import Company  # noqa: E402
+from employee import CommissionEmployee, HourlyEmployee, SalaryEmployee  # noqa: E402
+
+
+def build_company(size, seed=0):
+    rng = random.Random(seed)
+    company = Company()
+    for i in range(size):
+        kind = i % 3
+        if kind == 0:
+            emp = SalaryEmployee("John", "Doe", rng.randint(20000, 200000))
+        elif kind == 1:
+            emp = HourlyEmployee(
+                "Jane", "Smith", rng.uniform(10, 80), rng.randint(1, 60)
+            )
+        else:
+            emp = CommissionEmployee(
+                "Alice", "Johnson", 50000, 0.10, rng.uniform(0, 1e5)
+            )
+        company.add_employee(emp)
+    return company
+
+
+def best_of(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'employees':>10} {'object loop':>12} {'columnar':>10} {'speedup':>8}")
+    for size in args.sizes:
+        company = build_company(size)
+        loop = best_of(lambda: [emp.calculate_paycheck() for emp in company.employees])
+        columnar = best_of(company.paychecks)
+        assert company.paychecks() == [
+            emp.calculate_paycheck() for emp in company.employees
+        ]
+        print(f"{size:>10} {loop:>11.4f}s {columnar:>9.4f}s {loop / columnar:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Scaling of the sharded multi-process payroll from 1 to N workers.
+
+Usage: python benchmarks/bench_payroll_parallel.py [--size 1000000] [--max-workers N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from bench_payroll import build_company  # noqa: E402
+from payrollParallel import parallel_paychecks  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=250_000)
+    args = parser.parse_args()
+
+    company = build_company(args.size)
+    start = time.perf_counter()
+    expected = company.paychecks()
+    serial = time.perf_counter() - start
+    print(f"{args.size:,} employees, serial batched pass: {serial:.3f}s")
+    print(f"{'workers':>7} {'seconds':>8} {'vs serial':>9}")
+    for workers in range(1, args.max_workers + 1):
+        start = time.perf_counter()
+        # workers=1 still goes through the pool so the sharding overhead is visible
+        result = parallel_paychecks(company.payroll, workers, args.chunk_size)
+        seconds = time.perf_counter() - start
+        assert result == expected
+        print(f"{workers:>7} {seconds:>8.3f} {serial / seconds:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Memory and speed of contacts as a list of dicts vs. a RecordStore.
+
+Contacts have a unique name and phone, an int age, a float balance and one
+of a few cities. Memory is what tracemalloc still sees allocated once the
+collection is built, values included (the strings are the same size in
+both layouts, so the difference is the per-record overhead). The store is
+built from a generator, so no list of dicts ever exists on its side.
+
+Usage: python benchmarks/bench_record_store.py [--size 1000000]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from recordStore import RecordStore  # noqa: E402
+
+CITIES = ["New York", "Los Angeles", "London", "Lima", "Oslo", "Pune", "Tokyo"]
+
+
+def contacts(size):
+    for i in range(size):
+        yield {
+            "name": f"Student {i}",
+            "phone": f"555-{i:07d}",
+            "age": 18 + i % 60,
+            "balance": i * 0.25,
+            "city": CITIES[i % len(CITIES)],
+        }
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def timed(label, size, function):
+    # like timeit: otherwise the views' allocations trigger collections that
+    # walk the million dicts of the other layout
+    gc.disable()
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    gc.enable()
+    print(f"  {label:<28} {seconds * 1e3:>9.1f} ms {seconds / size * 1e9:>8.1f} ns/row")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+    size = args.size
+
+    print(f"{size:,} contacts")
+    print(f"{'layout':<28} {'retained':>12} {'per contact':>12}")
+    rows, rows_bytes = measure(lambda: list(contacts(size)))
+    store, store_bytes = measure(lambda: RecordStore.from_records(contacts(size)))
+    for label, retained in [
+        ("list of dicts", rows_bytes),
+        ("RecordStore", store_bytes),
+    ]:
+        print(f"{label:<28} {retained / 2**20:>9.1f} MiB {retained / size:>9.1f} B")
+    print(f"saving: {1 - store_bytes / rows_bytes:.0%}")
+
+    _, index_bytes = measure(lambda: store.create_index("phone", unique=True))
+    print(f"phone index: {index_bytes / 2**20:.1f} MiB")
+
+    print("full pass over name, age:")
+    timed("list of dicts", size, lambda: [(r["name"], r["age"]) for r in rows])
+    timed("RecordStore.values", size, lambda: list(store.values("name", "age")))
+    timed("RecordStore views", size, lambda: [(v["name"], v["age"]) for v in store])
+
+    phones = [f"555-{i * 7919 % size:07d}" for i in range(args.lookups)]
+    print(f"{args.lookups:,} lookups by phone:")
+    by_phone = {}
+    timed(
+        "dict built over the list",
+        size,
+        lambda: by_phone.update((r["phone"], r) for r in rows),
+    )
+    timed("dict lookups", args.lookups, lambda: [by_phone[p] for p in phones])
+    timed(
+        "RecordStore.find_one",
+        args.lookups,
+        lambda: [store.find_one("phone", p) for p in phones],
+    )
+
+
+if __name__ == "__main__":
+    main()
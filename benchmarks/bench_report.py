@@ -0,0 +1,66 @@
+"""Old joined-string report vs. the streaming report writer.
+
+Usage: python benchmarks/bench_report.py [--size 1000000] [--chunk-size 10000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from bench_payroll import build_company  # noqa: E402
+
+
+def joined(company, sink):
+    sink.write(
+        "\n".join(
+            [
+                f"{emp.first_name} {emp.last_name}: ${emp.calculate_paycheck():,.2f}"
+                for emp in company.employees
+            ]
+        )
+        + "\n"
+    )
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    company = build_company(args.size)
+    with open(os.devnull, "w") as sink:
+        cases = [("joined string", lambda: joined(company, sink))]
+        for fmt in ("text", "csv", "jsonl"):
+            cases.append(
+                (
+                    f"streaming {fmt}",
+                    lambda fmt=fmt: company.write_report(sink, fmt, args.chunk_size),
+                )
+            )
+        print(f"{'report':<16} {'rows/s':>12} {'peak memory':>12}")
+        for label, func in cases:
+            seconds, peak = measure(func)
+            print(f"{label:<16} {args.size / seconds:>12,.0f} {peak / 2**20:>8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""RobotFleet: ticks per second of a batched walk vs. one object per robot.
+
+A tick moves every robot: x by one shared step, y by a per-robot step.
+
+* objects      robots with a [x, y] list each, moved in a Python loop
+                (the old Robot.walk without its print)
+* fleet/pure   RobotFleet.walk, map() over array columns
+* fleet/numpy  RobotFleet.walk, in-place numpy add on the same columns
+* fleet/print  fleet/numpy with a PrintSink writing to /dev/null
+
+Usage: python benchmarks/bench_robot_fleet.py [--sizes 1000 100000 1000000]
+                                              [--seconds 1.0]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+import robotFleet  # noqa: E402
+from robotFleet import PrintSink, RobotFleet  # noqa: E402
+
+
+class PlainRobot:
+    __slots__ = ("name", "position")
+
+    def __init__(self, name):
+        self.name = name
+        self.position = [0, 0]
+
+
+def objects_tick(robots, dx, dys):
+    for robot, dy in zip(robots, dys):
+        position = robot.position
+        position[0] += dx
+        position[1] += dy
+
+
+def ticks_per_second(tick, budget):
+    count = 0
+    start = time.perf_counter()
+    while True:
+        tick()
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= budget:
+            return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--seconds", type=float, default=1.0, help="per measurement")
+    args = parser.parse_args()
+    numpy = robotFleet._np
+
+    print(f"{'robots':>10} {'layout':<12} {'ticks/s':>10} {'robot moves/s':>15}")
+    for size in args.sizes:
+        rng = random.Random(size)
+        dys = [rng.randrange(-3, 4) for _ in range(size)]
+        names = [f"Robot {i}" for i in range(size)]
+
+        robots = [PlainRobot(name) for name in names]
+        fleet = RobotFleet()
+        fleet.spawn(names)
+        cases = [("objects", lambda: objects_tick(robots, 1, dys))]
+
+        def pure_tick():
+            robotFleet._np = None
+            try:
+                fleet.walk(1, dys)
+            finally:
+                robotFleet._np = numpy
+
+        cases.append(("fleet/pure", pure_tick))
+        if numpy is not None:
+            dys_array = numpy.asarray(dys)
+            cases.append(("fleet/numpy", lambda: fleet.walk(1, dys_array)))
+            devnull = open(os.devnull, "w")
+            printing = RobotFleet(sink=PrintSink(devnull))
+            printing.spawn(names)
+            cases.append(("fleet/print", lambda: printing.walk(1, dys_array)))
+
+        for label, tick in cases:
+            rate = ticks_per_second(tick, args.seconds)
+            print(f"{size:>10,} {label:<12} {rate:>10,.1f} {rate * size:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
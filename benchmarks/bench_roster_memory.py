@@ -0,0 +1,69 @@
+"""Memory used by a roster of slotted Employee objects vs. an EmployeeTable.
+
+Measured with tracemalloc as the memory still allocated once the company is
+built (the roster itself, names included).
+
+Usage: python benchmarks/bench_roster_memory.py [--size 1000000]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+from company import Company  # noqa: E402
+from employee import CommissionEmployee, HourlyEmployee, SalaryEmployee  # noqa: E402
+
+FIRST_NAMES = [f"First{i}" for i in range(1000)]
+LAST_NAMES = [f"Last{i}" for i in range(1000)]
+
+
+def employees(size):
+    for i in range(size):
+        first, last = FIRST_NAMES[i % 1000], LAST_NAMES[i // 1000 % 1000]
+        kind = i % 3
+        if kind == 0:
+            yield SalaryEmployee(first, last, 40000.0 + i)
+        elif kind == 1:
+            yield HourlyEmployee(first, last, 25.0, 40.0)
+        else:
+            yield CommissionEmployee(first, last, 50000.0, 0.1, float(i))
+
+
+def measure(size, compact):
+    gc.collect()
+    tracemalloc.start()
+    company = Company(compact=compact)
+    for emp in employees(size):
+        company.add_employee(emp)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del company
+    return current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{args.size:,} employees")
+    print(f"{'layout':<32} {'retained':>12} {'per employee':>13} {'peak':>12}")
+    for label, compact in [
+        ("list of objects + PayrollTable", False),
+        ("EmployeeTable (compact=True)", True),
+    ]:
+        current, peak = measure(args.size, compact)
+        print(
+            f"{label:<32} {current / 2**20:>9.1f} MiB {current / args.size:>10.1f} B"
+            f" {peak / 2**20:>9.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
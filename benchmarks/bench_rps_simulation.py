@@ -0,0 +1,95 @@
+"""Rock-paper-scissors: rounds per second of the batched simulation.
+
+* per round     random.choice for both players and the chained comparisons
+                of the old rock_paper_scissors, in a Python loop
+* batch/pure    rpsSimulation.simulate, bytes.count() tallies
+* batch/numpy   rpsSimulation.simulate, numpy bincount tallies
+* pool/N        batch/numpy over N worker processes (same tally as serial)
+
+Usage: python benchmarks/bench_rps_simulation.py [--rounds 10000000] [--max-workers N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+import rpsSimulation  # noqa: E402
+from rpsSimulation import RandomMoves, simulate  # noqa: E402
+
+
+def per_round(rounds, seed):
+    rng = random.Random(seed)
+    wins = ties = losses = 0
+    moves = ["rock", "paper", "scissors"]
+    for _ in range(rounds):
+        mine, theirs = rng.choice(moves), rng.choice(moves)
+        if mine == theirs:
+            ties += 1
+        elif (
+            (mine == "rock" and theirs == "scissors")
+            or (mine == "scissors" and theirs == "paper")
+            or (mine == "paper" and theirs == "rock")
+        ):
+            wins += 1
+        else:
+            losses += 1
+    return wins, ties, losses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    numpy = rpsSimulation._np
+    players = (RandomMoves(), RandomMoves())
+
+    def pure():
+        rpsSimulation._np = None
+        try:
+            return simulate(*players, args.rounds, seed=1)
+        finally:
+            rpsSimulation._np = numpy
+
+    # the per-round loop is slow: time a tenth of the rounds and scale up
+    cases = [("per round", lambda: per_round(args.rounds // 10, 1), 10)]
+    cases.append(("batch/pure", pure, 1))
+    if numpy is not None:
+        cases.append(
+            ("batch/numpy", lambda: simulate(*players, args.rounds, seed=1), 1)
+        )
+    for workers in range(2, args.max_workers + 1):
+        cases.append(
+            (
+                f"pool/{workers}",
+                lambda workers=workers: simulate(
+                    *players, args.rounds, seed=1, workers=workers
+                ),
+                1,
+            )
+        )
+
+    print(f"{args.rounds:,} rounds, {os.cpu_count()} CPUs")
+    print(f"{'method':<12} {'seconds':>8} {'M rounds/s':>11}  tally")
+    expected = None
+    for label, run, scale in cases:
+        start = time.perf_counter()
+        tally = run()
+        seconds = (time.perf_counter() - start) * scale
+        if scale == 1:
+            expected = expected or tally
+            assert tally == expected, "the same seed must give the same tally"
+        print(
+            f"{label:<12} {seconds:>8.3f} {args.rounds / seconds / 1e6:>11.2f}  {tally}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""SpatialGrid: neighbour queries and per-tick upkeep vs. brute-force scans.
+
+Robots are spread uniformly over a square with about one robot per 10x10
+area; the grid uses cells of that size. Each tick moves every robot by a
+small random step (|step| <= --step); the share of robots that cross into
+another cell per tick, which is what the grid pays for, is printed too.
+
+* build         SpatialGrid(fleet, cell_size) from scratch
+* tick/walk     fleet.walk alone (no index)
+* tick/grid     fleet.walk with the grid following it (incremental re-filing)
+* within        rows within radius 25 of a random point, grid vs. full scan
+* nearest       the 8 nearest robots of a random point, grid vs. full scan
+
+Usage: python benchmarks/bench_spatial_grid.py [--sizes 1000 100000 1000000]
+                                               [--queries 200] [--step 3]
+"""
+
+import argparse
+import gc
+import heapq
+import math
+import random
+import sys
+import time
+from operator import ne
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental")
+)
+
+import robotFleet  # noqa: E402
+from robotFleet import RobotFleet  # noqa: E402
+from spatialGrid import SpatialGrid  # noqa: E402
+
+CELL = 10
+RADIUS = 25
+K = 8
+
+
+def scan_within(fleet, x, y, radius):
+    limit = radius * radius
+    return [
+        row
+        for row, (px, py) in enumerate(fleet.positions())
+        if (px - x) ** 2 + (py - y) ** 2 <= limit
+    ]
+
+
+def scan_nearest(fleet, x, y, k):
+    found = heapq.nsmallest(
+        k,
+        (
+            ((px - x) ** 2 + (py - y) ** 2, row)
+            for row, (px, py) in enumerate(fleet.positions())
+        ),
+    )
+    return [(math.sqrt(d2), row) for d2, row in found]
+
+
+def timed(function, repeat=1):
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function()
+        return (time.perf_counter() - start) / repeat
+    finally:
+        gc.enable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--step", type=int, default=3, help="largest step per axis")
+    args = parser.parse_args()
+    print(f"numpy: {'yes' if robotFleet._np is not None else 'no'}")
+
+    print(f"{'robots':>10} {'operation':<10} {'grid':>12} {'scan':>12} {'speedup':>8}")
+    for size in args.sizes:
+        rng = random.Random(size)
+        side = int(math.sqrt(size) * CELL)
+        fleet = RobotFleet()
+        fleet.spawn(f"Robot {i}" for i in range(size))
+        fleet.walk(
+            [rng.randrange(side) for _ in range(size)],
+            [rng.randrange(side) for _ in range(size)],
+        )
+        steps = [
+            [rng.randrange(-args.step, args.step + 1) for _ in range(size)]
+            for _ in range(2)
+        ]
+        if robotFleet._np is not None:
+            steps = [robotFleet._np.asarray(step) for step in steps]
+        points = [
+            (rng.uniform(0, side), rng.uniform(0, side)) for _ in range(args.queries)
+        ]
+        queries = args.queries
+
+        def row(label, grid_seconds, scan_seconds=None):
+            scan = "" if scan_seconds is None else f"{scan_seconds * 1e3:>10.3f}ms"
+            ratio = (
+                "" if scan_seconds is None else f"{scan_seconds / grid_seconds:>7.0f}x"
+            )
+            print(
+                f"{size:>10,} {label:<10} {grid_seconds * 1e3:>10.3f}ms {scan:>12} {ratio:>8}"
+            )
+
+        build = timed(lambda: SpatialGrid(fleet, CELL).close())
+        row("build", build)
+        walk = timed(lambda: fleet.walk(*steps), 5)
+        row("tick/walk", walk)
+        grid = SpatialGrid(fleet, CELL)
+        tick = timed(lambda: fleet.walk(*steps), 5)
+        row("tick/grid", tick, walk + build)  # vs. walk + rebuild every tick
+        before = grid.cell_of.tolist()
+        fleet.walk(*steps)
+        crossed = sum(map(ne, before, grid.cell_of)) / size
+        print(f"{'':>10} {'':<10} ({crossed:.0%} of robots changed cell per tick)")
+
+        for label, query, scan, argument in (
+            ("within", grid.within, scan_within, RADIUS),
+            ("nearest", grid.nearest, scan_nearest, K),
+        ):
+            chosen = points[:queries]
+            indexed = timed(lambda: [query(x, y, argument) for x, y in chosen])
+            chosen = chosen[: max(queries // 20, 1)]
+            brute = timed(lambda: [scan(fleet, x, y, argument) for x, y in chosen])
+            row(label, indexed / queries, brute / len(chosen))
+        grid.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Import-time budget: fails when the cold import of a package is too slow.
+
+Imports ``<module>`` under ``python -X importtime`` in fresh interpreters,
+takes the run with the median total time of ``<module>`` (its cumulative
+time, without interpreter start-up) and compares it with the budget. The
+modules of its import tree that cost the most (own time, without their
+own imports) are listed, so a regression points at its cause.
+
+The defaults come from ``[tool.import-budget]`` in pyproject.toml
+(``module``, ``budget_ms``, ``runs``, ``top``); options override them.
+``--no-cache`` compiles every module from source, through an empty
+``PYTHONPYCACHEPREFIX``.
+
+Exit status: 0 within budget, 1 over budget, 2 if the import failed.
+
+Usage: python benchmarks/check_import_time.py [--module core_python]
+           [--budget-ms 15] [--runs 5] [--top 10] [--no-cache]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import tomllib
+from pathlib import Path
+from typing import List, NamedTuple
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULTS = {"module": "core_python", "budget_ms": 15.0, "runs": 5, "top": 10}
+
+# __import__ rather than an import statement, for package names like 2_fundamental;
+# not importlib.import_module, whose pure-Python import path -X importtime does not time
+IMPORT = "__import__({module!r})"
+
+# "import time:       465 |       1736 |   core_python._lazy"
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+class ImportTime(NamedTuple):
+    name: str
+    depth: int  # 0 for modules imported directly by the -c statement
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(text: str) -> List[ImportTime]:
+    """The entries of ``-X importtime`` output, in the order printed."""
+    entries = []
+    for match in _LINE.finditer(text):
+        self_us, cumulative_us, indent, name = match.groups()
+        entries.append(
+            ImportTime(name, (len(indent) - 1) // 2, int(self_us), int(cumulative_us))
+        )
+    return entries
+
+
+def import_tree(entries: List[ImportTime], module: str) -> List[ImportTime]:
+    """``module`` and everything imported under it.
+
+    A module is printed after its own imports, so the tree is the module's
+    line and the deeper lines right before it.
+    """
+    for position in range(len(entries) - 1, -1, -1):
+        if entries[position].name == module:
+            break
+    else:
+        raise LookupError(f"{module} does not appear in the import times")
+    root = entries[position]
+    start = position
+    while start > 0 and entries[start - 1].depth > root.depth:
+        start -= 1
+    return entries[start : position + 1]
+
+
+def measure(module: str, no_cache: bool = False) -> List[ImportTime]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(ROOT), env.get("PYTHONPATH")])
+    )
+    with tempfile.TemporaryDirectory() as cache:
+        if no_cache:
+            env["PYTHONPYCACHEPREFIX"] = cache
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", IMPORT.format(module=module)],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+    if result.returncode:
+        error = [
+            line
+            for line in result.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        raise RuntimeError(f"import {module} failed:\n" + "\n".join(error))
+    return import_tree(parse_importtime(result.stderr), module)
+
+
+def load_defaults(pyproject: Path = ROOT / "pyproject.toml") -> dict:
+    settings = dict(DEFAULTS)
+    if pyproject.exists():
+        with open(pyproject, "rb") as file:
+            settings.update(tomllib.load(file).get("tool", {}).get("import-budget", {}))
+    return settings
+
+
+def main(argv=None) -> int:
+    settings = load_defaults()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default=settings["module"])
+    parser.add_argument("--budget-ms", type=float, default=settings["budget_ms"])
+    parser.add_argument("--runs", type=int, default=settings["runs"])
+    parser.add_argument("--top", type=int, default=settings["top"])
+    parser.add_argument("--no-cache", action="store_true", help="ignore .pyc files")
+    args = parser.parse_args(argv)
+
+    try:
+        runs = [measure(args.module, args.no_cache) for _ in range(args.runs)]
+    except (RuntimeError, LookupError) as error:
+        print(error, file=sys.stderr)
+        return 2
+    totals = [tree[-1].cumulative_us for tree in runs]
+    median = statistics.median_low(totals)
+    tree = runs[totals.index(median)]
+    total_ms = median / 1000
+
+    verdict = "OK" if total_ms <= args.budget_ms else "OVER BUDGET"
+    print(
+        f"import {args.module}: {total_ms:.2f} ms (median of {args.runs},"
+        f" min {min(totals) / 1000:.2f}, max {max(totals) / 1000:.2f})"
+        f" budget {args.budget_ms:g} ms: {verdict}"
+    )
+    print(f"{len(tree)} modules; most expensive by own time:")
+    print(f"{'self ms':>8} {'cumul ms':>9}  module")
+    costliest = sorted(tree, key=lambda entry: entry.self_us, reverse=True)
+    for entry in costliest[: args.top]:
+        print(
+            f"{entry.self_us / 1000:>8.2f} {entry.cumulative_us / 1000:>9.2f}"
+            f"  {'  ' * (entry.depth - tree[-1].depth)}{entry.name}"
+        )
+    return 0 if total_ms <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from .._lazy import attach
+
 __version__ = "1.1.0"
 __author__ = "yingixong361"
 
-# Core data types
-from .dataTypes import (
-    decades
-)
+# Public names and the submodule that defines each one. Nothing is imported here:
+# the submodule is loaded the first time its name is used (PEP 562 __getattr__),
+# so importing the package never runs a sibling's import-time code.
+_EXPORTS = {
+    # Core data types
+    'decades': 'dataTypes',
+}
 
 
 # Explicit public API - CRITICAL for professional packages
@@ -14,14 +19,8 @@ __all__ = [
     # Metadata
     '__version__',
     '__author__',
-    
+
     'decades'
     ]
 
-# Package initialization
-def _initialize_package():
-    """Initialize package-wide configurations."""
-    import logging
-    logging.getLogger(__name__).addHandler(logging.NullHandler())
-
-_initialize_package()
\ No newline at end of file
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
@@ -0,0 +1,22 @@
+"""Optional dependencies, as the module or None when it is not installed.
+
+Modules with a numpy fast path keep a pure-Python fallback and choose
+between them with ``_np = _optional.numpy()`` and ``if _np is not None``.
+Tests and benchmarks set ``module._np = None`` to run the fallback.
+"""
+
+import importlib
+from types import ModuleType
+from typing import Optional
+
+
+def _load(name: str) -> Optional[ModuleType]:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def numpy() -> Optional[ModuleType]:
+    """The numpy module, or None."""
+    return _load("numpy")
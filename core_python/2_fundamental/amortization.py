@@ -0,0 +1,361 @@
+"""Non-interactive loan amortization, in closed form and in batch.
+
+Semantics follow ``listAndLoops.loan_payment_calculator``: every month
+interest is added, the payment is subtracted and a negative balance is
+clamped to zero, at which point the loan is paid off and the schedule stops.
+
+With r the monthly rate and g = 1 + r, the balance after k months (before
+any clamping) is
+
+    B(k) = B0 * g**k - P * (g**k - 1) / r        (B0 - k * P when r == 0)
+
+and the payoff month is the first k >= 1 with B(k) <= 0. Summing the monthly
+interest telescopes to B(k) - B0 + k * P, so total interest is closed form
+too. Closed-form balances agree with the month-by-month loop to rounding
+error. When a loan sits so close to the payoff boundary that rounding could
+move it by a month, ``summarize`` replays the loop for that loan, so payoff
+months always match the loop exactly. ``summarize_many`` applies the same
+closed form to whole columns of loans. ``batch_schedule`` runs the loop's
+own recurrence over many loans at once and matches it bit for bit.
+
+For a single loan, ``iter_schedule``/``AmortizationSchedule`` yield the months
+lazily. A slice that starts late jumps there with the closed form instead of
+replaying the earlier months, and iteration stops at payoff. Memory use does
+not depend on the schedule length.
+"""
+
+import math
+from array import array
+from itertools import count, islice, repeat
+from operator import add, mul, sub
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+
+import _optional
+
+_np = _optional.numpy()
+
+# relative distance from zero below which the closed form defers to the loop
+_BOUNDARY_TOLERANCE = 1e-9
+
+
+class LoanSummary(NamedTuple):
+    payoff_month: Optional[int]  # None when not paid off within the simulated months
+    months: int  # months actually simulated (stops at payoff)
+    total_interest: float
+    remaining_balance: float
+
+
+class ScheduleRow(NamedTuple):
+    month: int
+    interest: float
+    balance: float  # after the payment, clamped to zero
+
+
+def monthly_rate(annual_interest_rate: float) -> float:
+    """Annual percentage (5 for 5%) to the monthly rate, as the loop computes it."""
+    return annual_interest_rate / 100 / 12
+
+
+def _check(principal, payment):
+    if payment < 0:
+        raise ValueError("payment must not be negative")
+    if principal < 0:
+        raise ValueError("principal must not be negative")
+
+
+def balance_after(
+    principal: float, annual_interest_rate: float, payment: float, month: int
+) -> float:
+    """Unclamped balance after ``month`` months, in closed form."""
+    rate = monthly_rate(annual_interest_rate)
+    if rate == 0:
+        return principal - month * payment
+    try:
+        growth = (1 + rate) ** month
+    except OverflowError:
+        growth = math.inf
+    balance = principal * growth - payment * (growth - 1) / rate
+    if math.isnan(balance):
+        # both terms overflowed (inf - inf): the loop's balance reaches inf
+        # too, unless interest and payment cancel
+        if principal * rate == payment:
+            return principal
+        return math.copysign(math.inf, principal * rate - payment)
+    return balance
+
+
+def simulate(
+    principal: float, annual_interest_rate: float, payment: float, months: int
+) -> LoanSummary:
+    """The month-by-month loop of ``loan_payment_calculator``, without I/O."""
+    rate = monthly_rate(annual_interest_rate)
+    money_owed = principal
+    total_interest = 0.0
+    for month in range(1, months + 1):
+        interest = money_owed * rate
+        total_interest += interest
+        money_owed += interest
+        money_owed -= payment
+        if money_owed < 0:
+            money_owed = 0
+        if money_owed == 0:
+            return LoanSummary(month, month, total_interest, 0.0)
+    return LoanSummary(None, months, total_interest, money_owed)
+
+
+def _estimate_payoff(principal, rate, payment) -> Optional[float]:
+    """Real-valued month where B(k) reaches zero, None if it never does."""
+    if principal <= 0:
+        return 1.0  # first month already clamps to zero
+    if rate == 0:
+        return principal / payment if payment > 0 else None
+    if rate < 0:
+        return math.nan  # unusual enough to simply replay the loop
+    if payment <= principal * rate:
+        return None  # interest eats the whole payment, balance never falls
+    return math.log(payment / (payment - principal * rate)) / math.log1p(rate)
+
+
+def summarize(
+    principal: float, annual_interest_rate: float, payment: float, months: int
+) -> LoanSummary:
+    """Payoff month, total interest and remaining balance in closed form."""
+    _check(principal, payment)
+    rate = monthly_rate(annual_interest_rate)
+    estimate = _estimate_payoff(principal, rate, payment)
+    if principal == 0 or estimate is not None and math.isnan(estimate):
+        # nothing owed: the loop stops in month 1 with exactly zero interest,
+        # which the telescoped sum only gets to rounding error
+        return simulate(principal, annual_interest_rate, payment, months)
+
+    if estimate is None or estimate > months + 1:
+        payoff = None
+    else:
+        payoff = max(1, math.ceil(estimate))
+        # step to the exact first month with B(k) <= 0 (log rounding can be off by one)
+        while (
+            payoff > 1
+            and balance_after(principal, annual_interest_rate, payment, payoff - 1) <= 0
+        ):
+            payoff -= 1
+        while balance_after(principal, annual_interest_rate, payment, payoff) > 0:
+            payoff += 1
+        if payoff > months:
+            payoff = None
+
+    simulated = payoff or months
+    raw = balance_after(principal, annual_interest_rate, payment, simulated)
+    scale = max(principal, payment, 1.0) * _BOUNDARY_TOLERANCE
+    if abs(raw) < scale or (
+        payoff is not None
+        and payoff > 1
+        and abs(balance_after(principal, annual_interest_rate, payment, payoff - 1))
+        < scale
+    ):
+        # rounding could move the payoff month by one, the loop decides
+        return simulate(principal, annual_interest_rate, payment, months)
+
+    total_interest = raw - principal + simulated * payment
+    return LoanSummary(payoff, simulated, total_interest, 0.0 if payoff else raw)
+
+
+def summarize_many(
+    principals: Sequence[float],
+    annual_interest_rates: Sequence[float],
+    payments: Sequence[float],
+    months: int,
+) -> List[LoanSummary]:
+    """``summarize`` for many loan scenarios.
+
+    With numpy the closed form runs on whole columns of loans. Loans it does
+    not cover (no interest, no principal, balances that overflow, payoffs
+    within rounding of the boundary) go through ``summarize`` one at a time,
+    so the results are the same either way.
+    """
+    if _np is None:
+        return list(
+            map(summarize, principals, annual_interest_rates, payments, repeat(months))
+        )
+    principals = _np.asarray(principals, dtype=float)
+    annual_interest_rates = _np.asarray(annual_interest_rates, dtype=float)
+    payments = _np.asarray(payments, dtype=float)
+    if (payments < 0).any():
+        raise ValueError("payment must not be negative")
+    if (principals < 0).any():
+        raise ValueError("principal must not be negative")
+    rates = annual_interest_rates / 100 / 12
+
+    def balances_after(month):
+        growth = (1 + rates) ** month
+        balances = principals * growth - payments * (growth - 1) / rates
+        # inf - inf, as in balance_after (such loans then go through summarize)
+        drift = _np.copysign(_np.inf, principals * rates - payments)
+        return _np.where(_np.isnan(balances), drift, balances)
+
+    with _np.errstate(all="ignore"):
+        closed = (principals > 0) & (rates > 0)
+        estimate = _np.log(payments / (payments - principals * rates)) / _np.log1p(
+            rates
+        )
+        # NaN and inf estimates (never paid off) compare False and get 0
+        found = closed & (payments > principals * rates) & (estimate <= months + 1)
+        payoff = _np.where(found, _np.maximum(1, _np.ceil(estimate)), 0).astype(
+            _np.int64
+        )
+        # step to the exact first month with B(k) <= 0, as summarize does
+        while True:
+            down = found & (payoff > 1) & (balances_after(payoff - 1) <= 0)
+            if not down.any():
+                break
+            payoff[down] -= 1
+        while True:
+            up = found & (balances_after(payoff) > 0)
+            if not up.any():
+                break
+            payoff[up] += 1
+        found &= payoff <= months
+        payoff[~found] = 0
+
+        simulated = _np.where(found, payoff, months)
+        raw = balances_after(simulated)
+        scale = (
+            _np.maximum(_np.maximum(principals, payments), 1.0) * _BOUNDARY_TOLERANCE
+        )
+        near = (_np.abs(raw) < scale) | (
+            found & (payoff > 1) & (_np.abs(balances_after(payoff - 1)) < scale)
+        )
+        total_interest = raw - principals + simulated * payments
+
+    summaries = list(
+        map(
+            LoanSummary,
+            [month or None for month in payoff.tolist()],
+            simulated.tolist(),
+            total_interest.tolist(),
+            _np.where(found, 0.0, raw).tolist(),
+        )
+    )
+    for index in _np.flatnonzero(~closed | near | ~_np.isfinite(raw)).tolist():
+        summaries[index] = summarize(
+            principals[index].item(),
+            annual_interest_rates[index].item(),
+            payments[index].item(),
+            months,
+        )
+    return summaries
+
+
+def batch_schedule(
+    principals: Sequence[float],
+    annual_interest_rates: Sequence[float],
+    payments: Sequence[float],
+    months: int,
+) -> List[array]:
+    """Balances of many loans after each month, one ``array("d")`` per month.
+
+    Column k holds every loan's balance after month k + 1 (zero once paid
+    off). Each month is a handful of whole-column operations applying the
+    loop's own recurrence, so the values equal the loop's bit for bit. The
+    schedule ends early once every loan is paid off.
+    """
+    for principal, payment in zip(principals, payments):
+        _check(principal, payment)
+    rates = array("d", map(monthly_rate, annual_interest_rates))
+    balances = array("d", principals)
+    payments = array("d", payments)
+    columns = []
+    if _np is not None:
+        rates, balances, payments = (
+            _np.frombuffer(c) for c in (rates, balances, payments)
+        )
+        for _ in range(months):
+            balances = balances + balances * rates
+            balances = balances - payments
+            balances[balances < 0] = 0
+            columns.append(array("d", balances.tobytes()))
+            if not balances.any():
+                break
+        return columns
+    for _ in range(months):
+        balances = map(add, balances, map(mul, balances, rates))
+        balances = array("d", map(max, map(sub, balances, payments), repeat(0.0)))
+        columns.append(balances)
+        if not any(balances):
+            break
+    return columns
+
+
+def iter_schedule(
+    principal: float,
+    annual_interest_rate: float,
+    payment: float,
+    months: Optional[int] = None,
+    start: int = 1,
+) -> Iterator[ScheduleRow]:
+    """Yields the schedule one month at a time, from month ``start`` on.
+
+    Stops after month ``months`` (never, if None) or at payoff. When
+    ``start`` > 1 the balance before it comes from the closed form, so the
+    earlier months are not computed; a loan already paid off by then yields
+    nothing.
+    """
+    _check(principal, payment)
+    rate = monthly_rate(annual_interest_rate)
+    money_owed = principal
+    if start > 1:
+        if summarize(principal, annual_interest_rate, payment, start - 1).payoff_month:
+            return
+        money_owed = balance_after(principal, annual_interest_rate, payment, start - 1)
+    for month in count(start) if months is None else range(start, months + 1):
+        interest = money_owed * rate
+        money_owed += interest
+        money_owed -= payment
+        if money_owed < 0:
+            money_owed = 0
+        yield ScheduleRow(month, interest, money_owed)
+        if money_owed == 0:
+            return
+
+
+class AmortizationSchedule:
+    """Lazy, sliceable schedule of one loan.
+
+    Index i is month i + 1, so ``schedule[119:180]`` is months 120-180.
+    Slicing returns an iterator; nothing is stored.
+    """
+
+    def __init__(
+        self,
+        principal: float,
+        annual_interest_rate: float,
+        payment: float,
+        months: Optional[int] = None,
+    ):
+        _check(principal, payment)
+        self.principal = principal
+        self.annual_interest_rate = annual_interest_rate
+        self.payment = payment
+        self.months = months
+
+    def __iter__(self) -> Iterator[ScheduleRow]:
+        return self._rows(1)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if (index.start or 0) < 0 or (index.stop or 0) < 0 or (index.step or 1) < 1:
+                raise ValueError(
+                    "schedule slices take non-negative bounds and a positive step"
+                )
+            start = index.start or 0
+            length = None if index.stop is None else max(0, index.stop - start)
+            return islice(self._rows(start + 1), 0, length, index.step)
+        if index < 0:
+            raise IndexError("schedules do not support negative indexes")
+        for row in self._rows(index + 1):
+            return row
+        raise IndexError("month is past the end of the schedule")
+
+    def _rows(self, first: int) -> Iterator[ScheduleRow]:
+        return iter_schedule(
+            self.principal, self.annual_interest_rate, self.payment, self.months, first
+        )
@@ -0,0 +1,137 @@
+"""Table-driven classification of numbers into bands, in batches.
+
+A band table is a list of ``Band(lower, label)`` rows in increasing order
+of ``lower``. A value belongs to the last band whose ``lower`` is <= the
+value, so the first band (``lower=-inf``) catches everything below the
+second one. This replaces an if/elif chain: the table is data, and finding
+the band is a binary search over the lower bounds (``bisect_right``).
+
+``code(value)`` gives the index of a value's band. ``codes(values)``
+classifies a whole batch at once into an ``array("B")`` of band codes;
+with numpy it is one ``searchsorted`` call, without it ``map`` runs
+``bisect_right`` in C. ``iter_codes`` does the same for a stream, batch by
+batch, and ``counts`` tallies a stream per band without keeping the
+codes. Labels are only looked up when asked for (``label``, ``labels``).
+
+NaN is not smaller than any bound, so the binary search puts it in the
+last band; ``nan_code`` puts it in another one. The if/elif chain behind
+``TEMPERATURE_BANDS`` sent NaN to its else branch, "It's hot!"
+(``TEMPERATURE_NAN_CODE``).
+"""
+
+import math
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import compress, islice, repeat
+from operator import ne
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+import _optional
+
+_np = _optional.numpy()
+
+DEFAULT_BATCH_SIZE = 1 << 16
+
+
+class Band(NamedTuple):
+    lower: float  # inclusive; the band runs up to the next band's lower bound
+    label: str
+
+
+# the bands of conditionalsAndImports.condition_demo
+TEMPERATURE_BANDS = (
+    Band(-math.inf, "It's freezing!"),
+    Band(0, "It's cold."),
+    Band(20, "It's warm."),
+    Band(30, "It's hot!"),
+    Band(80, "It's too hot. Stay indoors."),
+)
+TEMPERATURE_NAN_CODE = 3  # "It's hot!", where condition_demo's chain sent NaN
+
+
+class BandClassifier:
+    """Maps numbers to the index of their band in ``bands``."""
+
+    def __init__(
+        self, bands: Sequence[Band] = TEMPERATURE_BANDS, nan_code: Optional[int] = None
+    ):
+        """``nan_code`` is the band of NaN values, the last band if None."""
+        bands = [Band(*band) for band in bands]
+        if not bands:
+            raise ValueError("at least one band is needed")
+        if bands[0].lower != -math.inf:
+            raise ValueError("the first band must start at -inf")
+        bounds = [band.lower for band in bands[1:]]
+        if any(low >= high for low, high in zip(bounds, bounds[1:])):
+            raise ValueError("band lower bounds must be strictly increasing")
+        if len(bands) > 256:
+            raise ValueError("at most 256 bands (codes are single bytes)")
+        if nan_code is None:
+            nan_code = len(bands) - 1
+        if not 0 <= nan_code < len(bands):
+            raise ValueError("nan_code must be the index of a band")
+        self.bands = tuple(bands)
+        self.bounds = bounds
+        self._labels = [band.label for band in bands]
+        self.nan_code = nan_code
+        # NaN needs a second look only when bisect's last band is not its band
+        self._fix_nan = nan_code != len(bands) - 1
+        self._numpy_bounds = (
+            _np.asarray(bounds, dtype=float) if _np is not None else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.bands)
+
+    def code(self, value) -> int:
+        return self.nan_code if value != value else bisect_right(self.bounds, value)
+
+    def label(self, value) -> str:
+        return self._labels[self.code(value)]
+
+    def codes(self, values: Iterable) -> array:
+        """Band code of every value, as an ``array("B")``."""
+        if _np is not None:
+            values = _np.asarray(values, dtype=float)
+            found = _np.searchsorted(self._numpy_bounds, values, side="right")
+            if self._fix_nan:
+                found[_np.isnan(values)] = self.nan_code
+            return array("B", found.astype(_np.uint8).tobytes())
+        if not self._fix_nan:
+            return array("B", map(bisect_right, repeat(self.bounds), values))
+        values = list(values)
+        codes = array("B", map(bisect_right, repeat(self.bounds), values))
+        for row in compress(range(len(values)), map(ne, values, values)):
+            codes[row] = self.nan_code
+        return codes
+
+    def iter_codes(
+        self, values: Iterable, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[array]:
+        """``codes`` of a stream, one array per batch of ``batch_size`` values."""
+        values = iter(values)
+        while True:
+            batch = list(islice(values, batch_size))
+            if not batch:
+                return
+            yield self.codes(batch)
+
+    def counts(
+        self, values: Iterable, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[int]:
+        """How many values fall in each band."""
+        totals = [0] * len(self.bands)
+        for codes in self.iter_codes(values, batch_size):
+            if _np is not None:
+                found = _np.bincount(_np.frombuffer(codes, dtype=_np.uint8))
+                for code, count in enumerate(found.tolist()):
+                    totals[code] += count
+            else:
+                for code, count in Counter(codes).items():
+                    totals[code] += count
+        return totals
+
+    def labels(self, codes: Iterable[int]) -> List[str]:
+        """The labels of band codes (e.g. the result of ``codes``)."""
+        return list(map(self._labels.__getitem__, codes))
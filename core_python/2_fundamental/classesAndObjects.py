@@ -1,30 +1,65 @@
  
+import threading
+
+from idAllocator import IdAllocator, LocalBlockSource
+from robotFleet import PrintSink, RobotFleet
+
+
 class Robot:
-    """Simple Robot class demonstrating property, classmethod, and staticmethod."""
+    """Simple Robot class demonstrating property, classmethod, and staticmethod.
+
+    A robot is a view of one row of a ``RobotFleet``: its name and position
+    live in the fleet's columns. Without a fleet it gets a fleet of its own
+    that prints every walk right away.
+    """
 
     # class-level sequence number shared across all instances
     sequence_number = 0
+    # hands out Robot's sequence numbers, lock-free per thread; every subclass gets
+    # an allocator of its own on first use (assign one backed by a FileBlockSource
+    # to share a class's numbers across processes)
+    ids = IdAllocator()
+    _ids_lock = threading.Lock()
 
-    def __init__(self, name):
-        self.name = name
-        self.position = [0, 0]  # x, y coordinates
+    def __init__(self, name, fleet=None):
+        if not self.is_valid_name(name):
+            raise ValueError("name must be a non-empty string")
+        self._fleet = fleet if fleet is not None else RobotFleet(sink=PrintSink(buffer_lines=0))
+        self._row = self._fleet.add(name)
         print('My name is', self.name)
 
+    # alternative constructor for robots that already exist in a fleet (nothing printed)
+    @classmethod
+    def view(cls, fleet, row):
+        robot = cls.__new__(cls)
+        robot._fleet = fleet
+        robot._row = row
+        return robot
+
     def walk(self, x):
-        self.position[0] += x
-        print(f'{self.name} walked to position {self.position}')
+        self._fleet.walk(x, rows=(self._row,))
+
+    # x, y coordinates: reads and writes go straight to the fleet
+    @property
+    def position(self):
+        return self._fleet.position(self._row)
+
+    @position.setter
+    def position(self, value) -> None:
+        x, y = value
+        self._fleet.move_to(self._row, x, y)
 
     # property getter
     @property
     def name(self) -> str:
-        return self._name
+        return self._fleet.names[self._row]
     
     # property setter with simple validation
     @name.setter
     def name(self, value: str) -> None:
         if not self.is_valid_name(value):
             raise ValueError("name must be a non-empty string")
-        self._name = value
+        self._fleet.names[self._row] = value
 
     # static method for name validation (does not require class or instance)
     @staticmethod
@@ -34,8 +69,16 @@ class Robot:
     # class method to increase and return the sequence number
     @classmethod
     def increment_sequence(cls) -> int:
-        cls.sequence_number += 1
-        return cls.sequence_number
+        ids = cls.__dict__.get("ids")
+        if ids is None:
+            with Robot._ids_lock:
+                ids = cls.__dict__.get("ids")
+                if ids is None:
+                    # counts on from the parent's number, like cls.sequence_number += 1 did
+                    ids = cls.ids = IdAllocator(LocalBlockSource(cls.sequence_number + 1))
+        number = ids.next_id()
+        cls.sequence_number = number  # the latest number of this class, in any thread
+        return number
     
     def eat(self):
         print("I'm hungry!")
@@ -43,11 +86,11 @@ class Robot:
 class Robot_Dog(Robot):
     """ Robot Dog subclass extending Robot functionality. """
  
-    def __init__(self, name_val: str, breed_val: str):
+    def __init__(self, name_val: str, breed_val: str, fleet=None):
         # call parent __init__ to reuse name validation, position setup and any prints,
         # then perform Robot_Dog-specific initialization
         # here if in the subclass we don't implement the __init__, the parent class's __init__ will be called automatically
-        super().__init__(name_val)
+        super().__init__(name_val, fleet)
         self.breed = breed_val
 
     def make_noise(self):
@@ -69,6 +112,17 @@ if __name__ == "__main__":
     dog.name = "Max"
     print(dog.name)
 
+    dog.walk(3)
+    dog.position[1] = 2  # writes through to the fleet
+    print(dog.position)
+
+    # a fleet of robots walks in one batched step; printing is a buffered sink
+    fleet = RobotFleet(sink=PrintSink())
+    dogs = [Robot_Dog.view(fleet, row) for row in fleet.spawn(f"Dog {i}" for i in range(3))]
+    fleet.walk(1, dy=[0, 1, 2])
+    fleet.flush()
+    print(dogs[2].name, dogs[2].position)
+
     # demonstrate class sequence
     print("Sequence:", Robot_Dog.increment_sequence())
     print("Sequence:", Robot_Dog.increment_sequence())
\ No newline at end of file
@@ -1,21 +1,105 @@
+import argparse
+from itertools import chain
 from typing import List
 from employee import Employee, SalaryEmployee, HourlyEmployee, CommissionEmployee
+from payroll import EmployeeTable, PayrollTable, SALARY, HOURLY, COMMISSION, OTHER
+from payrollParallel import parallel_paychecks
+from payrollReport import ReportStats, chunked, write_chunks
+from payrollTotals import PayrollTotals
+
+KIND_NAMES = {SALARY: "salary", HOURLY: "hourly", COMMISSION: "commission", OTHER: "other"}
 
 class Company:
 
-    def __init__(self):
-        self.employees = []
+    def __init__(self, compact: bool = False):
+        if compact:
+            # struct-of-arrays roster: no object per employee, `employees` hands out views
+            self.employees = EmployeeTable()
+            self.payroll = self.employees
+        else:
+            self.employees = []
+            # columnar copy of the roster used for batched payroll
+            self.payroll = PayrollTable()
+        # running aggregates, updated per add/change instead of rescanning the roster
+        self.totals = PayrollTotals()
+        self._observer = self._employee_changed  # one bound method shared by all employees
+        if compact:
+            self.employees.observer = self._observer
 
     def add_employee(self, employee: Employee):
-        self.employees.append(employee)
+        if employee._observer is not None:
+            # a second row would take over the observer (and its key): the first would go stale
+            where = "this" if employee._observer is self._observer else "another company's"
+            raise ValueError(f"{employee.first_name} {employee.last_name} is already on {where} roster")
+        if self.payroll is not self.employees:
+            self.employees.append(employee)
+        row = self.payroll.add(employee)
+        if self.employees[row] is employee:
+            # the roster holds this very object: watch it (an employee reports to one company)
+            employee._observer = self._observer
+            employee._observer_key = row
+        self.totals.add(self.payroll.kinds[row], self.payroll.paycheck(row))
+
+    def _employee_changed(self, employee):
+        row = employee._observer_key
+        self.payroll.refresh(row, employee)
+        self.totals.update(row, self.payroll.paycheck(row))
+
+    @property
+    def total_payroll(self) -> float:
+        return self.totals.total
+
+    def totals_by_type(self) -> dict:
+        """Returns the payroll total per employee kind ("salary", "hourly", ...)."""
+        return {name: self.totals.kind_total(kind) for kind, name in KIND_NAMES.items()}
+
+    def lowest_paid(self):
+        """Returns (employee, paycheck) with the lowest paycheck, or None."""
+        entry = self.totals.min()
+        return entry and (self.employees[entry[0]], entry[1])
+
+    def highest_paid(self):
+        """Returns (employee, paycheck) with the highest paycheck, or None."""
+        entry = self.totals.max()
+        return entry and (self.employees[entry[0]], entry[1])
+
+    def top_earners(self, n: int = 10):
+        """Returns the n best paid employees as (employee, paycheck), highest first."""
+        return [(self.employees[row], pay) for row, pay in self.totals.top(n)]
+
+    def paychecks(self, workers: int = 0, chunk_size: int = 250_000) -> List[float]:
+        """Returns every employee's paycheck in roster order, computed in batch.
+
+        With workers > 1 the roster is split into shards of chunk_size rows
+        and computed in a process pool.
+        """
+        if workers > 1:
+            return parallel_paychecks(self.payroll, workers, chunk_size)
+        return self.payroll.paychecks()
+
+    def report_rows(self, chunk_size: int = 10_000):
+        """Yields (first_name, last_name, paycheck) rows, computed in batched chunks."""
+        return chain.from_iterable(self.payroll.iter_rows(chunk_size))
+
+    def write_report(self, sink=None, fmt: str = "text", chunk_size: int = 10_000,
+                     workers: int = 0) -> ReportStats:
+        """Streams the payroll report to a path, open file or stdout (text, csv or jsonl).
+
+        With workers > 1 the paychecks are computed in a process pool, in
+        shards of chunk_size rows.
+        """
+        if workers > 1:
+            pays = self.paychecks(workers, chunk_size)
+            rows = ((first, last, pay) for (first, last), pay in zip(self.payroll.names(), pays))
+            return write_chunks(chunked(rows, chunk_size), sink, fmt)
+        return write_chunks(self.payroll.iter_rows(chunk_size), sink, fmt)
 
     def display_employees(self):
-        for emp in self.employees:
-            print(f"{emp.first_name} {emp.last_name}: ${emp.calculate_paycheck():,.2f}")
+        self.write_report()
         print("-----------------------------------------------")
 
 
-def main():
+def main(workers: int = 0, chunk_size: int = 10_000):
     my_company = Company()
     emp1 = SalaryEmployee("John", "Doe", 60000)
     emp2 = HourlyEmployee("Jane", "Smith", 25, 40)
@@ -24,9 +108,13 @@ def main():
     my_company.add_employee(emp2)
     my_company.add_employee(emp3)
 
-    print("\n".join([f"{emp.first_name} {emp.last_name}: ${emp.calculate_paycheck():,.2f}" for emp in my_company.employees]))
+    my_company.write_report(chunk_size=chunk_size, workers=workers)
 
 def take_a_list(lst: List[int]) -> None:
     pass
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Print the payroll of a sample company.")
+    parser.add_argument("--workers", type=int, default=0, help="compute paychecks in this many processes")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="rows per report write and per process shard")
+    args = parser.parse_args()
+    main(args.workers, args.chunk_size)
\ No newline at end of file
@@ -1,36 +1,37 @@
 
-import datetime, random
+import random
+
+from bandClassifier import BandClassifier, TEMPERATURE_BANDS, TEMPERATURE_NAN_CODE
+from rpsSimulation import LOSS, MOVES, TIE, WIN, outcome
 
 # <, <=, >, >=, ==, != comparison operators
 # or and not logical operators. Or and or let you combine multiple conditions while not negates a condition.
 # True or False boolean values
 
+# temperature bands as a table (bandClassifier.TEMPERATURE_BANDS) instead of an if/elif chain:
+# one binary search per reading, or whole batches of readings at once
+# (NaN keeps the "It's hot!" the chain's else branch gave it)
+temperature_classifier = BandClassifier(TEMPERATURE_BANDS, TEMPERATURE_NAN_CODE)
+
+def classify_temperatures(readings):
+    """Band codes (indexes into TEMPERATURE_BANDS) of many readings at once."""
+    return temperature_classifier.codes(readings)
+
 def condition_demo(temperature: float):
-    if temperature < 0:
-        return "It's freezing!"
-    elif 0 <= temperature < 20:
-        return "It's cold."
-    elif 20 <= temperature < 30:
-        return "It's warm."
-    elif temperature >= 80:
-        return "It's too hot. Stay indoors."
-    else:
-        return "It's hot!"
+    return temperature_classifier.label(temperature)
 
-def rock_paper_scissors():
-    # give the below random function a seed that is current date time oa value
-    random.seed(int(datetime.datetime.now().timestamp()))
-    computer_choice = random.choice(["rock", "paper", "scissors"])
+def rock_paper_scissors(rng=None):
+    # rng: a random.Random(seed) makes the computer's choices repeatable; by default the
+    # module-level random functions are used (seeded from the OS when random is imported)
+    computer_choice = (rng or random).choice(["rock", "paper", "scissors"])
     user_chose = input("Enter rock, paper, or scissors: ").lower()
 
-    if computer_choice == user_chose:
-        print("TIE")
-    elif (user_chose == "rock" and computer_choice == "scissors") or \
-         (user_chose == "scissors" and computer_choice == "paper") or \
-         (user_chose == "paper" and computer_choice == "rock"):
-        print("YOU WIN")
+    # the payoff table decides; a choice that is not a move loses, as before
+    if user_chose in MOVES:
+        result = outcome(MOVES.index(user_chose), MOVES.index(computer_choice))
     else:
-        print("YOU LOSE")
+        result = LOSS
+    print({TIE: "TIE", WIN: "YOU WIN", LOSS: "YOU LOSE"}[result])
     print(f"Computer chose: {computer_choice}")
 
 if __name__ == "__main__":
@@ -13,6 +13,10 @@ def dictionary_demo():
 
     acronyms_2_translations = dict(zip(acronyms, translations))
 
+    from glossarySearch import did_you_mean
+    if 'TBJ' not in acronyms_2_translations: # suggest close keys instead of failing
+        print("'TBJ' not found, did you mean:", did_you_mean('TBJ', acronyms_2_translations))
+
     empty_dict = {}
 
     empty_dict['new_key'] = 'new_value' # add a new key-value pair
@@ -62,7 +66,7 @@ def contacts():
     """
     print(contacts.__doc__)
     # dictionary with a list of dictionaries as a value
-    contacts = {
+    contact_book = {
         'number': '4',
         'students': [
             {'name': 'Alice', 'phone': '123-456-7890'},
@@ -73,9 +77,19 @@ def contacts():
     
     }
 
-    for student in contacts['students']:
+    for student in contact_book['students']:
         print(f"Name: {student['name']}, Phone: {student['phone']}")
 
+    # the same records as columns: one copy of the keys, no dict per student,
+    # and an index for O(1) lookups by phone
+    from recordStore import RecordStore
+    students = RecordStore.from_records(contact_book['students'])
+    students.create_index('phone', unique=True)
+    for name, phone in students.values('name', 'phone'):
+        print(f"Name: {name}, Phone: {phone}")
+    print("Owner of 555-555-5555:", students.find_one('phone', '555-555-5555')['name'])
+    return students
+
 
 def json_demo():
     """
@@ -100,16 +114,37 @@ def json_demo():
     dict_from_json = json.loads(json_str)
     print("Dictionary from JSON:", dict_from_json)
 
-def request_astronauts_in_space():
+    # jsonCodec picks the fastest installed library (orjson, ujson, json) and encodes to bytes
+    import io
+    import jsonCodec
+    print(f"Fastest JSON backend: {jsonCodec.backend.name}")
+    print("Bytes:", jsonCodec.dumps(sample_dict))
+
+    # JSON lines: one document per line, written and read back one record at a time
+    lines = io.BytesIO()
+    jsonCodec.dump_lines([sample_dict, {"name": "Alice", "age": 30}], lines)
+    lines.seek(0)
+    for record in jsonCodec.iter_lines(lines):
+        print("JSON line:", record)
+
+    # a large top-level array is decoded item by item, never as a whole document
+    document = io.BytesIO(b'{"number": 2, "people": [{"name": "Alice"}, {"name": "Bob"}]}')
+    for person in jsonCodec.iter_array(document, key="people"):
+        print("Streamed:", person)
+
+ASTROS_URL = "http://api.open-notify.org/astros.json"
+
+def request_astronauts_in_space(client=None, url=ASTROS_URL):
     """
     Requests data from a public API to get the current number of astronauts in space and their names.
     """
     print(request_astronauts_in_space.__doc__)
-    import requests
+    from httpClient import default_client
 
-    url = "http://api.open-notify.org/astros.json"
-    response = requests.get(url)
-    data = response.json() # decode JSON response to a dictionary
+    # pooled keep-alive session with timeout, retries and a TTL cache;
+    # a second call within the TTL does not touch the network
+    client = client or default_client()
+    data = client.get_json(url) # decode JSON response to a dictionary
 
     number_of_astronauts = data['number']
     astronauts = data['people']
@@ -117,9 +152,38 @@ def request_astronauts_in_space():
     print(f"There are currently {number_of_astronauts} astronauts in space:")
     for astronaut in astronauts:
         print(f"- {astronaut['name']} on the {astronaut['craft']}")
+    return data
+
+WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
+CITIES = {
+    "New York": (40.71, -74.01),
+    "Los Angeles": (34.05, -118.24),
+    "London": (51.51, -0.13),
+}
 
-def request_whether():
-    pass
+def request_whether(cities=CITIES, client=None, url=WEATHER_URL):
+    """
+    Requests the current weather of several cities concurrently (Open-Meteo, no API key needed).
+    """
+    print(request_whether.__doc__)
+    import asyncio
+    from httpClient import AsyncHttpClient, default_client
+
+    async def fetch_all():
+        fetcher = AsyncHttpClient(client or default_client())
+        try:
+            return await asyncio.gather(*(
+                fetcher.get_json(url, {"latitude": lat, "longitude": lon, "current_weather": "true"})
+                for lat, lon in cities.values()
+            ))
+        finally:
+            fetcher.shutdown() # its threads only, the shared client stays open
+
+    weather = dict(zip(cities, asyncio.run(fetch_all())))
+    for city, data in weather.items():
+        current = data['current_weather']
+        print(f"{city}: {current['temperature']}°C, wind {current['windspeed']} km/h")
+    return weather
 
 if __name__ == "__main__":
    #contacts()
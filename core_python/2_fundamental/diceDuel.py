@@ -0,0 +1,171 @@
+"""Dice-duel Monte Carlo: many duels per call, rolls generated in bulk.
+
+In a duel every player rolls ``dice`` dice with ``sides`` sides and the
+highest total wins; a duel where several players share the highest total
+is a tie. ``simulate`` plays ``duels`` of them and returns ``DuelStats``:
+the win count of each player and the tie count, with the estimated
+probabilities and their Wilson score confidence intervals.
+
+Rolls are never drawn one ``randint`` at a time. ``roll_totals`` takes one
+``rng.randbytes`` block per batch, drops the few byte values that would
+make ``% sides`` uneven (rejection sampling, done by ``bytes.translate``
+together with the mapping to 1..sides) and sums each player's dice. With
+numpy the totals and the winners are computed on whole arrays; without it,
+strided slices of the bytes are summed with ``map``.
+"""
+
+import math
+import random
+from operator import add
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import _optional
+
+_np = _optional.numpy()
+
+DEFAULT_BATCH_SIZE = 1 << 16  # duels per batch
+Z_95 = 1.959963984540054  # two-sided 95% normal quantile
+
+
+def wilson_interval(
+    successes: int, trials: int, z: float = Z_95
+) -> Tuple[float, float]:
+    """Wilson score interval of a binomial proportion (stays inside [0, 1])."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    z2 = z * z / trials
+    centre = (p + z2 / 2) / (1 + z2)
+    spread = z / (1 + z2) * math.sqrt(p * (1 - p) / trials + z2 / (4 * trials))
+    return max(0.0, centre - spread), min(1.0, centre + spread)
+
+
+class DuelStats(NamedTuple):
+    duels: int
+    wins: Tuple[int, ...]  # per player
+    ties: int
+
+    def probability(self, player: int) -> float:
+        return self.wins[player] / self.duels
+
+    def interval(self, player: int, z: float = Z_95) -> Tuple[float, float]:
+        return wilson_interval(self.wins[player], self.duels, z)
+
+    @property
+    def tie_probability(self) -> float:
+        return self.ties / self.duels
+
+    def tie_interval(self, z: float = Z_95) -> Tuple[float, float]:
+        return wilson_interval(self.ties, self.duels, z)
+
+
+def _byte_tables(sides: int) -> Tuple[bytes, bytes]:
+    """(translation to 1..sides, byte values to reject) for uniform rolls."""
+    limit = 256 - 256 % sides
+    table = bytes(code % sides + 1 if code < limit else 0 for code in range(256))
+    return table, bytes(range(limit, 256))
+
+
+def roll_dice(rng: random.Random, count: int, sides: int = 6) -> Sequence[int]:
+    """``count`` uniform rolls of 1..sides (bytes when sides < 256)."""
+    if sides < 2:
+        raise ValueError("dice need at least 2 sides")
+    if sides > 255:
+        return rng.choices(range(1, sides + 1), k=count)
+    table, rejected = _byte_tables(sides)
+    rolls = b""
+    while len(rolls) < count:
+        rolls += rng.randbytes(count - len(rolls)).translate(table, rejected)
+    return rolls
+
+
+def roll_totals(
+    rng: random.Random, duels: int, players: int = 2, dice: int = 1, sides: int = 6
+) -> List[Sequence[int]]:
+    """Each player's dice total in each duel: one sequence per player."""
+    rolls = roll_dice(rng, duels * players * dice, sides)
+    if _np is not None:
+        if isinstance(rolls, bytes):
+            array = _np.frombuffer(rolls, dtype=_np.uint8)
+        else:
+            array = _np.asarray(rolls)
+        return list(array.reshape(duels, players, dice).sum(axis=2, dtype=_np.int64).T)
+    # roll (duel, player, die) is at index (duel * players + player) * dice + die
+    stride = players * dice
+    totals = []
+    for player in range(players):
+        first = player * dice
+        total = rolls[first::stride]
+        for die in range(1, dice):
+            total = list(map(add, total, rolls[first + die :: stride]))
+        totals.append(list(total))
+    return totals
+
+
+def _tally(totals: List[Sequence[int]]) -> Tuple[List[int], int]:
+    """(wins per player, ties) for one batch of totals."""
+    players = len(totals)
+    if _np is not None:
+        table = _np.stack(totals, axis=1)
+        best = table.max(axis=1)
+        at_best = table == best[:, None]
+        sole = at_best.sum(axis=1) == 1
+        wins = at_best[sole].sum(axis=0).tolist()
+        return wins, int(len(best) - sole.sum())
+    wins = [0] * players
+    ties = 0
+    for duel in zip(*totals):
+        best = max(duel)
+        if duel.count(best) == 1:
+            wins[duel.index(best)] += 1
+        else:
+            ties += 1
+    return wins, ties
+
+
+def simulate(
+    duels: int,
+    players: int = 2,
+    dice: int = 1,
+    sides: int = 6,
+    seed=None,
+    rng: Optional[random.Random] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> DuelStats:
+    """Plays ``duels`` duels and counts wins per player and ties.
+
+    Pass ``seed`` (or a ``random.Random``) for repeatable results.
+    """
+    if players < 1 or dice < 1:
+        raise ValueError("players and dice must be at least 1")
+    rng = rng if rng is not None else random.Random(seed)
+    wins = [0] * players
+    ties = 0
+    for start in range(0, duels, batch_size):
+        count = min(batch_size, duels - start)
+        batch_wins, batch_ties = _tally(roll_totals(rng, count, players, dice, sides))
+        wins = list(map(add, wins, batch_wins))
+        ties += batch_ties
+    return DuelStats(duels, tuple(wins), ties)
+
+
+def exact_probabilities(players: int = 2, dice: int = 1, sides: int = 6) -> List[float]:
+    """Exact win probability of each player (all equal), then of a tie.
+
+    Works from the distribution of one player's total, so it is cheap for
+    any number of players; used to check the simulation.
+    """
+    counts = [1]  # ways to reach each total with the dice rolled so far
+    for _ in range(dice):
+        counts = [
+            sum(counts[max(0, t - sides) : t]) if t else 0
+            for t in range(len(counts) + sides)
+        ]
+    outcomes = sides**dice
+    distribution = [ways / outcomes for ways in counts]
+    below = 0.0
+    win = 0.0
+    for p in distribution:
+        win += p * below ** (players - 1)  # this total, every other player lower
+        below += p
+    return [win] * players + [1 - win * players]
@@ -0,0 +1,291 @@
+"""Persisted directory snapshots and incremental change detection.
+
+A ``Snapshot`` holds (inode, size, mtime) of every entry below a root, as
+columns: three ``array`` columns plus the relative paths. On disk it is a
+header followed by the raw columns and the NUL-separated UTF-8 paths, so
+loading it is a few ``frombytes`` calls and one ``split``.
+
+``refresh`` brings a snapshot up to date without walking the tree. It
+``stat``s every known path once, following symlinks as the scanner does
+(a link that broke counts as removed). A file whose inode, size or mtime changed
+is *modified*, a path that is gone is *removed*. Adding, removing or
+renaming an entry always changes its directory's mtime, so only
+directories whose mtime changed are listed again to find *added* entries.
+When nothing changed, that is one ``stat`` per entry and a comparison of
+whole columns, with no directory listing at all.
+"""
+
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
+from operator import attrgetter, mul, ne, not_
+from stat import S_ISDIR
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from dirScanner import DEFAULT_WORKERS, FileRecord, scan_tree
+
+SNAPSHOT_SUFFIX = ".snapshot"
+# magic, entry count, byte length of the paths blob, mtime of the root
+_HEADER = struct.Struct("<8sQQd")
+_MAGIC = b"DSNAP001"
+# paths per stat task when refresh() fans out over threads
+STAT_CHUNK = 16_384
+
+_inode_of = attrgetter("st_ino")
+_size_of = attrgetter("st_size")
+_mtime_of = attrgetter("st_mtime")
+_mode_of = attrgetter("st_mode")
+
+
+class Changes(NamedTuple):
+    added: List[FileRecord]
+    removed: List[str]  # absolute paths
+    modified: List[FileRecord]
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.modified)
+
+
+class Snapshot:
+    """(inode, size, mtime, is_dir) of every entry below root."""
+
+    def __init__(
+        self,
+        root,
+        paths=None,
+        inodes=None,
+        sizes=None,
+        mtimes=None,
+        dirs=None,
+        root_mtime=0.0,
+    ):
+        self.root = os.path.abspath(root)
+        self.root_mtime = root_mtime  # the root itself is not an entry
+        self.paths = paths if paths is not None else []  # relative to root
+        self.inodes = inodes if inodes is not None else array("Q")
+        self.sizes = sizes if sizes is not None else array("q")
+        self.mtimes = mtimes if mtimes is not None else array("d")
+        self.dirs = dirs if dirs is not None else array("B")
+
+    def __len__(self):
+        return len(self.paths)
+
+    @classmethod
+    def from_records(
+        cls, root, records: Iterable[FileRecord], root_mtime: float, exclude=()
+    ) -> "Snapshot":
+        """Snapshot of a walk of root; root_mtime must be read before the walk."""
+        snapshot = cls(root, root_mtime=root_mtime)
+        snapshot.extend(records, exclude)
+        return snapshot
+
+    @classmethod
+    def take(cls, root, workers: int = DEFAULT_WORKERS, exclude=()) -> "Snapshot":
+        """Full walk of root."""
+        root = os.path.abspath(root)
+        root_mtime = os.lstat(root).st_mtime
+        return cls.from_records(root, scan_tree(root, workers), root_mtime, exclude)
+
+    def extend(self, records: Iterable[FileRecord], exclude=()) -> None:
+        skip = len(self.root) + 1
+        exclude = set(exclude)
+        for record in records:
+            if record.path in exclude:
+                continue
+            self.paths.append(record.path[skip:])
+            self.inodes.append(record.inode)
+            self.sizes.append(record.size)
+            self.mtimes.append(record.mtime)
+            self.dirs.append(record.is_dir)
+
+    def absolute_paths(self) -> List[str]:
+        prefix = self.root + os.sep
+        return [prefix + path for path in self.paths]
+
+    def record(self, i: int) -> FileRecord:
+        """Entry i as a scanner record."""
+        path = self.root + os.sep + self.paths[i]
+        is_dir = bool(self.dirs[i])
+        extension = "" if is_dir else os.path.splitext(path)[1]
+        return FileRecord(
+            path, self.sizes[i], extension, self.mtimes[i], is_dir, self.inodes[i]
+        )
+
+    def records(self) -> List[FileRecord]:
+        return [self.record(i) for i in range(len(self.paths))]
+
+    def save(self, file_path) -> None:
+        blob = "\0".join(self.paths).encode("utf-8", "surrogateescape")
+        columns = [self.inodes, self.sizes, self.mtimes]
+        if sys.byteorder != "little":
+            columns = [array(c.typecode, c) for c in columns]
+            for column in columns:
+                column.byteswap()
+        # rewritten in place rather than replaced, so that a snapshot kept
+        # inside the tree does not change its directory's mtime on every run;
+        # a torn write fails the length checks in load() and forces a full walk
+        with open(file_path, "wb") as file:
+            file.write(
+                _HEADER.pack(_MAGIC, len(self.paths), len(blob), self.root_mtime)
+            )
+            for column in columns:
+                file.write(column.tobytes())
+            file.write(self.dirs.tobytes())
+            file.write(blob)
+
+    @classmethod
+    def load(cls, file_path, root) -> Optional["Snapshot"]:
+        """The saved snapshot, or None if it is missing or unreadable."""
+        snapshot = cls(root)
+        try:
+            with open(file_path, "rb") as file:
+                magic, count, blob_size, snapshot.root_mtime = _HEADER.unpack(
+                    file.read(_HEADER.size)
+                )
+                if magic != _MAGIC:
+                    return None
+                for column in (
+                    snapshot.inodes,
+                    snapshot.sizes,
+                    snapshot.mtimes,
+                    snapshot.dirs,
+                ):
+                    column.frombytes(file.read(count * column.itemsize))
+                blob = file.read(blob_size)
+        except (FileNotFoundError, struct.error, ValueError):
+            return None
+        if len(snapshot.dirs) != count or len(blob) != blob_size:
+            return None
+        if sys.byteorder != "little":
+            for column in (snapshot.inodes, snapshot.sizes, snapshot.mtimes):
+                column.byteswap()
+        snapshot.paths = (
+            blob.decode("utf-8", "surrogateescape").split("\0") if count else []
+        )
+        return snapshot
+
+
+def diff(old: Snapshot, new: Snapshot) -> Changes:
+    """Changes between two snapshots of the same root (e.g. two full walks)."""
+    old_rows = {path: i for i, path in enumerate(old.paths)}
+    added, modified = [], []
+    for j, path in enumerate(new.paths):
+        i = old_rows.pop(path, None)
+        if i is None:
+            added.append(new.record(j))
+        elif not new.dirs[j] and (
+            (old.inodes[i], old.sizes[i], old.mtimes[i])
+            != (new.inodes[j], new.sizes[j], new.mtimes[j])
+        ):
+            modified.append(new.record(j))
+    removed = [old.root + os.sep + path for path in old_rows]
+    return Changes(added, removed, modified)
+
+
+def _stat_chunk(paths: List[str]) -> Tuple[list, List[int]]:
+    """stat results of the paths still there, and the indexes of the missing ones."""
+    try:
+        return list(map(os.stat, paths)), []  # common case, the loop stays in C
+    except OSError:
+        pass
+    stats, missing = [], []
+    for i, path in enumerate(paths):
+        try:
+            stats.append(os.stat(path))
+        except OSError:
+            missing.append(i)
+    return stats, missing
+
+
+def _stat_all(paths: List[str], workers: int) -> Tuple[list, List[int]]:
+    """``_stat_chunk`` over all paths, in STAT_CHUNK slices on a thread pool."""
+    if workers <= 1 or len(paths) <= STAT_CHUNK:
+        return _stat_chunk(paths)
+    starts = range(0, len(paths), STAT_CHUNK)
+    stats, missing = [], []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        chunks = (paths[start : start + STAT_CHUNK] for start in starts)
+        for start, (chunk_stats, chunk_missing) in zip(
+            starts, pool.map(_stat_chunk, chunks)
+        ):
+            stats.extend(chunk_stats)
+            missing.extend(start + i for i in chunk_missing)
+    return stats, missing
+
+
+def refresh(
+    snapshot: Snapshot, workers: int = DEFAULT_WORKERS, exclude=()
+) -> Tuple[Snapshot, Changes]:
+    """The current snapshot and what changed since ``snapshot``, without a full walk."""
+    paths = snapshot.absolute_paths()
+    root_mtime = os.lstat(snapshot.root).st_mtime
+    stats, missing = _stat_all(paths, workers)
+    dirs = array("B", map(S_ISDIR, map(_mode_of, stats)))
+    inodes = array("Q", map(_inode_of, stats))
+    # records give directories size 0, whatever stat says
+    sizes = array("q", map(mul, map(_size_of, stats), map(not_, dirs)))
+    mtimes = array("d", map(_mtime_of, stats))
+    if (
+        not missing
+        and root_mtime == snapshot.root_mtime
+        and inodes == snapshot.inodes
+        and sizes == snapshot.sizes
+        and mtimes == snapshot.mtimes
+    ):
+        return snapshot, Changes([], [], [])
+
+    old = snapshot
+    if missing:
+        keep = [True] * len(paths)
+        for i in missing:
+            keep[i] = False
+        old = Snapshot(
+            snapshot.root,
+            list(compress(snapshot.paths, keep)),
+            array("Q", compress(snapshot.inodes, keep)),
+            array("q", compress(snapshot.sizes, keep)),
+            array("d", compress(snapshot.mtimes, keep)),
+            array("B", compress(snapshot.dirs, keep)),
+        )
+    current = Snapshot(
+        snapshot.root, list(old.paths), inodes, sizes, mtimes, dirs, root_mtime
+    )
+
+    changed = compress(
+        range(len(current)),
+        map(ne, zip(inodes, sizes, mtimes), zip(old.inodes, old.sizes, old.mtimes)),
+    )
+    modified = []
+    # entries were added to (or renamed within) exactly the directories whose mtime moved
+    rescan = [current.root] if root_mtime != snapshot.root_mtime else []
+    for i in changed:
+        if dirs[i]:
+            directory = current.root + os.sep + current.paths[i]
+            if not os.path.islink(directory):  # the scan never went into those
+                rescan.append(directory)
+        else:
+            modified.append(current.record(i))
+
+    added = []
+    if rescan:
+        known = set(current.paths)
+        exclude = set(exclude)
+        skip = len(current.root) + 1
+        for directory in rescan:
+            for record in scan_tree(directory, workers, recursive=False):
+                if record.path[skip:] in known or record.path in exclude:
+                    continue
+                added.append(record)
+                if record.is_dir and not os.path.islink(record.path):
+                    # a new directory: everything below it is new
+                    added.extend(
+                        r
+                        for r in scan_tree(record.path, workers)
+                        if r.path not in exclude
+                    )
+        current.extend(added)
+    removed = [paths[i] for i in missing]
+    return current, Changes(added, removed, modified)
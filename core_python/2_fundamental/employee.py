@@ -1,11 +1,24 @@
 import abc
 
 class Employee(abc.ABC):
+    # __slots__ drops the per-instance __dict__, which matters for large rosters;
+    # subclasses need their own __slots__ (even an empty one) to keep the saving
+    __slots__ = ("first_name", "last_name", "_observer", "_observer_key")
 
     def __init__(self, fname_val, lname_val):
+        # observer: callable(employee) told about every public attribute change, e.g. by Company
+        self._observer = None
+        self._observer_key = None
         self.first_name = fname_val
         self.last_name = lname_val
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            observer = getattr(self, "_observer", None)
+            if observer is not None:
+                observer(self)
+
     # mark as abstract: subclasses must override
     @abc.abstractmethod
     def calculate_paycheck(self):
@@ -15,6 +28,7 @@ class Employee(abc.ABC):
     # and decorate this method with @abc.abstractmethod (requires changing the class header).
 
 class SalaryEmployee(Employee):
+    __slots__ = ("salary",)
 
     def __init__(self, fname, lname, salary_val):
         super().__init__(fname, lname)
@@ -26,6 +40,8 @@ class SalaryEmployee(Employee):
 
 
 class HourlyEmployee(Employee):
+    __slots__ = ("hourly_rate", "weekly_hours")
+
     def __init__(self, fname, lname, hourly_rate_val, weekly_hours_val):
         super().__init__(fname, lname)
         self.hourly_rate = hourly_rate_val
@@ -36,6 +52,8 @@ class HourlyEmployee(Employee):
     
 class CommissionEmployee(SalaryEmployee):
     """multiple inheritance example: CommissionEmployee inherits from SalaryEmployee"""
+    __slots__ = ("commission_rate", "sales_amount")
+
     def __init__(self, fname, lname, salary_val, commission_rate_val, sales_amount_val):
         super().__init__(fname, lname, salary_val)
         self.commission_rate = commission_rate_val  # e.g., 0.05 for 5%
@@ -1,5 +1,7 @@
 
 
+from glossarySearch import did_you_mean
+
 acronyms = {
     "API": "Application Programming Interface",
     "OOP": "Object-Oriented Programming",
@@ -11,9 +13,17 @@ try:
     print(acronyms["XYZ"])  # This will raise a KeyError
 except KeyError as e:
     print(f"KeyError encountered: {e}. Please check if the acronym exists in the dictionary.")
+    suggestions = did_you_mean(e.args[0], acronyms)
+    if suggestions:
+        print(f"Did you mean: {', '.join(suggestions)}?")
 finally:
     print("Execution completed.")
 
+try:
+    print(acronyms["APY"])  # a typo of an existing acronym
+except KeyError as e:
+    print(f"KeyError encountered: {e}. Did you mean: {', '.join(did_you_mean(e.args[0], acronyms))}?")
+
 try:
     raise ValueError("This is a custom ValueError for demonstration.")
 except ValueError as e:
@@ -0,0 +1,190 @@
+"""Batched, concurrent file relocation.
+
+``plan_moves`` picks the files to move from scanner records by glob
+pattern. ``relocate`` carries the plan out:
+
+* a source on the same device as the destination is moved with one
+  ``os.rename`` (a metadata-only operation, whatever the file size);
+* other sources are copied by a bounded thread pool (``copy_file_fast`` to
+  a ``.part`` file, ``os.replace`` into place, then the source is removed),
+  so several large archives stream concurrently and the number of queued
+  copies never exceeds twice the pool size.
+
+Failures are collected instead of aborting the batch, and a progress
+callback receives running counts and throughput.
+"""
+
+import fnmatch
+import os
+import re
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from fileUtils import copy_file_fast
+
+DEFAULT_PATTERNS = ("*.zip",)
+DEFAULT_WORKERS = 4
+PART_SUFFIX = ".part"
+
+
+class Move(NamedTuple):
+    src: str
+    dst: str
+    size: int
+
+
+class RelocationStats(NamedTuple):
+    files: int  # moves finished so far (failed ones excluded)
+    renamed: int  # of which same-device renames
+    copied: int  # of which cross-device copies
+    bytes: int  # bytes of the finished moves
+    seconds: float
+    errors: Tuple[Tuple[str, str], ...] = ()  # (src, error message)
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds else float("inf")
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds else float("inf")
+
+
+def compile_patterns(patterns: Sequence[str]) -> Callable[[str], bool]:
+    """One case-sensitive matcher for several glob patterns."""
+    regex = re.compile("|".join(fnmatch.translate(p) for p in patterns))
+    return lambda name: regex.match(name) is not None
+
+
+def plan_moves(
+    records, dest_dir, patterns: Sequence[str] = DEFAULT_PATTERNS
+) -> List[Move]:
+    """Moves of the file records whose name matches one of the patterns.
+
+    Raises ValueError if two matching files have the same name (from
+    different directories of a recursive scan): both would land on the same
+    destination.
+    """
+    matches = compile_patterns(patterns)
+    dest_dir = os.fspath(dest_dir)
+    moves = []
+    sources = {}  # destination -> source
+    for record in records:
+        if record.is_dir or not matches(record.name):
+            continue
+        dst = os.path.join(dest_dir, record.name)
+        if dst in sources:
+            raise ValueError(
+                f"{sources[dst]!r} and {record.path!r} would both move to {dst!r}"
+            )
+        sources[dst] = record.path
+        moves.append(Move(record.path, dst, record.size))
+    return moves
+
+
+def _st_dev(directory: str) -> int:
+    return os.stat(directory).st_dev
+
+
+def _copy_move(move: Move) -> None:
+    part = move.dst + PART_SUFFIX
+    try:
+        copy_file_fast(move.src, part)
+        os.replace(part, move.dst)
+    except BaseException:
+        if os.path.lexists(part):
+            os.remove(part)
+        raise
+    os.remove(move.src)
+
+
+def relocate(
+    moves: Iterable[Move],
+    workers: int = DEFAULT_WORKERS,
+    dry_run: bool = False,
+    progress: Optional[Callable[[RelocationStats], None]] = None,
+) -> RelocationStats:
+    """Performs the moves and returns the final counts and throughput.
+
+    Like ``shutil.move`` into a directory, a move whose destination already
+    exists, or is the destination of an earlier move in the batch, fails (it
+    is reported in ``errors``; nothing is overwritten).
+    With ``dry_run`` the moves are only printed.
+    """
+    start = time.perf_counter()
+    counts = {"files": 0, "renamed": 0, "copied": 0, "bytes": 0}
+    errors = []
+
+    def stats():
+        return RelocationStats(
+            seconds=time.perf_counter() - start, errors=tuple(errors), **counts
+        )
+
+    def finished(move, kind):
+        counts["files"] += 1
+        counts[kind] += 1
+        counts["bytes"] += move.size
+        if progress is not None:
+            progress(stats())
+
+    if dry_run:
+        for move in moves:
+            print(f"[DRY-RUN] move: {move.src} -> {move.dst}")
+        return stats()
+
+    devices = {}  # directory -> st_dev, one stat per directory
+
+    def device(path):
+        directory = os.path.dirname(path)
+        if directory not in devices:
+            devices[directory] = _st_dev(directory)
+        return devices[directory]
+
+    claimed = set()  # destinations of earlier moves, some may still be copying
+
+    workers = max(1, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+
+        def collect(return_when):
+            done, _ = wait(running, return_when=return_when)
+            for future in done:
+                move = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    finished(move, "copied")
+                else:
+                    errors.append((move.src, str(error)))
+
+        for move in moves:
+            try:
+                dst = os.path.normpath(move.dst)
+                if dst in claimed or os.path.lexists(move.dst):
+                    raise FileExistsError(
+                        f"destination path {move.dst!r} already exists"
+                    )
+                claimed.add(dst)
+                if device(move.src) == device(move.dst):
+                    os.rename(move.src, move.dst)
+                    finished(move, "renamed")
+                    continue
+            except OSError as error:
+                errors.append((move.src, str(error)))
+                continue
+            running[pool.submit(_copy_move, move)] = move
+            if len(running) >= 2 * workers:
+                collect(FIRST_COMPLETED)
+        if running:
+            collect(ALL_COMPLETED)
+    return stats()
+
+
+def format_stats(stats: RelocationStats) -> str:
+    """One line summary, e.g. for a progress display."""
+    return (
+        f"{stats.files} files ({stats.renamed} renamed, {stats.copied} copied), "
+        f"{stats.bytes / 2**20:,.1f} MiB in {stats.seconds:.2f}s, "
+        f"{stats.bytes_per_second / 2**20:,.1f} MiB/s, "
+        f"{len(stats.errors)} errors"
+    )
@@ -1,4 +1,13 @@
-import os, shutil
+import os, shutil, mmap, struct, sys, io, errno, time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import accumulate, repeat
+from operator import add
+
+# default size of the chunks read by the binary helpers below (1 MiB)
+DEFAULT_BUFFER_SIZE = 1 << 20
 
 
 def read_file(file_path):
@@ -20,9 +29,12 @@ def write_file(file_path, content):
 
     # append to file
 def append_to_file(file_path, content):
-    """Appends the given content to a file."""
+    """Appends the given content to a file (and extends its line index, if it has one)."""
+    index = _current_line_index(file_path)
     with open(file_path, 'a') as file:
         file.write(content)
+    if index is not None:
+        _extend_line_index(index)
 def write_lines_to_file(file_path, lines):
     """Writes a list of lines to a file."""
     with open(file_path, 'w') as file:
@@ -108,4 +120,361 @@ def count_lines_in_file(file_path):
     """Counts the number of lines in a file."""
     with open(file_path, 'r') as file:
         return sum(1 for line in file)
-    
+
+
+# ---- fast binary I/O: no text decoding, large reads, optional mmap ----
+
+def read_chunks(file_path, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Generator that yields the file in chunks of up to buffer_size bytes.
+
+    Every chunk is a memoryview into one reused buffer (no copy per chunk), so it is
+    only valid until the next chunk is requested; call bytes(chunk) to keep it.
+    """
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(file_path, 'rb', buffering=0) as file:
+        while True:
+            size = file.readinto(buffer)
+            if not size:
+                break
+            yield view[:size]
+
+
+def count_lines_fast(file_path, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Counts lines by counting b"\n" in large binary chunks.
+
+    Same result as count_lines_in_file for "\n" and "\r\n" line endings (a last line
+    without a newline counts too); lone "\r" endings are not treated as line breaks.
+    """
+    buffer = bytearray(buffer_size)
+    newlines = 0
+    last = b"\n"
+    with open(file_path, 'rb', buffering=0) as file:
+        while True:
+            size = file.readinto(buffer)
+            if not size:
+                break
+            chunk = buffer if size == buffer_size else buffer[:size]
+            newlines += chunk.count(b"\n")
+            last = chunk[-1:]
+    return newlines + (last != b"\n")
+
+
+@contextmanager
+def mmap_view(file_path):
+    """Context manager giving a read-only memoryview of the whole file through mmap.
+
+    Slicing the view is zero-copy; the pages are read by the OS on demand. Slices
+    must not be kept after the with block (the mapping is closed there).
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield memoryview(b"")  # empty files cannot be mapped
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
+def count_lines_mmap(file_path, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Counts lines like count_lines_fast, reading through mmap instead of read()."""
+    with open(file_path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            newlines = sum(mapped[start:start + buffer_size].count(b"\n")
+                           for start in range(0, size, buffer_size))
+            return newlines + (mapped[size - 1] != ord("\n"))
+
+
+def read_line_at(file_path, offset):
+    """Returns the line (bytes, including its b"\n") that starts at byte offset."""
+    with open(file_path, 'rb') as file:
+        file.seek(offset)
+        return file.readline()
+
+
+# ---- persistent line-offset index: O(1) access to line n ----
+# The sidecar "<file>.lidx" holds a header (magic, file size, mtime in ns, line count)
+# followed by the byte offset of every line start as little-endian uint64.
+
+LINE_INDEX_SUFFIX = ".lidx"
+_LINE_INDEX_HEADER = struct.Struct("<8sQqQ")
+_LINE_INDEX_MAGIC = b"LIDX0001"
+_line_indexes = {}  # absolute path -> LineIndex, so repeated lookups skip the sidecar read
+
+
+class LineIndex:
+    """Byte offset of every line start of a file, valid for one (size, mtime) state."""
+
+    def __init__(self, file_path, size, mtime_ns, offsets):
+        self.file_path = os.path.abspath(file_path)
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.offsets = offsets  # array("Q")
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def is_current(self):
+        """True while the file still has the size and mtime the index was built for."""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == (self.size, self.mtime_ns)
+
+    def byte_range(self, start, stop):
+        """Byte span [begin, end) covering lines start..stop-1."""
+        end = self.offsets[stop] if stop < len(self.offsets) else self.size
+        return self.offsets[start], end
+
+    def save(self):
+        """Writes the sidecar file next to the indexed file."""
+        offsets = self.offsets
+        if sys.byteorder != "little":
+            offsets = array("Q", offsets)
+            offsets.byteswap()
+        with open(self.file_path + LINE_INDEX_SUFFIX, 'wb') as file:
+            file.write(_LINE_INDEX_HEADER.pack(_LINE_INDEX_MAGIC, self.size, self.mtime_ns, len(offsets)))
+            file.write(offsets.tobytes())
+
+
+def _line_starts(file_path, begin, first_is_start):
+    """Offsets of the line starts found in the file from byte ``begin`` on."""
+    offsets = array("Q")
+    if first_is_start:
+        offsets.append(begin)
+    base = begin
+    with open(file_path, 'rb') as file:
+        file.seek(begin)
+        while True:
+            chunk = file.read(DEFAULT_BUFFER_SIZE)
+            if not chunk:
+                break
+            parts = chunk.split(b"\n")
+            # every b"\n" starts a new line right after it; accumulate() keeps this in C
+            starts = accumulate(map(add, map(len, parts[:-1]), repeat(1)), initial=base)
+            next(starts)
+            offsets.extend(starts)
+            base += len(chunk)
+    if offsets and offsets[-1] == base:
+        offsets.pop()  # a trailing newline does not start another line
+    return offsets
+
+
+def build_line_index(file_path):
+    """Scans the file once, saves the ".lidx" sidecar and returns the LineIndex."""
+    stat = os.stat(file_path)
+    offsets = _line_starts(file_path, 0, stat.st_size > 0)
+    index = LineIndex(file_path, stat.st_size, stat.st_mtime_ns, offsets)
+    index.save()
+    _line_indexes[index.file_path] = index
+    return index
+
+
+def _current_line_index(file_path):
+    """The cached or saved index of the file if it is still valid, else None (never builds)."""
+    key = os.path.abspath(file_path)
+    index = _line_indexes.get(key)
+    if index is not None and index.is_current():
+        return index
+    try:
+        with open(key + LINE_INDEX_SUFFIX, 'rb') as file:
+            magic, size, mtime_ns, count = _LINE_INDEX_HEADER.unpack(file.read(_LINE_INDEX_HEADER.size))
+            if magic != _LINE_INDEX_MAGIC:
+                return None
+            offsets = array("Q")
+            offsets.frombytes(file.read(count * offsets.itemsize))
+    except (FileNotFoundError, struct.error):
+        return None
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    index = LineIndex(key, size, mtime_ns, offsets)
+    if len(offsets) != count or not index.is_current():
+        return None
+    _line_indexes[key] = index
+    return index
+
+
+def _extend_line_index(index):
+    """Adds the lines of data appended since the index was built, then re-saves it."""
+    stat = os.stat(index.file_path)
+    if stat.st_size < index.size:
+        build_line_index(index.file_path)  # truncated: start over
+        return
+    ended_with_newline = index.size == 0
+    if index.size:
+        with open(index.file_path, 'rb') as file:
+            file.seek(index.size - 1)
+            ended_with_newline = file.read(1) == b"\n"
+    index.offsets.extend(_line_starts(index.file_path, index.size, ended_with_newline and stat.st_size > index.size))
+    index.size, index.mtime_ns = stat.st_size, stat.st_mtime_ns
+    index.save()
+
+
+def load_line_index(file_path):
+    """Returns a valid LineIndex for the file, rebuilding it if it is missing or stale."""
+    return _current_line_index(file_path) or build_line_index(file_path)
+
+
+def get_line(file_path, n, encoding="utf-8"):
+    """Returns line n (0-based, with its newline) by seeking straight to it."""
+    index = load_line_index(file_path)
+    if not 0 <= n < len(index):
+        raise IndexError(f"line {n} out of range, the file has {len(index)} lines")
+    begin, end = index.byte_range(n, n + 1)
+    with open(file_path, 'rb') as file:
+        file.seek(begin)
+        return file.read(end - begin).decode(encoding)
+
+
+def get_lines(file_path, start, stop, encoding="utf-8"):
+    """Returns lines start..stop-1 (like list slicing) with one seek and one read."""
+    index = load_line_index(file_path)
+    start, stop, _ = slice(start, stop).indices(len(index))
+    if start >= stop:
+        return []
+    begin, end = index.byte_range(start, stop)
+    with open(file_path, 'rb') as file:
+        file.seek(begin)
+        data = file.read(end - begin)
+    return [line.decode(encoding) for line in io.BytesIO(data)]
+
+
+# ---- bulk copy/move: kernel-side copies, many files in flight ----
+# copy_file_range lets the kernel copy without user-space buffers (and can reflink or
+# copy server-side on filesystems that support it); sendfile and a readinto loop are
+# the fallbacks. A thread pool keeps several files in flight, since every call above
+# releases the GIL.
+
+DEFAULT_TRANSFER_WORKERS = 8
+_KERNEL_CHUNK = 1 << 30  # bytes per copy_file_range/sendfile call
+# errors meaning "this kernel/filesystem cannot do that", not a real I/O failure
+_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTSOCK}
+
+
+class TransferStats(namedtuple("TransferStats", "files bytes seconds")):
+    """Files and bytes transferred by a bulk call, and how long it took."""
+    __slots__ = ()
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes / self.seconds if self.seconds else float("inf")
+
+
+def _copy_range(src_fd, dst_fd, offset):
+    """Copies from offset to EOF with copy_file_range; returns the new offset."""
+    while True:
+        copied = os.copy_file_range(src_fd, dst_fd, _KERNEL_CHUNK, offset, offset)
+        if not copied:
+            return offset
+        offset += copied
+
+
+def _send_file(src_fd, dst_fd, offset):
+    """Copies from offset to EOF with sendfile; returns the new offset."""
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    while True:
+        sent = os.sendfile(dst_fd, src_fd, offset, _KERNEL_CHUNK)
+        if not sent:
+            return offset
+        offset += sent
+
+
+def _copy_buffered(src_fd, dst_fd, offset):
+    """Copies from offset to EOF through one reused buffer."""
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    buffer = bytearray(DEFAULT_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(src_fd, 'rb', buffering=0, closefd=False) as source:
+        while size := source.readinto(buffer):
+            written = 0
+            while written < size:
+                written += os.write(dst_fd, view[written:size])
+            offset += size
+    return offset
+
+
+_COPY_STRATEGIES = [copy for name, copy in (("copy_file_range", _copy_range), ("sendfile", _send_file))
+                    if hasattr(os, name)] + [_copy_buffered]
+
+
+def _copy_file(source_path, destination_path):
+    """copy_file_fast, returning (destination path, bytes copied)."""
+    if os.path.isdir(destination_path):
+        destination_path = os.path.join(destination_path, os.path.basename(source_path))
+    # opening the destination with 'wb' would truncate the source if they are the same file
+    if os.path.exists(destination_path) and os.path.samefile(source_path, destination_path):
+        raise shutil.SameFileError(f"{source_path!r} and {destination_path!r} are the same file")
+    with open(source_path, 'rb', buffering=0) as source, \
+            open(destination_path, 'wb', buffering=0) as destination:
+        src_fd, dst_fd = source.fileno(), destination.fileno()
+        offset = 0
+        for strategy in _COPY_STRATEGIES:
+            try:
+                offset = strategy(src_fd, dst_fd, offset)
+                break
+            except OSError as error:
+                if error.errno not in _UNSUPPORTED or strategy is _copy_buffered:
+                    raise
+                # some data may be copied already; the next strategy resumes at offset
+    shutil.copystat(source_path, destination_path)
+    return destination_path, offset
+
+
+def copy_file_fast(source_path, destination_path):
+    """Same result as copy_file (shutil.copy2), copying the data inside the kernel.
+
+    Returns the destination path. Like copy2, a destination directory gets the
+    source's file name, and permission bits and timestamps are copied over.
+    """
+    return _copy_file(source_path, destination_path)[0]
+
+
+def _move_file(source_path, destination_path):
+    """os.rename when possible, else a kernel-side copy and removal of the source.
+
+    Returns (destination path, bytes moved)."""
+    if os.path.isdir(destination_path):
+        destination_path = os.path.join(destination_path, os.path.basename(source_path))
+    size = os.lstat(source_path).st_size
+    try:
+        os.rename(source_path, destination_path)
+        return destination_path, size
+    except OSError as error:
+        if error.errno != errno.EXDEV:
+            raise
+    result = _copy_file(source_path, destination_path)
+    os.remove(source_path)
+    return result
+
+
+def _bulk(transfer, pairs, workers):
+    start = time.perf_counter()
+    files = total = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        # map() re-raises the first failure, after the files already in flight finish
+        for _, size in pool.map(lambda pair: transfer(*pair), pairs):
+            files += 1
+            total += size
+    return TransferStats(files, total, time.perf_counter() - start)
+
+
+def bulk_copy(pairs, workers=DEFAULT_TRANSFER_WORKERS):
+    """Copies many (source, destination) pairs with copy_file_fast on a thread pool.
+
+    Returns TransferStats(files, bytes, seconds); bytes_per_second is the throughput.
+    """
+    return _bulk(_copy_file, pairs, workers)
+
+
+def bulk_move(pairs, workers=DEFAULT_TRANSFER_WORKERS):
+    """Moves many (source, destination) pairs: os.rename on the same filesystem,
+    a kernel-side copy and delete across filesystems. Returns TransferStats."""
+    return _bulk(_move_file, pairs, workers)
@@ -1,10 +1,14 @@
-import os, shutil, pathlib
+import os, pathlib
 import argparse
-import shutil as _shutil
-import os as _os
+
+from dirScanner import FileRecord, group_by_directory, scan_tree
+from dirSnapshot import SNAPSHOT_SUFFIX, Snapshot, refresh
+from fileRelocator import DEFAULT_PATTERNS, DEFAULT_WORKERS, format_stats, plan_moves, relocate
 
 
 folder = pathlib.Path(__file__).parent.parent.resolve()
+# state of the last --changes run, kept in folder and left out of every report
+SNAPSHOT_NAME = ".file_demo" + SNAPSHOT_SUFFIX
 
 # expanduser example to get desktop path
 desktop_folder = os.path.join(os.path.expanduser("~"), "Desktop")
@@ -23,48 +27,121 @@ def get_file_age_in_days(file_path):
     age_in_days = age_in_seconds / (24 * 3600)
     return age_in_days
 
-def main():
-    for entry in os.scandir(folder):
-        if entry.is_file():
-            print(f"File: {entry.name} - Size: {os.path.getsize(entry.path)} bytes - Extension: {os.path.splitext(entry.name)[1]}")
-        elif entry.is_dir():
-            print(f"Directory: {entry.name}")
-
-
-    # create a folder under the folder called zip
+def print_listing(records):
+    """Prints the files and directories of one directory level."""
+    for record in records:
+        if record.is_dir:
+            print(f"Directory: {record.name}")
+        else:
+            print(f"File: {record.name} - Size: {record.size} bytes - Extension: {record.extension}")
+
+
+def print_walk(records):
+    """Prints every directory of the tree with its files, top-down like os.walk."""
+    for directory, files in group_by_directory(folder, records):
+        print(f"Currently in directory: {directory}")
+        for record in files:
+            print(f" - File: {record.name}")
+
+
+def move_zip_files(records, zip_folder, patterns=DEFAULT_PATTERNS, workers=DEFAULT_WORKERS, dry_run=False):
+    """Moves the top-level files matching patterns (.zip by default) into zip_folder.
+
+    Returns the records with the moved files relocated, so the tree does not
+    have to be scanned again, and the relocation stats.
+    """
+    moves = plan_moves([r for r in records if r.parent == str(folder)], zip_folder, patterns)
+    # os.rename on the same device, concurrent copies across devices
+    stats = relocate(moves, workers, dry_run, progress=print_progress)
+    if dry_run:
+        return records, stats
+    print(f"Moved {format_stats(stats)}")
+    for src, error in stats.errors:
+        print(f"Could not move {src}: {error}")
+    failed = {src for src, _ in stats.errors}
+    moved = {m.src: m.dst for m in moves if m.src not in failed}
+    return [r._replace(path=moved[r.path]) if r.path in moved else r for r in records], stats
+
+
+def print_progress(stats):
+    if stats.files % 100 == 0:
+        print(f"  ... {format_stats(stats)}")
+
+
+def print_changes(changes):
+    """Prints what was added, removed or modified since the last snapshot."""
+    if not changes:
+        print("No changes since the last run")
+    for record in changes.added:
+        print(f"Added: {record.path}")
+    for path in changes.removed:
+        print(f"Removed: {path}")
+    for record in changes.modified:
+        print(f"Modified: {record.path}")
+
+
+def prepare_zip_folder(records, dry_run):
+    """Creates the "zip" folder under folder, adding it to records if it is new."""
     zip_folder = os.path.join(folder, "zip")
-    os.makedirs(zip_folder, exist_ok=True)
-
-    for entry in os.scandir(folder):
-        if entry.is_file() and entry.name.endswith('.zip'):
-            # this can also be done with os.rename
-            shutil.move(entry.path, zip_folder)
-
-
-
-    for entry in os.scandir(folder):
-        if entry.is_file():
-            print(f"File: {entry.name} - Size: {os.path.getsize(entry.path)} bytes - Extension: {os.path.splitext(entry.name)[1]}")
-        elif entry.is_dir():
-            print(f"Directory: {entry.name}")
-
-    for entry in os.walk(folder):
-        print(f"Currently in directory: {entry[0]}")
-        for file_name in entry[2]:
-            print(f" - File: {file_name}")
+    if dry_run:
+        print(f"[DRY-RUN] makedirs: {zip_folder} (exist_ok=True)")
+    elif not os.path.isdir(zip_folder):
+        os.makedirs(zip_folder, exist_ok=True)
+        stat = os.stat(zip_folder)
+        records.append(FileRecord(zip_folder, 0, "", stat.st_mtime, True, stat.st_ino))
+    return zip_folder
+
+
+def main(dry_run=False, patterns=DEFAULT_PATTERNS, workers=DEFAULT_WORKERS, changes_only=False):
+    snapshot_path = os.path.join(folder, SNAPSHOT_NAME)
+    if changes_only:
+        snapshot = Snapshot.load(snapshot_path, folder)
+        if snapshot is not None:
+            return main_changes(snapshot, snapshot_path, dry_run, patterns, workers)
+    root_mtime = os.lstat(folder).st_mtime
+
+    # one walk of the whole tree; every report below reuses its records
+    records = [r for r in scan_tree(folder, workers) if r.path != snapshot_path]
+    print_listing([r for r in records if r.parent == str(folder)])
+
+    zip_folder = prepare_zip_folder(records, dry_run)
+    records, stats = move_zip_files(records, zip_folder, patterns, workers, dry_run)
+    print_listing([r for r in records if r.parent == str(folder)])
+
+    print_walk(records)
+
+    if changes_only and not dry_run:
+        snapshot = Snapshot.from_records(folder, records, root_mtime)
+        if stats.files:  # copies across devices got new inodes, pick them up
+            snapshot, _ = refresh(snapshot, workers, exclude={snapshot_path})
+        snapshot.save(snapshot_path)
+
+
+def main_changes(snapshot, snapshot_path, dry_run, patterns, workers):
+    """Reports and moves only what changed since the snapshot, without a full walk."""
+    current, changes = refresh(snapshot, workers, exclude={snapshot_path})
+    print_changes(changes)
+
+    candidates = [r for r in changes.added + changes.modified if r.parent == str(folder)]
+    if plan_moves(candidates, folder, patterns):
+        zip_folder = prepare_zip_folder([], dry_run)
+        _, stats = move_zip_files(candidates, zip_folder, patterns, workers, dry_run)
+        if stats.files:
+            current, _ = refresh(current, workers, exclude={snapshot_path})
+    if not dry_run and current is not snapshot:
+        current.save(snapshot_path)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Move .zip files into a 'zip' subfolder. Use --dry-run to only show actions.")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making any changes")
+    parser.add_argument("--pattern", action="append", dest="patterns", metavar="GLOB",
+                        help="file name pattern to move, may be repeated (default: *.zip)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="concurrent copies when moving across devices")
+    parser.add_argument("--changes", action="store_true",
+                        help="only report and move what changed since the last --changes run")
     args = parser.parse_args()
     if args.dry_run:
         print("Dry run enabled — no filesystem changes will be made. Actions shown below:")
-        # Replace side-effecting functions with no-op printers
-        def _fake_move(src, dst, *a, **k):
-            print(f"[DRY-RUN] move: {src} -> {dst}")
-        def _fake_makedirs(path, exist_ok=False):
-            print(f"[DRY-RUN] makedirs: {path} (exist_ok={exist_ok})")
-        _shutil.move = _fake_move
-        _os.makedirs = _fake_makedirs
-    main()
\ No newline at end of file
+    main(args.dry_run, tuple(args.patterns or DEFAULT_PATTERNS), args.workers, args.changes)
@@ -1,24 +1,38 @@
 # 1. Local scope: Variables defined within a function are in the local scope of that function.
 
 
-# 2. A variable created in the main body of the program is a global variable and in a global scope. That mean it can be used anywhere including inside functions. 
+# 2. A variable created in the main body of the program is a global variable and in a global scope. That mean it can be used anywhere including inside functions.
 
 
 
 import random
-import datetime
 
+from diceDuel import roll_totals, simulate
 
-player1 = input("Enter name for Player 1: ")
-player2 = input("Enter name for Player 2: ")
 
-random.seed(datetime.datetime.now().timestamp())  # Initialize the random number generator
-roll1 = random.randint(1, 6)
-roll2 = random.randint(1, 6)
+# importing this module runs nothing: the duel only starts from dice_duel_demo()
+def dice_duel_demo(rng=None, duels=100_000):
+    player1 = input("Enter name for Player 1: ")
+    player2 = input("Enter name for Player 2: ")
 
-if roll1 > roll2:
-    print(f"{player1} wins with a roll of {roll1} against {roll2}!")    
-elif roll2 > roll1:
-    print(f"{player2} wins with a roll of {roll2} against {roll1}!")
-else:
-    print(f"It's a tie! Both players rolled a {roll1}!")
\ No newline at end of file
+    # one Random per call instead of reseeding the global generator; pass your own to replay a game
+    rng = rng or random.Random()
+    (roll1,), (roll2,) = roll_totals(rng, duels=1)
+
+    if roll1 > roll2:
+        print(f"{player1} wins with a roll of {roll1} against {roll2}!")
+    elif roll2 > roll1:
+        print(f"{player2} wins with a roll of {roll2} against {roll1}!")
+    else:
+        print(f"It's a tie! Both players rolled a {roll1}!")
+
+    # the odds behind that single roll, from many duels rolled in bulk
+    stats = simulate(duels, rng=rng)
+    for player, name in enumerate((player1, player2)):
+        low, high = stats.interval(player)
+        print(f"{name} wins {stats.probability(player):.1%} of {duels:,} duels (95% CI {low:.1%} - {high:.1%})")
+    print(f"Ties: {stats.tie_probability:.1%}")
+
+
+if __name__ == "__main__":
+    dice_duel_demo()
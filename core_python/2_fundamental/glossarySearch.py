@@ -0,0 +1,299 @@
+"""Prefix and fuzzy search over an acronym glossary.
+
+Both acronyms and the words of their definitions are indexed, case-folded:
+
+* prefix search bisects a sorted array of distinct terms, so it costs
+  O(log n) plus the matches returned;
+* fuzzy search uses symmetric deletes. Every term is indexed under all
+  variants with up to ``max_distance`` characters deleted, and a query
+  looks up its own delete variants. Each variant is stored as one 64-bit
+  integer (variant hash in the high bits, term id in the low bits) in a
+  sorted ``array("q")``, which is far smaller than a dict of strings.
+  Candidates are verified with the optimal string alignment distance
+  (Levenshtein plus adjacent transpositions), so results are exact.
+
+``suggest`` merges both, ranked: exact acronym, acronym prefix, acronym
+within the edit distance, then definitions containing a matching word.
+Short queries get a smaller edit distance (see ``distance_for``), since
+two edits on a three letter acronym match almost anything.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Mapping, NamedTuple, Tuple
+
+from glossaryStore import parse_glossary_line
+
+DEFAULT_MAX_DISTANCE = 2
+DEFAULT_LIMIT = 10
+MAX_FUZZY_TERM_LENGTH = 24  # longer words are only found by prefix
+
+# ranks of the match kinds, best first
+EXACT, PREFIX, FUZZY, DEFINITION = range(4)
+
+
+class Suggestion(NamedTuple):
+    acronym: str
+    definition: str
+    kind: int  # EXACT, PREFIX, FUZZY or DEFINITION
+    distance: int  # edit distance of the matched term (0 for exact and prefix)
+
+
+def distance_for(query: str, max_distance: int = DEFAULT_MAX_DISTANCE) -> int:
+    """Edit distance allowed for a query: 0 up to 2 chars, 1 up to 5, then max_distance."""
+    if len(query) <= 2:
+        return 0
+    return min(max_distance, 1 if len(query) <= 5 else 2)
+
+
+def _deletes(term: str, depth: int) -> List[set]:
+    """Variants of term by number of deleted characters: [{term}, 1 deleted, ...]."""
+    levels = [{term}]
+    for _ in range(depth):
+        levels.append({v[:i] + v[i + 1 :] for v in levels[-1] for i in range(len(v))})
+    return levels
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance of a and b, or limit + 1 if it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    # the common prefix and suffix never cost anything, usually little is left
+    start, end_a, end_b = 0, len(a), len(b)
+    while start < end_a and start < end_b and a[start] == b[start]:
+        start += 1
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    longest = max(len(a), len(b))
+    if longest <= 2:
+        # the first and the last characters differ now: only "ab"/"ba" beats the length
+        distance = 1 if len(a) == len(b) == 2 and a == b[::-1] else longest
+        return min(distance, limit + 1)
+    if limit <= 1:
+        return limit + 1  # a single edit leaves at most two characters after stripping
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = previous[j - 1] + (ca != cb)
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if (
+                previous2 is not None
+                and j > 1
+                and ca == b[j - 2]
+                and a[i - 2] == cb
+                and previous2[j - 2] + 1 < cost
+            ):
+                cost = previous2[j - 2] + 1
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+class TermIndex:
+    """Sorted distinct terms with prefix and bounded-edit-distance lookup."""
+
+    def __init__(self, terms: Iterable[str], max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.terms: List[str] = sorted(set(terms))
+        self.max_distance = max_distance
+        self._id_bits = max(1, len(self.terms).bit_length())
+        self._hash_mask = (1 << (63 - self._id_bits)) - 1
+        # one sorted array per number of deleted characters, so that a query
+        # allowed d edits only meets variants with at most d deletions
+        packed = [[] for _ in range(max_distance + 1)]
+        id_bits, hash_mask = self._id_bits, self._hash_mask
+        for term_id, term in enumerate(self.terms):
+            if len(term) <= MAX_FUZZY_TERM_LENGTH:
+                for depth, variants in enumerate(_deletes(term, max_distance)):
+                    packed[depth].extend(
+                        [(hash(v) & hash_mask) << id_bits | term_id for v in variants]
+                    )
+        self._variants = []
+        for depth_variants in packed:
+            depth_variants.sort()
+            self._variants.append(array("q", depth_variants))
+            depth_variants.clear()
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def find(self, term: str) -> int:
+        """Id of the term, or -1."""
+        i = bisect_left(self.terms, term)
+        return i if i < len(self.terms) and self.terms[i] == term else -1
+
+    def prefix(self, prefix: str) -> Iterator[int]:
+        """Ids of the terms starting with prefix, in sorted order."""
+        terms = self.terms
+        i = bisect_left(terms, prefix)
+        while i < len(terms) and terms[i].startswith(prefix):
+            yield i
+            i += 1
+
+    def _lookup(self, variant: str, depth: int, candidates: set) -> None:
+        variants, bits = self._variants[depth], self._id_bits
+        h = hash(variant) & self._hash_mask
+        i = bisect_left(variants, h << bits)
+        end = (h + 1) << bits
+        id_mask = (1 << bits) - 1
+        while i < len(variants) and variants[i] < end:
+            candidates.add(variants[i] & id_mask)
+            i += 1
+
+    def fuzzy(self, query: str, max_distance: int) -> List[Tuple[int, int]]:
+        """(distance, id) of the terms within max_distance of query, closest first."""
+        max_distance = min(max_distance, self.max_distance)
+        candidates = set()
+        for variants in _deletes(query, max_distance):
+            for variant in variants:
+                for depth in range(max_distance + 1):
+                    self._lookup(variant, depth, candidates)
+        terms, found = self.terms, []
+        for term_id in candidates:
+            distance = edit_distance(query, terms[term_id], max_distance)
+            if distance <= max_distance:
+                found.append((distance, term_id))
+        found.sort(
+            key=lambda hit: (hit[0], abs(len(terms[hit[1]]) - len(query)), hit[1])
+        )
+        return found
+
+
+class GlossarySearch:
+    """Ranked prefix and fuzzy suggestions over (acronym, definition) pairs."""
+
+    def __init__(
+        self,
+        entries: Iterable[Tuple[str, str]],
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        definitions: bool = True,
+    ):
+        self.acronyms: List[str] = []
+        self.definitions: List[str] = []
+        for acronym, definition in entries:
+            self.acronyms.append(acronym)
+            self.definitions.append(definition)
+        self.max_distance = max_distance
+        folded = [acronym.casefold() for acronym in self.acronyms]
+        self.keys = TermIndex(folded, max_distance)
+        # term id -> entry ids, for the (rare) acronyms that differ only by case
+        self._key_entries = self._postings(self.keys, ((k,) for k in folded))
+        self.words = None
+        if definitions:
+            words = [
+                set(definition.casefold().split()) for definition in self.definitions
+            ]
+            self.words = TermIndex(set().union(*words), max_distance)
+            self._word_entries = self._postings(self.words, words)
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[str, str], **options) -> "GlossarySearch":
+        return cls(((str(k), str(v)) for k, v in mapping.items()), **options)
+
+    @classmethod
+    def from_file(cls, path, encoding: str = "utf-8", **options) -> "GlossarySearch":
+        """Index of an "ACR: definition" / "ACR - definition" text file."""
+        with open(path, "r", encoding=encoding) as file:
+            return cls(filter(None, map(parse_glossary_line, file)), **options)
+
+    @staticmethod
+    def _postings(
+        index: TermIndex, terms_per_entry: Iterable[Iterable[str]]
+    ) -> List[array]:
+        postings = [array("l") for _ in range(len(index))]
+        for entry_id, terms in enumerate(terms_per_entry):
+            for term in terms:
+                postings[index.find(term)].append(entry_id)
+        return postings
+
+    def __len__(self) -> int:
+        return len(self.acronyms)
+
+    def _suggestion(self, entry_id: int, kind: int, distance: int) -> Suggestion:
+        return Suggestion(
+            self.acronyms[entry_id], self.definitions[entry_id], kind, distance
+        )
+
+    def prefix(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Suggestion]:
+        """Acronyms starting with query (case-insensitive), in sorted order."""
+        found = []
+        for term_id in self.keys.prefix(query.casefold()):
+            for entry_id in self._key_entries[term_id]:
+                found.append(self._suggestion(entry_id, PREFIX, 0))
+            if len(found) >= limit:
+                break
+        return found[:limit]
+
+    def fuzzy(
+        self, query: str, max_distance: int = None, limit: int = DEFAULT_LIMIT
+    ) -> List[Suggestion]:
+        """Acronyms within the edit distance of query, closest first."""
+        query = query.casefold()
+        if max_distance is None:
+            max_distance = distance_for(query, self.max_distance)
+        found = []
+        for distance, term_id in self.keys.fuzzy(query, max_distance):
+            for entry_id in self._key_entries[term_id]:
+                found.append(self._suggestion(entry_id, FUZZY, distance))
+            if len(found) >= limit:
+                break
+        return found[:limit]
+
+    def suggest(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Suggestion]:
+        """Ranked suggestions: exact, prefix, fuzzy acronym, then definition matches."""
+        query = query.strip()
+        folded = query.casefold()
+        if not folded:
+            return []
+        seen = set()
+        found: List[Suggestion] = []
+
+        def add(entry_id, kind, distance):
+            if entry_id not in seen:
+                seen.add(entry_id)
+                found.append(self._suggestion(entry_id, kind, distance))
+
+        term_id = self.keys.find(folded)
+        if term_id >= 0:
+            for entry_id in self._key_entries[term_id]:
+                add(entry_id, EXACT, 0)
+        for term_id in self.keys.prefix(folded):
+            if len(found) >= limit:
+                return found
+            for entry_id in self._key_entries[term_id]:
+                add(entry_id, PREFIX, 0)
+        for distance, term_id in self.keys.fuzzy(
+            folded, distance_for(folded, self.max_distance)
+        ):
+            if len(found) >= limit:
+                return found
+            for entry_id in self._key_entries[term_id]:
+                add(entry_id, FUZZY, distance)
+        if self.words is not None:
+            for word in folded.split():
+                hits = (
+                    [(0, term_id) for term_id in self.words.prefix(word)]
+                    if len(word) >= 3
+                    else []
+                )
+                hits += self.words.fuzzy(word, distance_for(word, self.max_distance))
+                for distance, term_id in hits:
+                    for entry_id in self._word_entries[term_id]:
+                        if len(found) >= limit:
+                            return found
+                        add(entry_id, DEFINITION, distance)
+        return found
+
+
+def did_you_mean(query: str, glossary: Mapping[str, str], limit: int = 3) -> List[str]:
+    """Acronyms of a small dict that the query was probably meant to be."""
+    search = GlossarySearch.from_mapping(glossary, definitions=False)
+    return [s.acronym for s in search.suggest(query, limit) if s.kind != EXACT]
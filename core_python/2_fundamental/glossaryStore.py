@@ -0,0 +1,305 @@
+"""Acronym glossary store: an append-only log with an in-memory hash index.
+
+Every change appends one line to the log:
+
+    S<TAB>ACR<TAB>definition      set (insert or replace)
+    D<TAB>ACR                     delete
+
+The index maps each live acronym to the byte offset and length of its
+latest definition in the log. It is built by a single scan the first
+time the store is queried. After that a lookup is one dict probe plus
+one seek and read, and an upsert or delete is one dict update plus one
+buffered append. Replaced and deleted records are garbage. Once garbage
+makes up more than ``compact_ratio`` of the log, ``compact`` rewrites the
+log with the live records only, so repeated updates do not grow it
+without bound.
+
+``import_file`` reads both existing glossary formats: "ACR: definition"
+(output.txt) and "ACR - definition" (input.txt).
+"""
+
+import mmap
+import os
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+DEFAULT_COMPACT_RATIO = 0.5  # compact once garbage exceeds half of the records
+DEFAULT_MIN_GARBAGE = 1024  # ...and there are at least this many garbage records
+_IMPORT_BATCH = 65_536
+_RECORD_SHAPES = {(b"S", 3), (b"D", 2)}  # (kind, tab-separated fields)
+
+
+def parse_glossary_line(line: str) -> Optional[Tuple[str, str]]:
+    """(acronym, definition) from "ACR: definition" or "ACR - definition".
+
+    The earliest separator wins, so a definition may contain the other one.
+    Returns None for blank or unrecognized lines.
+    """
+    colon, dash = line.find(": "), line.find(" - ")
+    if colon < 0 and dash < 0:
+        return None
+    if dash < 0 or 0 <= colon < dash:
+        acronym, definition = line[:colon], line[colon + 2 :]
+    else:
+        acronym, definition = line[:dash], line[dash + 3 :]
+    acronym = acronym.strip()
+    return (acronym, definition.strip()) if acronym else None
+
+
+def check_entry(acronym: str, definition: str = "") -> None:
+    """Raises ValueError for an entry the log cannot hold."""
+    if not acronym or any(c in acronym for c in "\t\n\r"):
+        raise ValueError(f"invalid acronym {acronym!r}")
+    if "\n" in definition or "\r" in definition:
+        raise ValueError("a definition must fit on one line")
+
+
+class GlossaryStore:
+    """Dict-like acronym -> definition store kept in an append-only log file."""
+
+    def __init__(
+        self,
+        path,
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+        min_garbage: int = DEFAULT_MIN_GARBAGE,
+    ):
+        self.path = os.fspath(path)
+        self.compact_ratio = compact_ratio
+        self.min_garbage = min_garbage
+        self._index: Optional[Dict[str, int]] = None  # acronym -> offset << 32 | length
+        self._garbage = 0  # records in the log that no longer count
+        self._log = None  # append handle, opened on the first write
+        self._reader = None  # read handle, opened on the first lookup
+        self._size = 0  # bytes in the log, written or buffered
+
+    # -- reading --
+
+    def _loaded(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index, self._garbage, self._size = self._scan()
+        return self._index
+
+    def _scan(self) -> Tuple[Dict[str, int], int, int]:
+        """One pass over the log: the index, the garbage count and the log size.
+
+        The size ends at the last complete line. A torn last write (or one a
+        writer is still appending) is left alone here; the first append of
+        this store cuts it off. Malformed lines are skipped and counted as
+        garbage, so compaction drops them.
+        """
+        index: Dict[str, int] = {}
+        garbage = 0
+        try:
+            file = open(self.path, "rb")
+        except FileNotFoundError:
+            return index, 0, 0
+        with file:
+            offset = 0
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                fields = line[:-1].split(b"\t", 2)
+                try:
+                    key = fields[1].decode("utf-8")
+                except (IndexError, UnicodeDecodeError):
+                    key = ""
+                if not key or (fields[0], len(fields)) not in _RECORD_SHAPES:
+                    garbage += 1
+                elif fields[0] == b"S":
+                    if key in index:
+                        garbage += 1
+                    start = offset + len(fields[1]) + 3  # "S\t" + key + "\t"
+                    index[key] = start << 32 | (len(line) - (start - offset) - 1)
+                else:
+                    # the tombstone itself, and the record it deletes
+                    garbage += 1 + (index.pop(key, None) is not None)
+                offset += len(line)
+        return index, garbage, offset
+
+    def _read(self, packed: int) -> str:
+        if self._log is not None:
+            self._log.flush()
+        if self._reader is None:
+            self._reader = open(self.path, "rb", buffering=0)
+        self._reader.seek(packed >> 32)
+        return self._reader.read(packed & 0xFFFFFFFF).decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._loaded())
+
+    def __contains__(self, acronym: str) -> bool:
+        return acronym in self._loaded()
+
+    def __getitem__(self, acronym: str) -> str:
+        return self._read(self._loaded()[acronym])
+
+    def get(self, acronym: str, default: Optional[str] = None) -> Optional[str]:
+        packed = self._loaded().get(acronym)
+        return default if packed is None else self._read(packed)
+
+    def keys(self) -> Iterator[str]:
+        return iter(list(self._loaded()))
+
+    def _raw_items(self) -> Iterator[Tuple[str, bytes]]:
+        """(acronym, encoded definition) pairs, read through one mapping of the log."""
+        index = self._loaded()
+        if not index:
+            return
+        if self._log is not None:
+            self._log.flush()
+        with open(self.path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            for key, packed in list(index.items()):
+                start = packed >> 32
+                yield key, mapped[start : start + (packed & 0xFFFFFFFF)]
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """All (acronym, definition) pairs."""
+        for key, value in self._raw_items():
+            yield key, value.decode("utf-8")
+
+    # -- writing --
+
+    def _append(self, data: bytes) -> int:
+        """Appends raw records and returns the offset they start at."""
+        if self._log is None:
+            if os.path.exists(self.path) and os.path.getsize(self.path) > self._size:
+                # a torn last write, from a writer that died mid-record
+                os.truncate(self.path, self._size)
+            self._log = open(self.path, "ab", buffering=1 << 20)
+        offset = self._size
+        self._log.write(data)
+        self._size += len(data)
+        return offset
+
+    def _set_record(
+        self, acronym: str, definition: str, offset: int
+    ) -> Tuple[bytes, int]:
+        key, value = acronym.encode("utf-8"), definition.encode("utf-8")
+        record = b"S\t" + key + b"\t" + value + b"\n"
+        return record, (offset + len(key) + 3) << 32 | len(value)
+
+    def upsert(self, acronym: str, definition: str) -> None:
+        """Adds the acronym or replaces its definition."""
+        check_entry(acronym, definition)
+        index = self._loaded()
+        record, packed = self._set_record(acronym, definition, self._size)
+        self._append(record)
+        if acronym in index:
+            self._garbage += 1
+        index[acronym] = packed
+        self._maybe_compact()
+
+    __setitem__ = upsert
+
+    def delete(self, acronym: str) -> bool:
+        """Removes the acronym; False if it was not there."""
+        index = self._loaded()
+        if acronym not in index:
+            return False
+        self._append(b"D\t" + acronym.encode("utf-8") + b"\n")
+        del index[acronym]
+        self._garbage += 2  # the old record and the tombstone
+        self._maybe_compact()
+        return True
+
+    def __delitem__(self, acronym: str) -> None:
+        if not self.delete(acronym):
+            raise KeyError(acronym)
+
+    def update(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """Upserts many (acronym, definition) pairs, appended in large batches."""
+        index = self._loaded()
+        count = 0
+        batch, packed_batch = [], []
+        offset = self._size
+
+        def flush():
+            self._append(b"".join(batch))
+            for acronym, packed in packed_batch:
+                if acronym in index:
+                    self._garbage += 1
+                index[acronym] = packed
+            batch.clear()
+            packed_batch.clear()
+
+        for acronym, definition in pairs:
+            check_entry(acronym, definition)
+            record, packed = self._set_record(acronym, definition, offset)
+            batch.append(record)
+            packed_batch.append((acronym, packed))
+            offset += len(record)
+            count += 1
+            if len(batch) >= _IMPORT_BATCH:
+                flush()
+        if batch:
+            flush()
+        self._maybe_compact()
+        return count
+
+    def import_file(self, path, encoding: str = "utf-8") -> int:
+        """Upserts every "ACR: definition" / "ACR - definition" line of a text file."""
+        with open(path, "r", encoding=encoding) as file:
+            return self.update(filter(None, map(parse_glossary_line, file)))
+
+    def clear(self) -> None:
+        """Removes every entry and empties the log."""
+        self.close()
+        with open(self.path, "wb"):
+            pass
+        self._index, self._garbage, self._size = {}, 0, 0
+
+    # -- compaction --
+
+    @property
+    def garbage(self) -> int:
+        self._loaded()
+        return self._garbage
+
+    def _maybe_compact(self) -> None:
+        garbage = self._garbage
+        if garbage >= self.min_garbage and garbage > self.compact_ratio * (
+            garbage + len(self._index)
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrites the log with the live records only."""
+        temporary = self.path + ".compact"
+        new_index: Dict[str, int] = {}
+        with open(temporary, "wb", buffering=1 << 20) as out:
+            offset = 0
+            batch = []
+            for acronym, value in self._raw_items():
+                key = acronym.encode("utf-8")
+                record = b"S\t" + key + b"\t" + value + b"\n"
+                new_index[acronym] = (offset + len(key) + 3) << 32 | len(value)
+                batch.append(record)
+                offset += len(record)
+                if len(batch) >= _IMPORT_BATCH:
+                    out.write(b"".join(batch))
+                    batch.clear()
+            out.write(b"".join(batch))
+        self.close()
+        os.replace(temporary, self.path)
+        self._index, self._garbage, self._size = new_index, 0, offset
+
+    # -- lifetime --
+
+    def flush(self) -> None:
+        if self._log is not None:
+            self._log.flush()
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def __enter__(self) -> "GlossaryStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,303 @@
+"""Pooled, retrying, caching HTTP client for the JSON API demos.
+
+``HttpClient`` keeps one ``requests.Session`` whose ``HTTPAdapter`` holds a
+pool of keep-alive connections per host, so repeated calls skip the TCP
+(and TLS) handshake. Every request has a timeout. Connection errors and
+429/5xx answers (but not read timeouts) are retried with exponential
+backoff (urllib3 ``Retry``, which also honours ``Retry-After``).
+
+Successful GET responses are cached in memory for ``cache_ttl`` seconds,
+or for ``max-age`` when the server sends one. A fresh entry is answered
+without any network traffic. Once an entry is stale, it is revalidated
+with ``If-None-Match`` / ``If-Modified-Since`` when the server gave an
+ETag or Last-Modified: a ``304 Not Modified`` refreshes the entry and
+reuses its body, so only headers cross the wire. ``iter_json_array``
+streams a large array response instead, item by item.
+
+``AsyncHttpClient`` runs the same client from coroutines on a thread pool
+of its own, sized to the wanted concurrency (the loop's default executor
+may have as few as five threads), so many endpoints can be fetched
+concurrently while sharing the connection pool and the cache.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+import jsonCodec
+
+DEFAULT_TIMEOUT = (3.05, 10.0)  # (connect, read) seconds
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.3  # seconds, doubled on every retry
+DEFAULT_POOL_SIZE = 10  # keep-alive connections per host
+DEFAULT_CACHE_TTL = 60.0  # seconds, when the server does not say otherwise
+DEFAULT_CACHE_SIZE = 1024  # cached responses, least recently used evicted first
+DEFAULT_CONCURRENCY = 10
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class CachedResponse(NamedTuple):
+    url: str
+    status: int
+    headers: CaseInsensitiveDict  # "etag" and "ETag" are the same header
+    content: bytes
+    expires: float  # time.monotonic() after which the entry must be revalidated
+    from_cache: bool = False
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("Last-Modified")
+
+    def json(self) -> Any:
+        return jsonCodec.loads(self.content)
+
+
+def _max_age(headers) -> Optional[float]:
+    """Seconds from Cache-Control max-age, 0 for no-cache, None if not given."""
+    for directive in headers.get("Cache-Control", "").lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name in ("no-cache", "no-store"):
+            return 0.0
+        if name == "max-age":
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                return 0.0
+    return None
+
+
+class ResponseCache:
+    """Thread-safe LRU map of URL -> ``CachedResponse``."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0  # answered without a request
+        self.revalidated = 0  # answered by a 304
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def put(self, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[entry.url] = entry
+            self._entries.move_to_end(entry.url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def count(self, counter: str) -> None:
+        """Adds one to ``hits``, ``revalidated`` or ``misses``."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+class HttpClient:
+    """GET JSON APIs over a pooled keep-alive session, with retries and a TTL cache."""
+
+    def __init__(
+        self,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache = cache if cache is not None else ResponseCache()
+        retry = Retry(
+            total=retries,
+            read=False,  # a read timeout is raised as is, not retried into N x timeout
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,  # the last answer is returned, raise_for_status decides
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _expires(self, headers) -> float:
+        max_age = _max_age(headers)
+        return time.monotonic() + (self.cache_ttl if max_age is None else max_age)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> CachedResponse:
+        """The response for url, from the cache while it is fresh.
+
+        Raises ``requests.HTTPError`` for error statuses (after the retries)
+        and ``requests.RequestException`` for connection failures and timeouts.
+        """
+        if params:
+            url = requests.Request("GET", url, params=params).prepare().url
+        cached = self.cache.get(url) if self.cache_ttl > 0 else None
+        if cached is not None and time.monotonic() < cached.expires:
+            self.cache.count("hits")
+            return cached._replace(from_cache=True)
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304 and cached is not None:
+            self.cache.count("revalidated")
+            merged = CaseInsensitiveDict(cached.headers)
+            merged.update(response.headers)
+            entry = cached._replace(headers=merged, expires=self._expires(merged))
+            self.cache.put(entry)
+            return entry._replace(from_cache=True)
+
+        response.raise_for_status()
+        self.cache.count("misses")
+        entry = CachedResponse(
+            url,
+            response.status_code,
+            CaseInsensitiveDict(response.headers),
+            response.content,
+            self._expires(response.headers),
+        )
+        no_store = "no-store" in response.headers.get("Cache-Control", "").lower()
+        # a 304 with nothing to merge into has no body worth keeping
+        if self.cache_ttl > 0 and not no_store and response.status_code != 304:
+            self.cache.put(entry)
+        return entry
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self.get(url, params).json()
+
+    def iter_json_array(
+        self,
+        url: str,
+        key: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """Items of a (large) JSON array response, decoded while they stream in.
+
+        ``key`` selects the array under that key of a top-level object. The
+        body is never held in memory as a whole, so it bypasses the cache.
+        """
+        with self.session.get(
+            url, params=params, stream=True, timeout=self.timeout
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # gzip/deflate undone by urllib3
+            yield from jsonCodec.iter_array(response.raw, key)
+
+    def get_many(
+        self, urls: Iterable[str], workers: int = DEFAULT_CONCURRENCY
+    ) -> List[CachedResponse]:
+        """Responses for urls, in order, fetched on a thread pool."""
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            return list(pool.map(self.get, urls))
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AsyncHttpClient:
+    """Coroutine front end of ``HttpClient``: at most ``concurrency`` requests in flight."""
+
+    def __init__(
+        self,
+        client: Optional[HttpClient] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **options,
+    ):
+        self.client = client if client is not None else HttpClient(**options)
+        self.concurrency = concurrency
+        # the pool size is the bound on requests in flight
+        self._executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+
+    async def get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> CachedResponse:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.client.get, url, params)
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return (await self.get(url, params)).json()
+
+    async def get_many(
+        self, urls: Iterable[str], return_exceptions: bool = False
+    ) -> List[Union[CachedResponse, BaseException]]:
+        """Responses for urls, in order, fetched concurrently."""
+        return await asyncio.gather(
+            *(self.get(url) for url in urls), return_exceptions=return_exceptions
+        )
+
+    def shutdown(self) -> None:
+        """Stops the worker threads; the wrapped client stays open."""
+        self._executor.shutdown()
+
+    def close(self) -> None:
+        self.shutdown()
+        self.client.close()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+
+_default_client: Optional[HttpClient] = None
+_default_lock = threading.Lock()
+
+
+def default_client() -> HttpClient:
+    """The process-wide client, so every demo shares one pool and one cache."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
@@ -0,0 +1,165 @@
+"""Unique ID allocation for threads and processes, handed out in blocks.
+
+An ``IdAllocator`` gives each thread a block of ``block_size`` consecutive
+IDs and serves ``next_id()`` from that block with no lock at all: the block
+lives in a ``threading.local`` and is consumed through a ``range``
+iterator. Only when a block runs out does the thread go back to the block
+source, which is the one place that synchronizes:
+
+* ``LocalBlockSource``   a counter behind a ``threading.Lock`` (one process)
+* ``SharedBlockSource``  a counter in shared memory (``multiprocessing.Value``),
+                         for worker processes started with it
+* ``FileBlockSource``    a counter in a file under an exclusive lock
+                         (``fcntl.flock``, or ``msvcrt.locking`` on Windows),
+                         for any processes that agree on the path
+
+Every ID is handed out once. IDs increase within each thread; across
+threads they interleave by block, so a later ``next_id()`` in another
+thread can return a smaller number. A forked child starts with no blocks,
+so it never reuses what its parent was still holding (with a shared or
+file source; a ``LocalBlockSource`` counter is copied by the fork and is
+only unique within one process).
+"""
+
+import os
+import threading
+import weakref
+
+DEFAULT_BLOCK_SIZE = 1024
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)  # gives up after ~10 s
+                return
+            except OSError:
+                continue
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class LocalBlockSource:
+    """Blocks from an in-process counter; IDs start at ``start``."""
+
+    def __init__(self, start: int = 1):
+        self._next = start
+        self._lock = threading.Lock()
+
+    def take(self, size: int) -> int:
+        """Reserves ``size`` IDs and returns the first."""
+        with self._lock:
+            first = self._next
+            self._next = first + size
+        return first
+
+
+class SharedBlockSource:
+    """Blocks from a 64-bit counter in shared memory.
+
+    Pass the source to worker processes when they start (``Process`` args,
+    or a pool ``initializer``); like any ``multiprocessing.Value`` it cannot
+    be sent through a queue afterwards.
+    """
+
+    def __init__(self, start: int = 1, context=None):
+        import multiprocessing
+
+        self._next = (context or multiprocessing).Value("q", start)
+
+    def take(self, size: int) -> int:
+        with self._next.get_lock():
+            first = self._next.value
+            self._next.value = first + size
+        return first
+
+
+class FileBlockSource:
+    """Blocks from a counter kept in the file at ``path``.
+
+    Each ``take`` opens the file, locks it, reads the next free ID, writes
+    back the end of the block and closes it again. Opening it every time
+    keeps the lock per process: a descriptor inherited through ``fork``
+    shares its ``flock`` with the parent and would not exclude it.
+    """
+
+    _WIDTH = 20  # the counter is rewritten in place, always with the same width
+
+    def __init__(self, path, start: int = 1):
+        self.path = os.fspath(path)
+        self.start = start
+
+    def take(self, size: int) -> int:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock(fd)
+            try:
+                text = os.read(fd, self._WIDTH).strip()
+                first = int(text) if text else self.start
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, b"%0*d" % (self._WIDTH, first + size))
+            finally:
+                _unlock(fd)
+        finally:
+            os.close(fd)
+        return first
+
+
+_allocators = weakref.WeakSet()
+
+
+def _forget_blocks() -> None:
+    # in a forked child the parent's blocks are still in every threading.local
+    for allocator in list(_allocators):
+        allocator._local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_blocks)
+
+
+class IdAllocator:
+    """Hands out unique IDs; each thread draws from a block of its own."""
+
+    def __init__(self, source=None, block_size: int = DEFAULT_BLOCK_SIZE):
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        self.source = source if source is not None else LocalBlockSource()
+        self.block_size = block_size
+        self._local = threading.local()
+        _allocators.add(self)
+
+    def next_id(self) -> int:
+        try:
+            return next(self._local.ids)
+        except (AttributeError, StopIteration):
+            # first call in this thread, or block used up
+            first = self.source.take(self.block_size)
+            ids = self._local.ids = iter(range(first, first + self.block_size))
+            return next(ids)
+
+    def __getstate__(self):
+        # blocks belong to the threads of this process; a copy starts without any
+        return {"source": self.source, "block_size": self.block_size}
+
+    def __setstate__(self, state) -> None:
+        self.__init__(**state)
+
+    def reserve(self, count: int) -> range:
+        """``count`` consecutive IDs in one go, taken straight from the source."""
+        first = self.source.take(count)
+        return range(first, first + count)
@@ -0,0 +1,230 @@
+"""JSON encoding with the fastest available backend, plus streaming helpers.
+
+``dumps``/``loads`` go through the first backend of ``PREFERRED_BACKENDS``
+that is installed: orjson, then ujson, then the standard library ``json``.
+All of them produce compact UTF-8 ``bytes``. Non-string dict keys are
+converted to strings, as ``json.dumps`` does. Objects that orjson cannot
+encode (e.g. integers over 64 bits) fall back to ``json``.
+
+For documents too large to hold in memory twice:
+
+* ``dump_lines``/``iter_lines`` write and read JSON lines, one record per
+  line;
+* ``iter_array`` decodes the items of a top-level array, or of an array
+  under one key of a top-level object (``{"number": 7, "people": [...]}``),
+  one at a time while the file is read in chunks. Memory stays at one
+  chunk plus one item, whatever the size of the document.
+"""
+
+import codecs
+import json
+import os
+import re
+from typing import IO, Any, Callable, Iterable, Iterator, List, NamedTuple, Optional
+
+PREFERRED_BACKENDS = ("orjson", "ujson", "json")
+DEFAULT_CHUNK_SIZE = 1 << 16  # characters read per refill by iter_array
+_LINES_BATCH = 4096  # records encoded per write by dump_lines
+
+
+class Backend(NamedTuple):
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Any], Any]  # bytes or str
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _load_backend(name: str) -> Backend:
+    """The named backend; raises ImportError if its package is missing."""
+    if name == "orjson":
+        import orjson
+
+        def dumps(obj, _dumps=orjson.dumps, _option=orjson.OPT_NON_STR_KEYS):
+            try:
+                return _dumps(obj, option=_option)
+            except orjson.JSONEncodeError:
+                return _json_dumps(obj)  # e.g. int beyond 64 bits
+
+        return Backend(name, dumps, orjson.loads)
+    if name == "ujson":
+        import ujson
+
+        def dumps(obj, _dumps=ujson.dumps):
+            return _dumps(obj, ensure_ascii=False).encode("utf-8")
+
+        return Backend(name, dumps, ujson.loads)
+    if name == "json":
+        return Backend(name, _json_dumps, json.loads)
+    raise ValueError(f"unknown JSON backend {name!r}")
+
+
+def available_backends() -> List[str]:
+    """Names of the installed backends, fastest first."""
+    names = []
+    for name in PREFERRED_BACKENDS:
+        try:
+            _load_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend(name: Optional[str] = None) -> Backend:
+    """The named backend, or the fastest installed one."""
+    if name is not None:
+        return _load_backend(name)
+    return _load_backend(available_backends()[0])
+
+
+backend = get_backend(os.environ.get("JSON_BACKEND") or None)
+
+
+def dumps(obj: Any) -> bytes:
+    return backend.dumps(obj)
+
+
+def loads(data) -> Any:
+    return backend.loads(data)
+
+
+# -- JSON lines --
+
+
+def dump_lines(
+    records: Iterable[Any], file: IO[bytes], codec: Optional[Backend] = None
+) -> int:
+    """Writes one JSON document per line to a binary file; returns the count."""
+    encode = (codec or backend).dumps
+    count = 0
+    batch = []
+    for record in records:
+        batch.append(encode(record))
+        if len(batch) >= _LINES_BATCH:
+            file.write(b"\n".join(batch) + b"\n")
+            count += len(batch)
+            batch.clear()
+    if batch:
+        file.write(b"\n".join(batch) + b"\n")
+        count += len(batch)
+    return count
+
+
+def iter_lines(file: IO[bytes], codec: Optional[Backend] = None) -> Iterator[Any]:
+    """The documents of a JSON lines file, skipping blank lines."""
+    decode = (codec or backend).loads
+    for line in file:
+        if not line.isspace():
+            yield decode(line)
+
+
+# -- incremental array decoding --
+
+_decoder = json.JSONDecoder()
+_NOT_SPACE = re.compile(r"[^ \t\n\r]")
+_NUMBER_TAIL = re.compile(r"[0-9+\-.eE]*")
+
+
+class _ChunkReader:
+    """A text window over a file, refilled on demand; ``pos`` is the next character."""
+
+    def __init__(self, file: IO, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decode = codecs.getincrementaldecoder("utf-8")().decode
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int) -> bool:
+        """Appends up to size more characters, dropping the consumed ones; False at EOF."""
+        data = self.file.read(size)
+        if not data:
+            self.eof = True
+        text = data if isinstance(data, str) else self.decode(data, final=not data)
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return bool(data)
+
+    def peek(self) -> str:
+        """The next non-whitespace character (not consumed), or "" at EOF."""
+        while True:
+            match = _NOT_SPACE.search(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.start()
+                return self.buffer[self.pos]
+            self.pos = len(self.buffer)
+            if not self.fill(self.chunk_size):
+                return ""
+
+    def expect(self, allowed: str) -> str:
+        char = self.peek()
+        if not char or char not in allowed:
+            raise json.JSONDecodeError(
+                f"Expecting one of {allowed!r}", self.buffer, self.pos
+            )
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                # the value goes on in the next chunk; grow the reads so
+                # that a value much larger than a chunk is not re-parsed
+                # once per chunk
+                self.fill(size)
+                size *= 2
+                continue
+            # a number cut by the end of the window decodes as a shorter
+            # number ("12" of "1234", "0" of "0.5"): when only number
+            # characters are left in the window, it is decoded again with
+            # more data before it is trusted
+            if (
+                not self.eof
+                and _NUMBER_TAIL.fullmatch(self.buffer, end)
+                and self.fill(size)
+            ):
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_array(
+    file: IO, key: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Any]:
+    """Items of the top-level array, or of the array under ``key`` of the top-level object.
+
+    The file may be binary (UTF-8) or text. Values of the object that come
+    before ``key`` are decoded and dropped. Nothing after the array is read.
+    Raises KeyError if the object has no ``key`` and ``json.JSONDecodeError``
+    for malformed input.
+    """
+    reader = _ChunkReader(file, chunk_size)
+    if key is not None:
+        reader.expect("{")
+        if reader.peek() == "}":
+            raise KeyError(key)
+        while True:
+            name = reader.value()
+            reader.expect(":")
+            if name == key:
+                break
+            reader.value()
+            if reader.expect(",}") == "}":
+                raise KeyError(key)
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
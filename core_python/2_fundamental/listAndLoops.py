@@ -1,3 +1,4 @@
+from amortization import iter_schedule
 
 def display_list(lst):
     for item in lst:
@@ -52,17 +53,11 @@ def loan_payment_calculator():
     payment = float(input("Enter the monthly payment amount in dollars: "))
     months = int(input("Enter the number of months to simulate: "))
 
-    interest_rate_per_month = annual_interest_rate / 100 / 12
-    for month in range(1, months + 1):
-        interest = money_owed * interest_rate_per_month
-        money_owed += interest
-        money_owed -= payment
-        if money_owed < 0:
-            money_owed = 0
-        print(f"After month {month}, remaining balance: ${money_owed:.2f}")
-        if money_owed == 0:
+    # the schedule is generated lazily, one month at a time, and stops at payoff
+    for row in iter_schedule(money_owed, annual_interest_rate, payment, months):
+        print(f"After month {row.month}, remaining balance: ${row.balance:.2f}")
+        if row.balance == 0:
             print("Loan fully paid off!")
-            break
 
 
 if __name__ == "__main__":
@@ -0,0 +1,357 @@
+"""Columnar payroll engine.
+
+Instead of calling ``calculate_paycheck()`` once per object, a ``PayrollTable``
+keeps every employee type's fields in contiguous ``array`` columns and computes
+all paychecks of a type in one batched pass (``map`` over ``operator``
+functions runs the loop in C, without per-object method dispatch).
+
+If numpy is installed the columns are viewed with ``numpy.frombuffer`` (no
+copy) and each pass becomes a single vectorized expression. IEEE division,
+multiplication and addition round the same way in both paths, so the results
+are identical to ``calculate_paycheck()``.
+
+``EmployeeTable`` goes one step further and *is* the roster: it stores no
+employee objects at all and hands out lightweight row views instead.
+"""
+
+from array import array
+from itertools import repeat
+from operator import add, mul, truediv
+
+import _optional
+from employee import CommissionEmployee, Employee, HourlyEmployee, SalaryEmployee
+
+_np = _optional.numpy()
+
+# kind codes stored per row
+SALARY, HOURLY, COMMISSION, OTHER = range(4)
+
+
+def _column(name):
+    """Property reading/writing one cell of the view's column group."""
+
+    def fget(self):
+        return getattr(self._group, name)[self._index]
+
+    def fset(self, value):
+        getattr(self._group, name)[self._index] = value
+        if self._observer is not None:
+            self._observer(self)
+
+    return property(fget, fset)
+
+
+class _EmployeeView:
+    """Base of the lightweight row views handed out by ``EmployeeTable``.
+
+    A view stores only its column group and index; reads and writes go
+    straight to the columns, so views are cheap to create and never stale.
+    Like ``Employee``, a view reports writes to its ``_observer``.
+    """
+
+    __slots__ = ("_group", "_index", "_observer", "_observer_key")
+
+    first_name = _column("first_names")
+    last_name = _column("last_names")
+
+    def __init__(self, group, index):
+        self._group = group
+        self._index = index
+        self._observer = None
+        self._observer_key = None
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.first_name} {self.last_name}>"
+
+
+class SalaryEmployeeView(_EmployeeView):
+    __slots__ = ()
+
+    salary = _column("salary")
+
+    def calculate_paycheck(self):
+        return self.salary / 12
+
+
+class HourlyEmployeeView(_EmployeeView):
+    __slots__ = ()
+
+    hourly_rate = _column("hourly_rate")
+    weekly_hours = _column("weekly_hours")
+
+    def calculate_paycheck(self):
+        return self.hourly_rate * self.weekly_hours
+
+
+class CommissionEmployeeView(_EmployeeView):
+    __slots__ = ()
+
+    salary = _column("salary")
+    commission_rate = _column("commission_rate")
+    sales_amount = _column("sales_amount")
+
+    def calculate_paycheck(self):
+        return self.salary / 12 + self.commission_rate * self.sales_amount
+
+
+# views pass isinstance() checks against the classes they stand in for
+SalaryEmployee.register(SalaryEmployeeView)
+HourlyEmployee.register(HourlyEmployeeView)
+CommissionEmployee.register(CommissionEmployeeView)
+
+
+def _cells(column, start, stop):
+    """Rows [start, stop) of an array column, as a numpy view when available."""
+    if _np is not None:
+        return _np.frombuffer(column)[start:stop]
+    if start == 0 and stop is None:
+        return column
+    return column[start:stop]
+
+
+class _ColumnGroup:
+    """Names plus one ``array("d")`` column per numeric field of a type."""
+
+    view_class = None
+    kind = None
+    fields = ()
+
+    def __init__(self):
+        self.first_names = []
+        self.last_names = []
+        for name in self.fields:
+            setattr(self, name, array("d"))
+
+    def __len__(self):
+        return len(self.first_names)
+
+    def view(self, index):
+        return self.view_class(self, index)
+
+    def append(self, employee):
+        self.first_names.append(employee.first_name)
+        self.last_names.append(employee.last_name)
+        for name in self.fields:
+            getattr(self, name).append(getattr(employee, name))
+
+    def update(self, index, employee):
+        """Copies an employee's current fields over row ``index``."""
+        self.first_names[index] = employee.first_name
+        self.last_names[index] = employee.last_name
+        for name in self.fields:
+            getattr(self, name)[index] = getattr(employee, name)
+
+    def paycheck(self, index):
+        return self.view(index).calculate_paycheck()
+
+
+class SalaryColumns(_ColumnGroup):
+    """Column group for ``SalaryEmployee`` rows."""
+
+    view_class = SalaryEmployeeView
+    kind = SALARY
+    fields = ("salary",)
+
+    def paychecks(self, start=0, stop=None):
+        """Same formula as ``SalaryEmployee.calculate_paycheck``."""
+        salary = _cells(self.salary, start, stop)
+        if _np is not None:
+            return salary / 12
+        return map(truediv, salary, repeat(12))
+
+
+class HourlyColumns(_ColumnGroup):
+    """Column group for ``HourlyEmployee`` rows."""
+
+    view_class = HourlyEmployeeView
+    kind = HOURLY
+    fields = ("hourly_rate", "weekly_hours")
+
+    def paychecks(self, start=0, stop=None):
+        """Same formula as ``HourlyEmployee.calculate_paycheck``."""
+        hourly_rate = _cells(self.hourly_rate, start, stop)
+        weekly_hours = _cells(self.weekly_hours, start, stop)
+        if _np is not None:
+            return hourly_rate * weekly_hours
+        return map(mul, hourly_rate, weekly_hours)
+
+
+class CommissionColumns(_ColumnGroup):
+    """Column group for ``CommissionEmployee`` rows."""
+
+    view_class = CommissionEmployeeView
+    kind = COMMISSION
+    fields = ("salary", "commission_rate", "sales_amount")
+
+    def paychecks(self, start=0, stop=None):
+        """Same formula and evaluation order as ``CommissionEmployee``."""
+        salary = _cells(self.salary, start, stop)
+        commission_rate = _cells(self.commission_rate, start, stop)
+        sales_amount = _cells(self.sales_amount, start, stop)
+        if _np is not None:
+            return salary / 12 + commission_rate * sales_amount
+        base_pay = map(truediv, salary, repeat(12))
+        commission = map(mul, commission_rate, sales_amount)
+        return map(add, base_pay, commission)
+
+
+class OtherColumns(_ColumnGroup):
+    """Fallback for Employee subclasses the engine has no columns for."""
+
+    kind = OTHER
+
+    def __init__(self):
+        super().__init__()
+        self.employees = []
+
+    def view(self, index):
+        return self.employees[index]
+
+    def append(self, employee):
+        super().append(employee)
+        self.employees.append(employee)
+
+    def update(self, index, employee):
+        super().update(index, employee)
+        self.employees[index] = employee
+
+    def paychecks(self, start=0, stop=None):
+        return [emp.calculate_paycheck() for emp in self.employees[start:stop]]
+
+
+def kind_of(employee: Employee) -> int:
+    """Returns the kind code of an employee; unknown subclasses map to OTHER."""
+    return _KINDS.get(type(employee), OTHER)
+
+
+_KINDS = {
+    SalaryEmployee: SALARY,
+    HourlyEmployee: HOURLY,
+    CommissionEmployee: COMMISSION,
+    SalaryEmployeeView: SALARY,
+    HourlyEmployeeView: HOURLY,
+    CommissionEmployeeView: COMMISSION,
+}
+
+
+class PayrollTable:
+    """Struct-of-arrays store of a roster, one column group per employee type."""
+
+    def __init__(self):
+        self.groups = (
+            SalaryColumns(),
+            HourlyColumns(),
+            CommissionColumns(),
+            OtherColumns(),
+        )
+        self.kinds = array("B")  # kind code per roster row
+        self.slots = array("q")  # index of the row inside its column group
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def add(self, employee: Employee) -> int:
+        """Appends an employee's fields to its column group and returns its row.
+
+        The fields are copied; ``refresh()`` re-reads them after a change.
+        """
+        row = len(self.kinds)
+        group = self.groups[kind_of(employee)]
+        self.kinds.append(group.kind)
+        self.slots.append(len(group))
+        group.append(employee)
+        return row
+
+    def paycheck(self, row: int) -> float:
+        """Returns the paycheck of a single row."""
+        return self.groups[self.kinds[row]].paycheck(self.slots[row])
+
+    def refresh(self, row: int, employee: Employee) -> None:
+        """Copies an employee's current fields back into its row."""
+        self.groups[self.kinds[row]].update(self.slots[row], employee)
+
+    def paychecks(self) -> list:
+        """Returns every paycheck in roster order, one batched pass per type."""
+        return self.merge([group.paychecks() for group in self.groups])
+
+    def merge(self, per_group) -> list:
+        """Puts per-group paycheck sequences (one per ``groups`` entry) in roster order."""
+        if _np is not None:
+            kinds = _np.frombuffer(self.kinds, dtype=_np.uint8)
+            result = _np.empty(len(kinds))
+            for kind, values in enumerate(per_group):
+                if not isinstance(values, (_np.ndarray, array)):
+                    values = list(values)  # e.g. plain calculate_paycheck() results
+                if len(values):
+                    result[kinds == kind] = values
+            return result.tolist()
+        return self._in_roster_order(per_group, self.kinds)
+
+    def names(self) -> list:
+        """Returns (first_name, last_name) pairs in roster order."""
+        per_group = [zip(group.first_names, group.last_names) for group in self.groups]
+        return self._in_roster_order(per_group, self.kinds)
+
+    def iter_rows(self, chunk_size: int = 10_000):
+        """Yields lists of (first_name, last_name, paycheck) in roster order.
+
+        Paychecks are computed one chunk at a time, so memory stays bounded by
+        ``chunk_size`` instead of the roster size.
+        """
+        cursors = [0] * len(self.groups)
+        for start in range(0, len(self.kinds), chunk_size):
+            kinds = self.kinds[start : start + chunk_size]
+            per_group = []
+            for group in self.groups:
+                begin = cursors[group.kind]
+                end = cursors[group.kind] = begin + kinds.count(group.kind)
+                pays = group.paychecks(begin, end)
+                if _np is not None and isinstance(pays, _np.ndarray):
+                    pays = pays.tolist()
+                first_names = group.first_names[begin:end]
+                last_names = group.last_names[begin:end]
+                per_group.append(zip(first_names, last_names, pays))
+            yield self._in_roster_order(per_group, kinds)
+
+    @staticmethod
+    def _in_roster_order(per_group, kinds):
+        """Interleaves per-group iterators back into roster order.
+
+        Each group yields its values in insertion order, so pulling ``next()``
+        from the iterator picked by each row's kind code restores the roster
+        order; both ``map`` calls run in C.
+        """
+        iterators = [iter(values) for values in per_group]
+        return list(map(next, map(iterators.__getitem__, kinds)))
+
+    def total(self) -> float:
+        """Returns the sum of all paychecks."""
+        return sum(self.paychecks())
+
+
+class EmployeeTable(PayrollTable):
+    """A ``PayrollTable`` that is the roster itself.
+
+    It supports the list operations ``Company`` uses (``append``, ``len``,
+    indexing, iteration) and hands out row views instead of storing one
+    object per employee. Views it hands out report writes to ``observer``.
+    """
+
+    observer = None
+
+    def append(self, employee: Employee) -> None:
+        self.add(employee)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        employee = self.groups[self.kinds[row]].view(self.slots[row])
+        if isinstance(employee, _EmployeeView):
+            employee._observer = self.observer
+            employee._observer_key = row
+        return employee
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self)))
@@ -0,0 +1,112 @@
+"""Streaming payroll report writer.
+
+Rows are formatted a chunk at a time and written to a buffered sink, so a
+report over millions of employees never builds one giant string.
+"""
+
+import csv
+import io
+import json
+import os
+import sys
+import time
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
+
+Row = Tuple[str, str, float]  # (first_name, last_name, paycheck)
+
+FORMATS = ("text", "csv", "jsonl")
+CSV_HEADER = ("first_name", "last_name", "paycheck")
+
+
+class ReportStats(NamedTuple):
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else float("inf")
+
+
+def employee_rows(employees) -> Iterator[Row]:
+    """Yields report rows from Employee objects (or views), one paycheck call each."""
+    for emp in employees:
+        yield emp.first_name, emp.last_name, emp.calculate_paycheck()
+
+
+def chunked(rows: Iterable[Row], chunk_size: int) -> Iterator[List[Row]]:
+    """Groups an iterable of rows into lists of at most chunk_size rows."""
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def format_text(chunk: List[Row]) -> str:
+    """Formats rows as "First Last: $1,234.00" lines."""
+    return "".join([f"{first} {last}: ${pay:,.2f}\n" for first, last, pay in chunk])
+
+
+def format_jsonl(chunk: List[Row]) -> str:
+    """Formats rows as one JSON object per line."""
+    # encode_basestring_ascii is what json.dumps uses for str values
+    return "".join(
+        [
+            f'{{"first_name": {_quote(first)}, "last_name": {_quote(last)}, '
+            f'"paycheck": {json.dumps(round(pay, 2))}}}\n'
+            for first, last, pay in chunk
+        ]
+    )
+
+
+def format_csv(chunk: List[Row]) -> str:
+    """Formats rows as CSV records (without the header)."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(
+        [(first, last, round(pay, 2)) for first, last, pay in chunk]
+    )
+    return buffer.getvalue()
+
+
+_quote = json.encoder.encode_basestring_ascii
+
+_FORMATTERS = {"text": format_text, "csv": format_csv, "jsonl": format_jsonl}
+
+
+def write_report(
+    rows: Iterable[Row], sink=None, fmt: str = "text", chunk_size: int = 10_000
+) -> ReportStats:
+    """Writes report rows to a sink and returns the row count and timing.
+
+    ``rows`` may be any iterable of (first_name, last_name, paycheck), for
+    example ``employee_rows(company.employees)``. ``sink`` is a path, an open
+    text file or ``None`` for stdout.
+    """
+    return write_chunks(chunked(rows, chunk_size), sink, fmt)
+
+
+def write_chunks(
+    chunks: Iterable[List[Row]], sink=None, fmt: str = "text"
+) -> ReportStats:
+    """Like ``write_report`` but for rows that already come in lists.
+
+    One write is issued per chunk.
+    """
+    if fmt not in _FORMATTERS:
+        raise ValueError(f"unknown report format {fmt!r}, expected one of {FORMATS}")
+    formatter = _FORMATTERS[fmt]
+
+    if isinstance(sink, (str, os.PathLike)):
+        with open(sink, "w", newline="", buffering=1 << 20) as file:
+            return write_chunks(chunks, file, fmt)
+    if sink is None:
+        sink = sys.stdout
+
+    start = time.perf_counter()
+    count = 0
+    if fmt == "csv":
+        sink.write(",".join(CSV_HEADER) + "\n")
+    for chunk in chunks:
+        sink.write(formatter(chunk))
+        count += len(chunk)
+    sink.flush()
+    return ReportStats(count, time.perf_counter() - start)
@@ -0,0 +1,128 @@
+"""Running payroll aggregates, updated one employee at a time.
+
+``PayrollTotals`` never rescans the roster:
+
+* totals are kept as exact fixed-point integers (every float is an integer
+  multiple of 2**-1074), so adding and removing contributions never drifts and
+  the reported totals equal ``math.fsum`` of all paychecks;
+* min/max/top-N come from two heaps with lazy invalidation: a change bumps
+  the row's version and pushes a new entry, stale entries are discarded when
+  they reach the top. The heaps are built on the first ranking query (so
+  rosters that only need totals pay no memory for them) and rebuilt once they
+  hold twice as many entries as there are rows, which keeps that amortized.
+"""
+
+import heapq
+from array import array
+from typing import List, Optional, Tuple
+
+_SCALE = 1074  # 2**-1074 is the smallest positive float
+
+
+def _fixed(value: float) -> int:
+    """Exact integer value of ``value * 2**1074``."""
+    numerator, denominator = float(value).as_integer_ratio()
+    return numerator << (_SCALE + 1 - denominator.bit_length())
+
+
+def _to_float(fixed: int) -> float:
+    return fixed / (1 << _SCALE)  # int / int is correctly rounded
+
+
+class PayrollTotals:
+    """Total, per-kind totals, min/max and top earners of a set of rows."""
+
+    def __init__(self, kind_count: int = 4):
+        self._pays = array("d")
+        self._kinds = array("B")
+        self._versions = array("L")
+        self._total = 0
+        self._kind_totals = [0] * kind_count
+        self._min_heap = None  # (pay, row, version), built lazily
+        self._max_heap = None  # (-pay, row, version), built lazily
+
+    def __len__(self):
+        return len(self._pays)
+
+    def add(self, kind: int, pay: float) -> int:
+        """Adds a new row's contribution and returns the row number."""
+        row = len(self._pays)
+        self._pays.append(pay)
+        self._kinds.append(kind)
+        self._versions.append(0)
+        self._total += _fixed(pay)
+        self._kind_totals[kind] += _fixed(pay)
+        self._push(row)
+        return row
+
+    def update(self, row: int, pay: float) -> None:
+        """Replaces a row's contribution (only that row is touched)."""
+        old = self._pays[row]
+        self._pays[row] = pay
+        if old == pay:
+            return
+        delta = _fixed(pay) - _fixed(old)
+        self._total += delta
+        self._kind_totals[self._kinds[row]] += delta
+        self._versions[row] += 1
+        self._push(row)
+
+    @property
+    def total(self) -> float:
+        return _to_float(self._total)
+
+    def kind_total(self, kind: int) -> float:
+        return _to_float(self._kind_totals[kind])
+
+    def min(self) -> Optional[Tuple[int, float]]:
+        """(row, pay) of the lowest paycheck, or None when empty."""
+        entry = self._peek(self._heaps()[0])
+        return None if entry is None else (entry[1], entry[0])
+
+    def max(self) -> Optional[Tuple[int, float]]:
+        """(row, pay) of the highest paycheck, or None when empty."""
+        entry = self._peek(self._heaps()[1])
+        return None if entry is None else (entry[1], -entry[0])
+
+    def top(self, n: int) -> List[Tuple[int, float]]:
+        """(row, pay) of the n highest paychecks, highest first."""
+        heap = self._heaps()[1]
+        result, kept = [], []
+        while heap and len(result) < n:
+            entry = heapq.heappop(heap)
+            if self._is_current(entry):
+                result.append((entry[1], -entry[0]))
+                kept.append(entry)
+        for entry in kept:
+            heapq.heappush(heap, entry)
+        return result
+
+    def _is_current(self, entry) -> bool:
+        return self._versions[entry[1]] == entry[2]
+
+    def _peek(self, heap):
+        while heap and not self._is_current(heap[0]):
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _heaps(self):
+        if self._min_heap is None:
+            self._rebuild()
+        return self._min_heap, self._max_heap
+
+    def _push(self, row: int) -> None:
+        if self._min_heap is None:
+            return
+        if max(len(self._min_heap), len(self._max_heap)) > 2 * len(self._pays) + 32:
+            self._rebuild()
+            return
+        pay, version = self._pays[row], self._versions[row]
+        heapq.heappush(self._min_heap, (pay, row, version))
+        heapq.heappush(self._max_heap, (-pay, row, version))
+
+    def _rebuild(self) -> None:
+        entries = list(zip(self._pays, range(len(self._pays)), self._versions))
+        self._min_heap = entries
+        self._max_heap = [(-pay, row, version) for pay, row, version in entries]
+        heapq.heapify(self._min_heap)
+        heapq.heapify(self._max_heap)
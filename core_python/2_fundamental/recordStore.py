@@ -0,0 +1,331 @@
+"""Columnar store for many small records with the same fields.
+
+A list of dicts such as ``[{"name": ..., "phone": ...}, ...]`` pays for one
+dict (hash table, key pointers) per record, about 180 bytes before any
+value. A ``RecordStore`` keeps one column per field instead, and the field
+names exist once per store (interned), not once per record:
+
+* int and float fields become ``array("q")`` / ``array("d")`` columns,
+  8 bytes per value with no int or float objects at all;
+* string fields with few distinct values (``craft``, ``city``) are
+  dictionary-encoded: a 4-byte code per row plus one copy of each value;
+* everything else is a plain list (one pointer per row).
+
+``from_records`` picks those column types by looking at the data.
+``store[i]`` is a ``RecordView``: a read/write ``Mapping`` over row i that
+holds nothing but the store and the index. ``values(*fields)`` iterates
+columns directly (a ``zip`` in C), which is the fast way through all rows.
+
+``create_index(field)`` adds a secondary index (value -> row ids) that is
+kept up to date on append and assignment, so ``find``/``find_one`` by
+``name`` or ``phone`` are one dict probe instead of a scan.
+"""
+
+import sys
+from array import array
+from bisect import insort
+from collections.abc import Mapping
+from itertools import repeat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# column kinds
+OBJECT, INT, FLOAT, CATEGORY = "object", "int", "float", "category"
+# dictionary-encode a string field when its distinct values are at most this
+# share of the rows (and there are enough rows for it to pay off)
+CATEGORY_RATIO = 0.5
+CATEGORY_MIN_ROWS = 64
+_ARRAY_TYPES = {"q": int, "d": float}
+
+
+class _CategoryColumn:
+    """Strings stored as array("I") codes into a list of distinct values."""
+
+    __slots__ = ("codes", "values", "_code_of")
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.codes = array("I")
+        self.values: List[str] = []
+        self._code_of: Dict[str, int] = {}
+        for value in values:
+            self.append(value)
+
+    def _code(self, value) -> int:
+        code = self._code_of.get(value)
+        if code is None:
+            code = self._code_of[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value) -> None:
+        self.codes.append(self._code(value))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int):
+        return self.values[self.codes[index]]
+
+    def __setitem__(self, index: int, value) -> None:
+        self.codes[index] = self._code(value)
+
+    def __iter__(self) -> Iterator:
+        return map(self.values.__getitem__, self.codes)
+
+
+def _column_kind(column) -> str:
+    if isinstance(column, _CategoryColumn):
+        return CATEGORY
+    if isinstance(column, array):
+        return INT if column.typecode == "q" else FLOAT
+    return OBJECT
+
+
+def _make_column(kind: str, values: Iterable = ()):
+    if kind == INT:
+        return array("q", values)
+    if kind == FLOAT:
+        return array("d", values)
+    if kind == CATEGORY:
+        return _CategoryColumn(values)
+    if kind == OBJECT:
+        return list(values)
+    raise ValueError(f"unknown column kind {kind!r}")
+
+
+def _infer_kind(values: Sequence) -> str:
+    """The most compact column kind that holds all of values exactly."""
+    types = set(map(type, values))
+    if types == {int}:
+        if all(-(2**63) <= v < 2**63 for v in (min(values), max(values))):
+            return INT
+    elif types == {float}:
+        return FLOAT
+    elif types == {str} and len(values) >= CATEGORY_MIN_ROWS:
+        if len(set(values)) <= CATEGORY_RATIO * len(values):
+            return CATEGORY
+    return OBJECT
+
+
+class RecordView(Mapping):
+    """Dict-like view of one row; reads and writes go to the store's columns."""
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "RecordStore", index: int):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, field: str):
+        return self._store._columns[self._store._slot[field]][self._index]
+
+    def __setitem__(self, field: str, value) -> None:
+        self._store.set(self._index, field, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.fields)
+
+    def __len__(self) -> int:
+        return len(self._store.fields)
+
+    def __contains__(self, field) -> bool:
+        return field in self._store._slot
+
+    def to_dict(self) -> Dict[str, Any]:
+        store, index = self._store, self._index
+        return dict(zip(store.fields, [column[index] for column in store._columns]))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class RecordStore:
+    """Homogeneous dict records kept as columns, with optional secondary indexes."""
+
+    def __init__(self, fields: Sequence[str], kinds: Optional[Dict[str, str]] = None):
+        # one interned copy of every field name, shared by all rows and views
+        self.fields: Tuple[str, ...] = tuple(sys.intern(str(f)) for f in fields)
+        if len(set(self.fields)) != len(self.fields):
+            raise ValueError("duplicate field names")
+        self._slot = {field: slot for slot, field in enumerate(self.fields)}
+        kinds = kinds or {}
+        self._columns = [_make_column(kinds.get(f, OBJECT)) for f in self.fields]
+        self._indexes: Dict[str, Tuple[dict, bool]] = {}  # field -> (index, unique)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        fields: Optional[Sequence[str]] = None,
+    ) -> "RecordStore":
+        """Store of the records, with each column's kind chosen from its values.
+
+        ``fields`` defaults to the keys of the first record.
+        """
+        records = iter(records)
+        first = next(records, None)
+        if fields is None:
+            fields = list(first) if first is not None else []
+        store = cls(fields)
+        if first is not None:
+            store.append(first)
+            store.extend(records)
+        store.optimize()
+        return store
+
+    def optimize(self) -> None:
+        """Converts every column to the most compact kind its values allow."""
+        for slot, column in enumerate(self._columns):
+            values = list(column)
+            kind = _infer_kind(values) if values else OBJECT
+            if kind != _column_kind(column):
+                self._columns[slot] = _make_column(kind, values)
+
+    def kind(self, field: str) -> str:
+        return _column_kind(self._columns[self._slot[field]])
+
+    # -- rows --
+
+    def __len__(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def _row(self, index: int) -> int:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("record index out of range")
+        return index
+
+    def __getitem__(self, index: int) -> RecordView:
+        return RecordView(self, self._row(index))
+
+    def __iter__(self) -> Iterator[RecordView]:
+        return map(RecordView, repeat(self), range(len(self)))
+
+    def _store_value(self, slot: int, index: Optional[int], value) -> None:
+        """Appends (index None) or assigns a cell; a value an array cannot hold
+        turns its column back into a plain list."""
+        column = self._columns[slot]
+        try:
+            # an array would quietly turn True into 1 and 1 into 1.0
+            if (
+                isinstance(column, array)
+                and type(value) is not _ARRAY_TYPES[column.typecode]
+            ):
+                raise TypeError
+            if index is None:
+                column.append(value)
+            else:
+                column[index] = value
+        except (TypeError, OverflowError):
+            column = self._columns[slot] = list(column)
+            if index is None:
+                column.append(value)
+            else:
+                column[index] = value
+
+    def append(self, record: Mapping[str, Any]) -> int:
+        """Adds a record with exactly the store's fields; returns its row id."""
+        if len(record) != len(self.fields):
+            extra = set(record) - set(self.fields)
+            raise ValueError(f"unexpected fields {sorted(map(str, extra))}")
+        values = [record[field] for field in self.fields]  # KeyError if one is missing
+        index = len(self)
+        for field, (entries, unique) in self._indexes.items():
+            if unique and values[self._slot[field]] in entries:
+                raise ValueError(f"duplicate {field} {values[self._slot[field]]!r}")
+        for slot, value in enumerate(values):
+            self._store_value(slot, None, value)
+        for field, (entries, unique) in self._indexes.items():
+            self._index_add(entries, unique, values[self._slot[field]], index)
+        return index
+
+    def extend(self, records: Iterable[Mapping[str, Any]]) -> None:
+        for record in records:
+            self.append(record)
+
+    def set(self, index: int, field: str, value) -> None:
+        index = self._row(index)
+        slot = self._slot[field]
+        indexed = self._indexes.get(field)
+        if indexed is not None:
+            entries, unique = indexed
+            old = self._columns[slot][index]
+            if unique and value != old and value in entries:
+                raise ValueError(f"duplicate {field} {value!r}")
+            self._index_remove(entries, unique, old, index)
+            self._index_add(entries, unique, value, index)
+        self._store_value(slot, index, value)
+
+    def column(self, field: str):
+        """The column of field (a list, an array or a sequence-like category column)."""
+        return self._columns[self._slot[field]]
+
+    def values(self, *fields: str) -> Iterator[tuple]:
+        """Tuples of the given fields (all fields by default), row by row."""
+        return zip(*(self.column(field) for field in (fields or self.fields)))
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in self.values()]
+
+    # -- secondary indexes --
+
+    @staticmethod
+    def _index_add(entries: dict, unique: bool, value, index: int) -> None:
+        if unique:
+            entries[value] = index
+            return
+        rows = entries.get(value)
+        if rows is None:
+            entries[value] = index  # a single row is stored as a bare int
+        elif isinstance(rows, int):
+            entries[value] = array("q", sorted((rows, index)))
+        else:
+            insort(rows, index)  # kept in row order
+
+    @staticmethod
+    def _index_remove(entries: dict, unique: bool, value, index: int) -> None:
+        rows = entries[value]
+        if unique or isinstance(rows, int):
+            del entries[value]
+        else:
+            rows.remove(index)
+            if len(rows) == 1:
+                entries[value] = rows[0]
+
+    def create_index(self, field: str, unique: bool = False) -> None:
+        """Indexes field for ``find``/``find_one``; unique rejects duplicate values."""
+        entries: dict = {}
+        for index, value in enumerate(self.column(field)):
+            if unique and value in entries:
+                raise ValueError(f"duplicate {field} {value!r}")
+            self._index_add(entries, unique, value, index)
+        self._indexes[field] = (entries, unique)
+
+    def drop_index(self, field: str) -> None:
+        del self._indexes[field]
+
+    def _rows_with(self, field: str, value) -> Sequence[int]:
+        indexed = self._indexes.get(field)
+        if indexed is None:
+            column = self.column(field)
+            return [i for i, v in enumerate(column) if v == value]
+        rows = indexed[0].get(value)
+        if rows is None:
+            return ()
+        return (rows,) if isinstance(rows, int) else rows
+
+    def find(self, field: str, value) -> List[RecordView]:
+        """Views of the rows whose field equals value (a scan if field is not indexed)."""
+        return [RecordView(self, index) for index in self._rows_with(field, value)]
+
+    def find_one(self, field: str, value) -> Optional[RecordView]:
+        indexed = self._indexes.get(field)
+        if indexed is not None:  # the common case, kept to one probe
+            rows = indexed[0].get(value)
+            if rows is None:
+                return None
+            return RecordView(self, rows if rows.__class__ is int else rows[0])
+        rows = self._rows_with(field, value)
+        return RecordView(self, rows[0]) if rows else None
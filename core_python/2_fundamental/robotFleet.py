@@ -0,0 +1,249 @@
+"""Robot fleet engine: every robot's position in two contiguous columns.
+
+A ``RobotFleet`` keeps the x and y coordinates of all its robots in two
+``array`` columns (``"q"``, 64-bit ints, by default; ``"d"`` for fractional
+moves) and their names in a list. An int fleet switches to ``"d"`` the first
+time it is given a fractional position or step, as list-backed robots
+accepted floats. ``walk`` moves many robots in one batched
+step: with numpy installed the columns are viewed with ``numpy.frombuffer``
+(no copy) and updated in place by one vectorized add, otherwise ``map`` over
+``operator.add`` runs the loop in C.
+
+``classesAndObjects.Robot`` objects are views: they hold only their fleet and
+row, so ``robot.position`` and a fleet-wide ``walk`` always agree. Observers
+(``spatialGrid.SpatialGrid``) are told which rows were added or moved.
+
+Printing is an optional event sink. A fleet without a sink produces no
+events at all; ``PrintSink`` formats "<name> walked to position [x, y]" lines
+and writes them in large buffered chunks (or one by one, for a single robot
+in an interactive demo).
+"""
+
+import sys
+from array import array
+from itertools import repeat
+from numbers import Integral, Number
+from operator import add
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import _optional
+
+_np = _optional.numpy()
+
+DEFAULT_TYPECODE = "q"
+_NUMPY_TYPES = {"q": "int64", "d": "float64"}
+
+Delta = Union[Number, Sequence[Number]]  # one step for all robots, or one per robot
+
+
+def _is_fractional(value) -> bool:
+    """True if a position, step or sequence of steps holds a non-integer number."""
+    if isinstance(value, Integral):
+        return False
+    if isinstance(value, Number):
+        return True
+    dtype = getattr(value, "dtype", None)  # numpy arrays
+    if dtype is not None:
+        return dtype.kind not in "biu"
+    typecode = getattr(value, "typecode", None)  # array.array
+    if typecode is not None:
+        return typecode in "fd"
+    return not all(issubclass(kind, Integral) for kind in set(map(type, value)))
+
+
+class PrintSink:
+    """Writes one "walked to position" line per moved robot.
+
+    Lines are buffered and written ``buffer_lines`` at a time; with
+    ``buffer_lines=0`` each batch is written as soon as it happens.
+    ``file`` defaults to the current ``sys.stdout``.
+    """
+
+    def __init__(self, file: Optional[IO[str]] = None, buffer_lines: int = 8192):
+        self.file = file
+        self.buffer_lines = buffer_lines
+        self._lines: List[str] = []
+
+    def record(self, fleet: "RobotFleet", rows: Iterable[int]) -> None:
+        names, xs, ys = fleet.names, fleet.xs, fleet.ys
+        lines = self._lines
+        for row in rows:
+            lines.append(f"{names[row]} walked to position [{xs[row]}, {ys[row]}]\n")
+            if len(lines) >= self.buffer_lines:
+                self.flush()
+        if not self.buffer_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            (self.file or sys.stdout).write("".join(self._lines))
+            self._lines.clear()
+
+
+class _PositionView:
+    """A robot's [x, y] as a list-like, write-through view of the fleet columns."""
+
+    __slots__ = ("_fleet", "_row")
+
+    def __init__(self, fleet: "RobotFleet", row: int):
+        self._fleet = fleet
+        self._row = row
+
+    def _column(self, axis: int) -> array:
+        if axis in (0, -2):
+            return self._fleet.xs
+        if axis in (1, -1):
+            return self._fleet.ys
+        raise IndexError("position index out of range")
+
+    def __getitem__(self, axis: int):
+        return self._column(axis)[self._row]
+
+    def __setitem__(self, axis: int, value) -> None:
+        self._fleet._fit(value)
+        self._column(axis)[self._row] = value
+        self._fleet._notify("moved", (self._row,))
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self) -> Iterator:
+        yield self._fleet.xs[self._row]
+        yield self._fleet.ys[self._row]
+
+    def __eq__(self, other) -> bool:
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class RobotFleet:
+    """Names and (x, y) positions of many robots, moved in batches."""
+
+    def __init__(self, typecode: str = DEFAULT_TYPECODE, sink=None):
+        if typecode not in _NUMPY_TYPES:
+            raise ValueError(f"typecode must be one of {sorted(_NUMPY_TYPES)}")
+        self.typecode = typecode
+        self.names: List[str] = []
+        self.xs = array(typecode)
+        self.ys = array(typecode)
+        self.sink = sink  # None: no events at all
+        self._observers = []  # e.g. spatial indexes, told about every change
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, x=0, y=0) -> int:
+        """Adds a robot and returns its row."""
+        self._fit(x, y)
+        self.names.append(name)
+        self.xs.append(x)
+        self.ys.append(y)
+        row = len(self.names) - 1
+        self._notify("added", range(row, row + 1))
+        return row
+
+    def spawn(self, names: Iterable[str]) -> range:
+        """Adds many robots at the origin; returns their rows."""
+        start = len(self.names)
+        self.names.extend(names)
+        count = len(self.names) - start
+        zeros = array(self.typecode, bytes(count * self.xs.itemsize))
+        self.xs.extend(zeros)
+        self.ys.extend(zeros)
+        rows = range(start, start + count)
+        self._notify("added", rows)
+        return rows
+
+    def position(self, row: int) -> _PositionView:
+        return _PositionView(self, row)
+
+    def positions(self) -> Iterator[Tuple]:
+        return zip(self.xs, self.ys)
+
+    def move_to(self, row: int, x, y) -> None:
+        self._fit(x, y)
+        self.xs[row] = x
+        self.ys[row] = y
+        self._notify("moved", (row,))
+
+    def _fit(self, *values) -> None:
+        """Switches int columns to float ones the first time a fractional value comes."""
+        if self.typecode == "q" and any(map(_is_fractional, values)):
+            self.typecode = "d"
+            self.xs = array("d", self.xs)
+            self.ys = array("d", self.ys)
+
+    def observe(self, observer) -> None:
+        """Calls ``observer.added(fleet, rows)`` and ``observer.moved(fleet, rows)``
+        after robots are added or moved; rows is None when every robot moved."""
+        self._observers.append(observer)
+
+    def unobserve(self, observer) -> None:
+        self._observers.remove(observer)
+
+    def _notify(self, event: str, rows: Optional[Sequence[int]]) -> None:
+        for observer in self._observers:
+            getattr(observer, event)(self, rows)
+
+    def walk(
+        self, dx: Delta, dy: Delta = 0, rows: Optional[Sequence[int]] = None
+    ) -> None:
+        """Moves every robot (or the given rows) by (dx, dy) in one batched step.
+
+        dx and dy are either one step for all moved robots or one step per
+        moved robot. Rows must be distinct.
+        """
+        if rows is not None and len(rows) == 0:
+            return
+        count = len(self) if rows is None else len(rows)
+        for delta in (dx, dy):
+            # checked up front: a short list would shift only some robots
+            if not isinstance(delta, Number) and len(delta) != count:
+                raise ValueError(
+                    f"got {len(delta)} steps for {count} robots, pass one per robot"
+                )
+        self._fit(dx, dy)
+        for column, delta in ((self.xs, dx), (self.ys, dy)):
+            if isinstance(delta, Number) and delta == 0:
+                continue
+            if rows is None:
+                self._shift_all(column, delta)
+            else:
+                self._shift_rows(column, delta, rows)
+        self._notify("moved", rows)
+        if self.sink is not None:
+            self.sink.record(self, range(len(self)) if rows is None else rows)
+
+    def _shift_all(self, column: array, delta: Delta) -> None:
+        if not column:
+            return
+        if _np is not None:
+            cells = _np.frombuffer(column, dtype=_NUMPY_TYPES[self.typecode])
+            cells += delta if isinstance(delta, Number) else _np.asarray(delta)
+            del cells  # release the buffer so the array can grow again
+            return
+        deltas = repeat(delta) if isinstance(delta, Number) else delta
+        column[:] = array(self.typecode, map(add, column, deltas))
+
+    def _shift_rows(self, column: array, delta: Delta, rows: Sequence[int]) -> None:
+        if _np is not None and len(rows) > 64:
+            cells = _np.frombuffer(column, dtype=_NUMPY_TYPES[self.typecode])
+            steps = delta if isinstance(delta, Number) else _np.asarray(delta)
+            cells[_np.asarray(rows)] += steps
+            del cells
+            return
+        deltas = repeat(delta) if isinstance(delta, Number) else delta
+        for row, step in zip(rows, deltas):
+            column[row] += step
+
+    def flush(self) -> None:
+        """Writes out whatever the sink still buffers."""
+        if self.sink is not None and hasattr(self.sink, "flush"):
+            self.sink.flush()
@@ -0,0 +1,170 @@
+"""Rock-paper-scissors simulation: seeded, batched, optionally multi-process.
+
+Moves are codes 0 (rock), 1 (paper) and 2 (scissors), and a batch of moves
+is a ``bytes`` object with one code per round. The outcome of a round for
+player A is looked up in ``PAYOFF``, a 9-entry table indexed by
+``3 * a + b``; there are no comparisons per round.
+
+A strategy is any picklable callable ``strategy(rng, start, count)`` that
+returns the moves of rounds ``start .. start + count - 1`` as bytes, drawing
+randomness only from ``rng`` (a ``random.Random``). ``RandomMoves``,
+``Constant`` and ``Cycle`` are provided.
+
+``simulate`` splits the rounds into shards of ``SHARD_ROUNDS``. Every shard
+has its own RNG, seeded from the simulation seed and the shard number, and
+plays its rounds in batches of ``batch_size``. The shards are the same
+whether they run here or in a process pool, so a seed (with a given
+batch size) always gives the same ``Tally``, bit for bit, with any number
+of workers.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from operator import add
+from typing import Callable, NamedTuple, Sequence
+
+import _optional
+
+_np = _optional.numpy()
+
+MOVES = ("rock", "paper", "scissors")
+ROCK, PAPER, SCISSORS = range(3)
+TIE, WIN, LOSS = range(3)  # the outcome for player A
+
+# PAYOFF[3 * a + b]: paper (1) beats rock (0), scissors (2) beat paper, rock beats scissors
+PAYOFF = bytes((a - b) % 3 for a in range(3) for b in range(3))
+
+DEFAULT_BATCH_SIZE = 1 << 16
+SHARD_ROUNDS = 1 << 20  # fixed, so results do not depend on the number of workers
+
+_TIMES_THREE = bytes.maketrans(bytes(range(3)), bytes((0, 3, 6)))
+_MOD_THREE = bytes(code % 3 for code in range(256))
+_REJECTED = b"\xff"  # 255 is the one byte value that would make % 3 uneven
+
+Strategy = Callable[[random.Random, int, int], bytes]
+
+
+def outcome(a: int, b: int) -> int:
+    """TIE, WIN or LOSS for the player who played ``a`` against ``b``."""
+    return PAYOFF[3 * a + b]
+
+
+class Tally(NamedTuple):
+    wins: int = 0
+    ties: int = 0
+    losses: int = 0
+
+    @property
+    def rounds(self) -> int:
+        return self.wins + self.ties + self.losses
+
+    def merge(self, other: "Tally") -> "Tally":
+        return Tally(*map(add, self, other))
+
+
+class RandomMoves:
+    """Uniform random moves: random bytes with 255 rejected, taken % 3."""
+
+    def __call__(self, rng: random.Random, start: int, count: int) -> bytes:
+        moves = b""
+        while len(moves) < count:
+            # about 1 byte in 256 is rejected, so this rarely loops twice
+            raw = rng.randbytes(count - len(moves))
+            moves += raw.translate(_MOD_THREE, _REJECTED)
+        return moves
+
+
+class Constant:
+    """Always the same move."""
+
+    def __init__(self, move: int):
+        self.move = move
+
+    def __call__(self, rng: random.Random, start: int, count: int) -> bytes:
+        return bytes((self.move,)) * count
+
+
+class Cycle:
+    """The given moves over and over; round ``n`` plays ``moves[n % len(moves)]``."""
+
+    def __init__(self, moves: Sequence[int]):
+        self.moves = bytes(moves)
+
+    def __call__(self, rng: random.Random, start: int, count: int) -> bytes:
+        period = len(self.moves)
+        offset = start % period
+        repeats = (offset + count) // period + 1
+        return (self.moves * repeats)[offset : offset + count]
+
+
+def play_batch(a_moves: bytes, b_moves: bytes) -> Tally:
+    """Tally of player A over rounds played pairwise from the two batches."""
+    if _np is not None:
+        a = _np.frombuffer(a_moves, dtype=_np.uint8)
+        b = _np.frombuffer(b_moves, dtype=_np.uint8)
+        pairs = _np.bincount(a * 3 + b, minlength=9).tolist()
+    else:
+        codes = bytes(map(add, a_moves.translate(_TIMES_THREE), b_moves))
+        pairs = [codes.count(code) for code in range(9)]
+    totals = [0, 0, 0]
+    for pair, count in enumerate(pairs):
+        totals[PAYOFF[pair]] += count
+    return Tally(wins=totals[WIN], ties=totals[TIE], losses=totals[LOSS])
+
+
+def shard_rng(seed: int, shard: int) -> random.Random:
+    # string seeds are hashed with SHA-512, the same in every process
+    return random.Random(f"{seed}/{shard}")
+
+
+def play_shard(
+    player_a: Strategy,
+    player_b: Strategy,
+    seed: int,
+    shard: int,
+    rounds: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Tally:
+    """Plays the ``rounds`` rounds of one shard with the shard's own RNG."""
+    rng = shard_rng(seed, shard)
+    tally = Tally()
+    first = shard * SHARD_ROUNDS
+    for start in range(first, first + rounds, batch_size):
+        count = min(batch_size, first + rounds - start)
+        a_moves = player_a(rng, start, count)
+        b_moves = player_b(rng, start, count)
+        tally = tally.merge(play_batch(a_moves, b_moves))
+    return tally
+
+
+def _play_shard(job) -> Tally:
+    return play_shard(*job)
+
+
+def simulate(
+    player_a: Strategy,
+    player_b: Strategy,
+    rounds: int,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = 1,
+) -> Tally:
+    """Plays ``rounds`` rounds of A against B and tallies A's results.
+
+    ``workers`` > 1 plays the shards in a process pool (the strategies must
+    be picklable); the tally is the same either way.
+    """
+    jobs = [
+        (player_a, player_b, seed, shard, min(SHARD_ROUNDS, rounds - start), batch_size)
+        for shard, start in enumerate(range(0, rounds, SHARD_ROUNDS))
+    ]
+    tally = Tally()
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_play_shard, jobs)
+            for result in results:
+                tally = tally.merge(result)
+    else:
+        for job in jobs:
+            tally = tally.merge(_play_shard(job))
+    return tally
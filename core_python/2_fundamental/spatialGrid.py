@@ -0,0 +1,252 @@
+"""Uniform grid index over a ``RobotFleet`` for range and nearest-neighbour queries.
+
+The plane is cut into square cells of ``cell_size``. Every robot row is
+filed in the bucket of its cell (a dict from packed cell coordinates to a
+list of rows), and ``cell_of[row]`` remembers which one, together with its
+slot in that bucket so it can be taken out in O(1) (swap with the last).
+
+The grid observes its fleet, so it never has to be rebuilt. After a
+fleet-wide ``walk`` the cell of every robot is recomputed in one batched
+step (numpy when installed) and compared with ``cell_of``. Only the robots
+that crossed into another cell are re-filed, which is a small share when
+steps are small next to the cell size.
+
+Queries only look at the cells near the query point:
+
+* ``within(x, y, radius)`` scans the cells overlapping the query circle's
+  bounding box;
+* ``nearest(x, y, k)`` scans rings of cells around the query cell,
+  outward, and stops as soon as no unseen robot can be closer than the
+  k-th best found.
+
+A cell size around the typical query radius (or the mean spacing of
+robots, for k-NN) keeps both near O(results).
+"""
+
+import heapq
+import math
+from array import array
+from itertools import compress, repeat
+from operator import floordiv
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import _optional
+from robotFleet import RobotFleet
+
+_np = _optional.numpy()
+
+# cell coordinates are taken modulo 2**32 and packed as (cx << 32) | cy into
+# an int64, cx as a signed 32-bit value; cells 2**32 apart share a bucket,
+# which costs nothing but candidates, since queries check the real distance
+_LOW = 0xFFFFFFFF
+_SIGN = 0x80000000
+_NUMPY_TYPES = {"q": "int64", "d": "float64"}
+
+
+def _key(cx: int, cy: int) -> int:
+    return (((cx & _LOW) ^ _SIGN) - _SIGN) << 32 | (cy & _LOW)
+
+
+class SpatialGrid:
+    """Rows of a fleet bucketed by grid cell, kept in sync as the fleet moves."""
+
+    def __init__(self, fleet: RobotFleet, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.fleet = fleet
+        self.cell_size = cell_size
+        self.buckets: Dict[int, List[int]] = {}
+        self.cell_of = array("q")  # row -> packed cell
+        self.slot_of = array("q")  # row -> position in its bucket
+        self.added(fleet, range(len(fleet)))
+        fleet.observe(self)
+
+    def close(self) -> None:
+        """Stops following the fleet."""
+        self.fleet.unobserve(self)
+
+    def __len__(self) -> int:
+        return len(self.cell_of)
+
+    # -- cells --
+
+    def cell(self, x, y) -> Tuple[int, int]:
+        # the same floor division as _keys (and numpy.floor_divide), so that
+        # query cells agree with the cells robots were filed under
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def _key_array(self, rows: Optional[Sequence[int]]):
+        """Packed cells of the rows (all rows if None) as a numpy int64 array."""
+        dtype = _NUMPY_TYPES[self.fleet.typecode]
+        cells_x = _np.frombuffer(self.fleet.xs, dtype=dtype)
+        cells_y = _np.frombuffer(self.fleet.ys, dtype=dtype)
+        if rows is not None:
+            index = _np.asarray(rows)
+            cells_x, cells_y = cells_x[index], cells_y[index]
+        # modulo before the cast: float cells can be out of int64 range
+        cx = (_np.floor_divide(cells_x, self.cell_size) % (_LOW + 1)).astype(_np.int64)
+        cy = (_np.floor_divide(cells_y, self.cell_size) % (_LOW + 1)).astype(_np.int64)
+        return ((cx ^ _SIGN) - _SIGN) << 32 | cy
+
+    def _keys(self, rows: Optional[Sequence[int]]) -> List[int]:
+        """Packed cells of the rows (all rows if None), computed in one batch."""
+        if _np is not None and (rows is None or len(rows) > 64):
+            return self._key_array(rows).tolist()
+        xs, ys, size = self.fleet.xs, self.fleet.ys, self.cell_size
+        if rows is not None:
+            xs = [xs[row] for row in rows]
+            ys = [ys[row] for row in rows]
+        cx = map(int, map(floordiv, xs, repeat(size)))
+        cy = map(int, map(floordiv, ys, repeat(size)))
+        return list(map(_key, cx, cy))
+
+    def _file(self, row: int, key: int) -> None:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = []
+        self.cell_of[row] = key
+        self.slot_of[row] = len(bucket)
+        bucket.append(row)
+
+    # -- fleet observer --
+
+    def added(self, fleet: RobotFleet, rows: Sequence[int]) -> None:
+        padding = array("q", bytes(8 * len(rows)))
+        self.cell_of.extend(padding)
+        self.slot_of.extend(padding)
+        for row, key in zip(rows, self._keys(rows)):
+            self._file(row, key)
+
+    def moved(self, fleet: RobotFleet, rows: Optional[Sequence[int]]) -> None:
+        # only robots that crossed into another cell are re-filed
+        if _np is not None and (rows is None or len(rows) > 64):
+            keys = self._key_array(rows)
+            old = _np.frombuffer(self.cell_of, dtype=_np.int64)
+            if rows is not None:
+                rows = _np.asarray(rows)
+                old = old[rows]
+            crossed = _np.flatnonzero(keys != old)
+            del old  # release the buffer so cell_of can grow again
+            keys = keys[crossed].tolist()
+            rows = (crossed if rows is None else rows[crossed]).tolist()
+        else:
+            keys = self._keys(rows)
+            if rows is None:
+                rows = range(len(self.cell_of))
+            crossed = [self.cell_of[row] != key for row, key in zip(rows, keys)]
+            rows = list(compress(rows, crossed))
+            keys = list(compress(keys, crossed))
+        self._refile(rows, keys)
+
+    def _refile(self, rows: Iterable[int], keys: Iterable[int]) -> None:
+        """Moves each row from its current bucket to the one of its new key.
+
+        The row leaves its bucket by swapping with the bucket's last row.
+        This loop is the whole per-tick cost once the cells are computed,
+        so it is written out inline.
+        """
+        buckets, cell_of, slot_of = self.buckets, self.cell_of, self.slot_of
+        for row, key in zip(rows, keys):
+            old = cell_of[row]
+            bucket = buckets[old]
+            last = bucket.pop()
+            if last != row:
+                slot = slot_of[row]
+                bucket[slot] = last
+                slot_of[last] = slot
+            elif not bucket:
+                del buckets[old]
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = []
+            cell_of[row] = key
+            slot_of[row] = len(bucket)
+            bucket.append(row)
+
+    # -- queries --
+
+    def _distance2(self, row: int, x, y):
+        dx = self.fleet.xs[row] - x
+        dy = self.fleet.ys[row] - y
+        return dx * dx + dy * dy
+
+    def _rows_in_cells(self, cells: Iterable[Tuple[int, int]]) -> Iterator[int]:
+        buckets = self.buckets
+        for cx, cy in cells:
+            bucket = buckets.get(_key(cx, cy))
+            if bucket:
+                yield from bucket
+
+    def within(self, x, y, radius) -> List[int]:
+        """Rows of the robots at distance <= radius of (x, y), in no particular order."""
+        if radius < 0:
+            return []
+        x0, y0 = self.cell(x - radius, y - radius)
+        x1, y1 = self.cell(x + radius, y + radius)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self.buckets):
+            candidates = range(len(self))  # the box covers more cells than exist
+        else:
+            candidates = self._rows_in_cells(
+                (cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)
+            )
+        limit = radius * radius
+        distance2 = self._distance2
+        return [row for row in candidates if distance2(row, x, y) <= limit]
+
+    @staticmethod
+    def _ring(cx: int, cy: int, r: int) -> Iterator[Tuple[int, int]]:
+        """Cells at Chebyshev distance exactly r from (cx, cy)."""
+        if r == 0:
+            yield cx, cy
+            return
+        for i in range(cx - r, cx + r + 1):
+            yield i, cy - r
+            yield i, cy + r
+        for j in range(cy - r + 1, cy + r):
+            yield cx - r, j
+            yield cx + r, j
+
+    def nearest(self, x, y, k: int = 1) -> List[Tuple[float, int]]:
+        """(distance, row) of the k robots closest to (x, y), closest first."""
+        k = min(k, len(self))
+        if k <= 0:
+            return []
+        cx, cy = self.cell(x, y)
+        # distance from (x, y) to the nearest edge of its own cell: a robot
+        # outside rings 0..r is at least this plus r cells away
+        inner = max(
+            0,
+            min(
+                x - cx * self.cell_size,
+                (cx + 1) * self.cell_size - x,
+                y - cy * self.cell_size,
+                (cy + 1) * self.cell_size - y,
+            ),
+        )
+        # max-heap of the k best as (-distance2, -row): ties keep the lower row
+        best: List[Tuple[float, int]] = []
+        seen = visited = 0
+        r = 0
+        while True:
+            visited += 8 * r or 1
+            if visited > len(self.buckets):  # as much work as a scan of everything
+                return self._nearest_scan(x, y, k)
+            for row in self._rows_in_cells(self._ring(cx, cy, r)):
+                seen += 1
+                item = (-self._distance2(row, x, y), -row)
+                if len(best) < k:
+                    heapq.heappush(best, item)
+                elif item > best[0]:
+                    heapq.heapreplace(best, item)
+            reach = inner + r * self.cell_size
+            if len(best) == k and -best[0][0] < reach * reach or seen == len(self):
+                break
+            r += 1
+        return sorted((math.sqrt(-d2), -row) for d2, row in best)
+
+    def _nearest_scan(self, x, y, k: int) -> List[Tuple[float, int]]:
+        distance2 = self._distance2
+        found = heapq.nsmallest(
+            k, ((distance2(row, x, y), row) for row in range(len(self)))
+        )
+        return [(math.sqrt(d2), row) for d2, row in found]
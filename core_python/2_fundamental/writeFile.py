@@ -1,32 +1,68 @@
 import os, pathlib
+
+from glossaryStore import GlossaryStore, check_entry
+
 output_file = os.path.join(pathlib.Path(__file__).parent.resolve(), "output.txt")
+# the glossary now lives in an indexed log; output.txt is imported into it once
+glossary_file = os.path.join(pathlib.Path(__file__).parent.resolve(), "glossary.log")
+
+
+def open_glossary():
+    """Opens the glossary store, importing output.txt the first time."""
+    store = GlossaryStore(glossary_file)
+    if not os.path.exists(glossary_file) and os.path.exists(output_file):
+        store.import_file(output_file)
+        store.flush()
+    return store
 
-def add_acronym_definition():
+def add_acronym_definition(store):
     acronym = input("Enter an acronym you want to add: ")
     definition = input(f"Enter the definition for {acronym}: ")
 
-    # append mode to add without overwriting existing content
-    with open(output_file, "a") as file:
-        file.write(f"{acronym}: {definition}\n")
+    # replaces an existing definition instead of appending a duplicate line
+    try:
+        store.upsert(acronym.strip(), definition.strip())
+    except ValueError as error:  # e.g. an empty acronym: back to the menu
+        print(f"Not added: {error}")
 
-def init_acronym_definition():
+def init_acronym_definition(store):
     acronym = input("Enter a first acronym you want to add: ")
     definition = input(f"Enter the definition for {acronym}: ")
 
-    # attention: using 'w' mode will overwrite existing content
-    with open(output_file, "w") as file:
-        file.write(f"{acronym}: {definition}\n")
+    # checked first, so a bad entry does not wipe the glossary
+    try:
+        check_entry(acronym.strip(), definition.strip())
+    except ValueError as error:
+        print(f"Not initialized: {error}")
+        return
+
+    # attention: this removes every existing definition
+    store.clear()
+    store.upsert(acronym.strip(), definition.strip())
+
+def look_up_acronym(store):
+    acronym = input("Enter the acronym to look up: ").strip()
+    print(f"{acronym}: {store.get(acronym, 'not found')}")
+
+def delete_acronym(store):
+    acronym = input("Enter the acronym to delete: ").strip()
+    print("Deleted." if store.delete(acronym) else f"{acronym} is not in the glossary.")
 
 def main():
-    while True:
-        choice = input("Do you want to (i)nitialize or (a)dd an acronym definition? (i/a): ").strip().lower()
-        if choice == 'i':
-            init_acronym_definition()
-        elif choice == 'a':
-            add_acronym_definition()
-        else:
-            print("Invalid choice. Program will exit.")
-            break
+    with open_glossary() as store:
+        while True:
+            choice = input("Do you want to (i)nitialize, (a)dd, (l)ook up or (d)elete an acronym definition? (i/a/l/d): ").strip().lower()
+            if choice == 'i':
+                init_acronym_definition(store)
+            elif choice == 'a':
+                add_acronym_definition(store)
+            elif choice == 'l':
+                look_up_acronym(store)
+            elif choice == 'd':
+                delete_acronym(store)
+            else:
+                print("Invalid choice. Program will exit.")
+                break
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
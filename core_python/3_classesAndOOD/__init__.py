@@ -1,3 +1,6 @@
-from .file2 import compute
+from .._lazy import attach
+
+# loaded on first use of the name (PEP 562)
+__getattr__, __dir__ = attach(__name__, {"compute": "file2"})
 
 __all__ = ["compute"]
@@ -1,3 +1,6 @@
-from .file3 import echo
+from .._lazy import attach
+
+# loaded on first use of the name (PEP 562)
+__getattr__, __dir__ = attach(__name__, {"echo": "file3"})
 
 __all__ = ["echo"]
@@ -1,2 +1,15 @@
-__all__ = ["fundamentals_2", "classesAndOOD_3", "collections_4"]
+from ._lazy import attach
+
 __version__ = "0.1.0"
+
+# the package directories start with a digit, so they are reached through these names;
+# nothing is imported until one of them is used (core_python.fundamentals_2.decades, ...)
+_SUBPACKAGES = {
+    "fundamentals_2": "2_fundamental",
+    "classesAndOOD_3": "3_classesAndOOD",
+    "collections_4": "4_collections",
+}
+
+__all__ = list(_SUBPACKAGES)
+
+__getattr__, __dir__ = attach(__name__, {}, _SUBPACKAGES)
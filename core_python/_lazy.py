@@ -0,0 +1,56 @@
+"""Lazy attributes for the ``core_python`` package ``__init__`` files (PEP 562).
+
+A package calls ``attach`` and assigns the result to its module-level
+``__getattr__`` and ``__dir__``. Importing the package then imports none of
+its submodules; a submodule is imported the first time one of its names is
+looked up on the package:
+
+* ``exports``  public name -> submodule that defines it
+  (``package.decades`` imports ``package.dataTypes``)
+* ``aliases``  attribute -> submodule, for directories whose names are not
+  identifiers (``core_python.fundamentals_2`` is ``core_python/2_fundamental``)
+* any other name that is a submodule of the package is imported as is
+
+The value is then stored on the package, so ``__getattr__`` runs only once
+per name.
+"""
+
+import importlib
+import sys
+
+# not typing: importing it would cost more than the rest of the package import
+from collections.abc import Callable, Mapping
+
+
+def attach(
+    package: str,
+    exports: Mapping[str, str],
+    aliases: Mapping[str, str] | None = None,
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """``(__getattr__, __dir__)`` for the package named ``package``."""
+    exports = dict(exports)
+    aliases = dict(aliases or {})
+
+    def __getattr__(name: str):
+        if name in exports:
+            module = importlib.import_module(f"{package}.{exports[name]}")
+            value = getattr(module, name)
+        elif name in aliases:
+            value = importlib.import_module(f"{package}.{aliases[name]}")
+        elif not name.startswith("__") and _is_submodule(package, name):
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports) | set(aliases))
+
+    return __getattr__, __dir__
+
+
+def _is_submodule(package: str, name: str) -> bool:
+    import importlib.util
+
+    return importlib.util.find_spec(f"{package}.{name}") is not None
@@ -1,4 +1,8 @@
 ## this is just an example of what an industry-level __init__.py might look like
+## note: it imports every submodule eagerly, so `import trading_lib` pays for all of them (and
+## runs any import-time code they have). The core_python packages list the same kind of public
+## names but load each submodule on first use instead (PEP 562 __getattr__, see core_python/_lazy.py);
+## benchmarks/check_import_time.py keeps the cold import within budget.
 # src/trading_lib/__init__.py
 
 """
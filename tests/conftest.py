@@ -1,6 +1,29 @@
+import sys
+from pathlib import Path
+
 import pytest
 
+# the 2_fundamental modules import their siblings by plain name (e.g. `from employee import ...`)
+FUNDAMENTAL_DIR = Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental"
+sys.path.insert(0, str(FUNDAMENTAL_DIR))
+
 
 @pytest.fixture
 def sample_list():
     return [1, 2, 3]
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    """Runs a test with numpy and again with the pure-Python fallback.
+
+    The modules to switch are listed in the test module's BACKEND_MODULES;
+    the pure run sets their ``_np`` to None.
+    """
+    modules = request.module.BACKEND_MODULES
+    if request.param == "pure":
+        for module in modules:
+            monkeypatch.setattr(module, "_np", None)
+    elif any(module._np is None for module in modules):
+        pytest.skip("numpy is not installed")
+    return request.param
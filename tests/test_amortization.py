@@ -0,0 +1,150 @@
+import random
+import tracemalloc
+
+import pytest
+
+import amortization
+from amortization import (
+    AmortizationSchedule,
+    batch_schedule,
+    iter_schedule,
+    simulate,
+    summarize,
+    summarize_many,
+)
+
+BACKEND_MODULES = [amortization]
+
+
+def _random_loans(seed, count):
+    rng = random.Random(seed)
+    loans = []
+    for _ in range(count):
+        principal = rng.choice([0.0, rng.uniform(100, 500_000)])
+        annual_rate = rng.choice([0.0, rng.uniform(0.1, 25)])
+        payment = rng.uniform(0, principal / 12 + 100)
+        loans.append((principal, annual_rate, payment))
+    return loans
+
+
+def test_closed_form_matches_loop():
+    for principal, annual_rate, payment in _random_loans(1, 3000):
+        expected = simulate(principal, annual_rate, payment, 360)
+        actual = summarize(principal, annual_rate, payment, 360)
+        assert actual.payoff_month == expected.payoff_month
+        assert actual.months == expected.months
+        assert actual.remaining_balance == pytest.approx(
+            expected.remaining_balance, rel=1e-9, abs=1e-6
+        )
+        assert actual.total_interest == pytest.approx(
+            expected.total_interest, rel=1e-9, abs=1e-6
+        )
+        if actual.payoff_month:
+            assert actual.remaining_balance == 0
+
+
+def test_exact_payoff_boundary_replays_loop():
+    # 1000 at 0% paid 250 a month hits exactly zero in month 4
+    assert summarize(1000, 0, 250, 12) == simulate(1000, 0, 250, 12)
+    assert summarize(1000, 0, 250, 12).payoff_month == 4
+
+
+def test_batch_schedule_is_bit_exact(backend):
+    loans = _random_loans(2, 200)
+    principals, rates, payments = zip(*loans)
+    columns = batch_schedule(principals, rates, payments, 120)
+
+    for index, (principal, annual_rate, payment) in enumerate(loans):
+        money_owed = principal
+        for month, column in enumerate(columns, start=1):
+            if money_owed != 0:
+                money_owed += money_owed * (annual_rate / 100 / 12)
+                money_owed -= payment
+                if money_owed < 0:
+                    money_owed = 0
+            assert column[index] == money_owed, (index, month)
+
+
+def test_summarize_many_matches_summarize(backend):
+    loans = _random_loans(3, 2000) + [(1000, 0, 250), (1000, 12, 5), (0, 5, 10)]
+    principals, rates, payments = zip(*loans)
+    summaries = summarize_many(principals, rates, payments, 360)
+    for summary, loan in zip(summaries, loans):
+        expected = summarize(*loan, 360)
+        assert summary.payoff_month == expected.payoff_month
+        assert summary.months == expected.months
+        assert summary.remaining_balance == pytest.approx(
+            expected.remaining_balance, rel=1e-9, abs=1e-6
+        )
+        assert summary.total_interest == pytest.approx(
+            expected.total_interest, rel=1e-9, abs=1e-6
+        )
+    with pytest.raises(ValueError):
+        summarize_many([1000], [5], [-1], 12)
+
+
+def test_balance_that_is_never_paid_off_overflows_to_inf():
+    # interest outgrows the payment: the loop's balance ends up at inf
+    summary = summarize(1000, 12, 5, 100_000)
+    assert summary.payoff_month is None
+    assert summary.remaining_balance == simulate(1000, 12, 5, 100_000).remaining_balance
+    assert summary.remaining_balance == float("inf")
+    assert summarize_many([1000], [12], [5], 100_000) == [summary]
+
+    row = next(iter_schedule(1000, 12, 5, start=80_000))
+    assert row.month == 80_000
+    assert row.balance == float("inf")
+
+
+def test_overflow_of_both_terms_is_inf_not_nan(backend):
+    # principal * growth and payment * (growth - 1) / rate both overflow
+    expected = simulate(1e300, 100, 8e298, 2000)
+    assert expected.total_interest == expected.remaining_balance == float("inf")
+    assert summarize(1e300, 100, 8e298, 2000) == expected
+    assert summarize_many([1e300], [100], [8e298], 2000) == [expected]
+
+
+def test_nothing_owed_costs_exactly_no_interest(backend):
+    assert summarize(0, 5, 10, 12) == simulate(0, 5, 10, 12)
+    assert summarize(0, 5, 10, 12).total_interest == 0.0
+    assert summarize_many([0], [5], [10], 12) == [simulate(0, 5, 10, 12)]
+
+
+def test_negative_payment_is_rejected():
+    with pytest.raises(ValueError):
+        summarize(1000, 5, -1, 12)
+
+
+def test_schedule_stops_at_payoff_and_matches_loop():
+    rows = list(AmortizationSchedule(1000, 5, 300))
+    assert [row.month for row in rows] == [1, 2, 3, 4]
+    assert rows[-1].balance == 0
+    assert simulate(1000, 5, 300, 12).payoff_month == 4
+
+
+def test_schedule_slice_jumps_ahead():
+    schedule = AmortizationSchedule(300_000, 6, 1798.65, months=360)
+    window = list(schedule[119:180])
+    assert [row.month for row in window] == list(range(120, 181))
+
+    full = list(schedule)
+    for row in window:
+        expected = full[row.month - 1]
+        assert row.balance == pytest.approx(expected.balance, rel=1e-9)
+        assert row.interest == pytest.approx(expected.interest, rel=1e-9)
+    assert schedule[359].month == 360
+
+
+def test_schedule_memory_does_not_grow_with_length():
+    def peak_while_consuming(months):
+        tracemalloc.start()
+        # 0% interest and a tiny payment: never paid off within the window
+        for _ in AmortizationSchedule(1e12, 0, 1, months=months):
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    short = peak_while_consuming(1_000)
+    long = peak_while_consuming(200_000)
+    assert long < short + 4096
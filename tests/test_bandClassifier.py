@@ -0,0 +1,92 @@
+import math
+import random
+
+import pytest
+
+import bandClassifier
+from bandClassifier import Band, BandClassifier, TEMPERATURE_BANDS
+from conditionalsAndImports import (
+    classify_temperatures,
+    condition_demo,
+    temperature_classifier,
+)
+
+
+def chain(temperature):
+    # condition_demo before it became a table
+    if temperature < 0:
+        return "It's freezing!"
+    elif 0 <= temperature < 20:
+        return "It's cold."
+    elif 20 <= temperature < 30:
+        return "It's warm."
+    elif temperature >= 80:
+        return "It's too hot. Stay indoors."
+    else:
+        return "It's hot!"
+
+
+BACKEND_MODULES = [bandClassifier]
+
+
+READINGS = [-40, -0.5, 0, 0.0, 19.99, 20, 29.5, 30, 55, 79.9, 80, 1e9, -math.inf]
+
+
+def test_condition_demo_keeps_its_labels():
+    rng = random.Random(5)
+    for temperature in READINGS + [rng.uniform(-50, 120) for _ in range(1000)]:
+        assert condition_demo(temperature) == chain(temperature)
+
+
+def test_batches_and_streams_agree_with_single_calls(backend):
+    classifier = BandClassifier()
+    rng = random.Random(6)
+    readings = READINGS + [rng.uniform(-50, 120) for _ in range(5000)]
+    codes = classifier.codes(readings)
+    assert codes.typecode == "B"
+    assert list(codes) == [classifier.code(r) for r in readings]
+    assert classifier.labels(codes) == [chain(r) for r in readings]
+    streamed = [
+        c for batch in classifier.iter_codes(iter(readings), 999) for c in batch
+    ]
+    assert streamed == list(codes)
+    assert classifier.counts(iter(readings), 1000) == [
+        list(codes).count(code) for code in range(len(TEMPERATURE_BANDS))
+    ]
+    assert list(classify_temperatures([-1, 25])) == [0, 2]
+    assert list(classifier.codes([])) == []
+
+
+def test_band_edges_and_nan_keep_the_chain_labels(backend):
+    edges = [bound for bound, _ in TEMPERATURE_BANDS[1:]]
+    readings = READINGS + [math.nextafter(edge, -math.inf) for edge in edges]
+    readings += [math.inf, math.nan, 25, math.nan]
+    expected = [chain(r) for r in readings]
+    assert [condition_demo(r) for r in readings] == expected
+    codes = classify_temperatures(readings)
+    assert temperature_classifier.labels(codes) == expected
+    labels = [band.label for band in TEMPERATURE_BANDS]
+    assert temperature_classifier.counts(iter(readings), 7) == [
+        expected.count(label) for label in labels
+    ]
+
+
+def test_nan_goes_to_the_last_band_unless_told_otherwise(backend):
+    table = [(-math.inf, "low"), (0, "mid"), (10, "high")]
+    readings = [-1, math.nan, 5, 20]
+    assert list(BandClassifier(table).codes(readings)) == [0, 2, 1, 2]
+    flagged = BandClassifier(table, nan_code=0)
+    assert list(flagged.codes(readings)) == [0, 0, 1, 2]
+    assert flagged.label(math.nan) == "low"
+    for nan_code in (-1, 3):
+        with pytest.raises(ValueError):
+            BandClassifier(table, nan_code)
+
+
+def test_custom_tables_are_validated():
+    grades = BandClassifier([(-math.inf, "F"), (50, "C"), (70, "B"), (85, "A")])
+    assert [grades.label(score) for score in (10, 50, 84.9, 85)] == list("FCBA")
+    assert grades.bands[1] == Band(50, "C") and len(grades) == 4
+    for bands in ([], [(0, "low")], [(-math.inf, "a"), (5, "b"), (5, "c")]):
+        with pytest.raises(ValueError):
+            BandClassifier(bands)
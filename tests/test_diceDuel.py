@@ -0,0 +1,65 @@
+import builtins
+import importlib
+import random
+import sys
+
+import pytest
+
+import diceDuel
+from diceDuel import exact_probabilities, roll_dice, simulate, wilson_interval
+
+BACKEND_MODULES = [diceDuel]
+
+
+def test_importing_functions_does_not_prompt(monkeypatch):
+    def no_input(prompt=""):
+        raise AssertionError("input() called at import time")
+
+    monkeypatch.setattr(builtins, "input", no_input)
+    monkeypatch.delitem(sys.modules, "functions", raising=False)
+    functions = importlib.import_module("functions")
+    assert callable(functions.dice_duel_demo)
+
+
+def test_demo_rolls_one_duel_and_reports_odds(monkeypatch, capsys):
+    names = iter(["Ann", "Bob"])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(names))
+    importlib.import_module("functions").dice_duel_demo(random.Random(2), duels=1000)
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 4 and lines[1].startswith("Ann wins") and "95% CI" in lines[1]
+
+
+@pytest.mark.parametrize(
+    "players, dice, sides", [(2, 1, 6), (3, 2, 6), (4, 3, 10), (2, 1, 300)]
+)
+def test_estimates_match_exact_odds(backend, players, dice, sides):
+    stats = simulate(60_000, players, dice, sides, seed=11, batch_size=7000)
+    assert sum(stats.wins) + stats.ties == stats.duels == 60_000
+    *win, tie = exact_probabilities(players, dice, sides)
+    for player in range(players):
+        assert abs(stats.probability(player) - win[player]) < 0.01
+        low, high = stats.interval(player, z=4)
+        assert low < win[player] < high
+    assert abs(stats.tie_probability - tie) < 0.01
+
+
+def test_same_seed_same_duels_on_both_paths(monkeypatch):
+    first = simulate(20_000, players=3, dice=2, seed=5)
+    assert simulate(20_000, players=3, dice=2, seed=5) == first
+    monkeypatch.setattr(diceDuel, "_np", None)
+    assert simulate(20_000, players=3, dice=2, seed=5) == first
+
+
+def test_bulk_rolls_are_uniform():
+    rolls = roll_dice(random.Random(1), 70_000, sides=7)
+    assert len(rolls) == 70_000
+    counts = [rolls.count(face) for face in range(1, 8)]
+    assert sum(counts) == 70_000 and all(abs(c - 10_000) < 500 for c in counts)
+    with pytest.raises(ValueError):
+        roll_dice(random.Random(), 1, sides=1)
+
+
+def test_wilson_interval():
+    assert wilson_interval(0, 10) == pytest.approx((0.0, 0.2775), abs=1e-4)
+    assert wilson_interval(5, 10) == pytest.approx((0.2366, 0.7634), abs=1e-4)
+    assert wilson_interval(0, 0) == (0.0, 1.0)
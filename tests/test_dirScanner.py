@@ -0,0 +1,119 @@
+import os
+
+import pytest
+
+import dirScanner
+from dirScanner import group_by_directory, scan_tree
+
+
+def make_tree(root):
+    for relative, content in [
+        ("a.zip", b"zz"),
+        ("notes.txt", b"hello"),
+        ("sub/inner.py", b"x = 1\n"),
+        ("sub/deeper/.hidden", b""),
+        ("sub/deeper/archive.tar.gz", b"123"),
+        ("empty/", None),
+    ]:
+        path = root / relative
+        if content is None:
+            path.mkdir(parents=True)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_scan_tree_matches_os_walk_and_stat(tmp_path, workers):
+    make_tree(tmp_path)
+    expected = {}
+    for directory, dir_names, file_names in os.walk(tmp_path):
+        for name in dir_names:
+            path = os.path.join(directory, name)
+            stat = os.stat(path)
+            expected[path] = (0, "", stat.st_mtime, True, stat.st_ino)
+        for name in file_names:
+            path = os.path.join(directory, name)
+            stat = os.stat(path)
+            expected[path] = (
+                stat.st_size,
+                os.path.splitext(name)[1],
+                stat.st_mtime,
+                False,
+                stat.st_ino,
+            )
+
+    records = list(scan_tree(tmp_path, workers=workers))
+
+    assert len(records) == len(expected)
+    assert {r.path: tuple(r[1:]) for r in records} == expected
+
+
+def test_non_recursive_scan_lists_one_level(tmp_path):
+    make_tree(tmp_path)
+    names = sorted(r.name for r in scan_tree(tmp_path, recursive=False))
+    assert names == ["a.zip", "empty", "notes.txt", "sub"]
+
+
+def test_group_by_directory_is_top_down_like_os_walk(tmp_path):
+    make_tree(tmp_path)
+    grouped = list(group_by_directory(tmp_path, scan_tree(tmp_path, workers=4)))
+    walked = list(os.walk(tmp_path))
+
+    assert sorted(d for d, _ in grouped) == sorted(d for d, _, _ in walked)
+    assert grouped[0][0] == str(tmp_path)
+    seen = set()
+    for directory, files in grouped:
+        assert directory == str(tmp_path) or os.path.dirname(directory) in seen
+        seen.add(directory)
+    assert {d: sorted(r.name for r in files) for d, files in grouped} == {
+        d: sorted(names) for d, _, names in walked
+    }
+
+
+def test_unreadable_directory_is_skipped(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(path) == "sub":
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(dirScanner.os, "scandir", scandir)
+    paths = {r.path for r in scan_tree(tmp_path, workers=1)}
+    assert str(tmp_path / "sub") in paths
+    assert str(tmp_path / "sub" / "inner.py") not in paths
+
+
+def make_links(root):
+    (root / "target").mkdir()
+    (root / "target" / "kept.txt").write_bytes(b"12345")
+    (root / "big.bin").write_bytes(b"x" * 100)
+    os.symlink(root / "big.bin", root / "file_link")
+    os.symlink(root / "target", root / "dir_link")
+    os.symlink(root / "nowhere", root / "broken_link")
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_symlinks_are_listed_like_is_file_and_getsize(tmp_path, workers):
+    make_links(tmp_path)
+    # the listing before the scanner: is_file()/is_dir() and getsize follow links
+    expected = {}
+    for entry in os.scandir(tmp_path):
+        if entry.is_file():
+            expected[entry.name] = (False, os.path.getsize(entry.path))
+        elif entry.is_dir():
+            expected[entry.name] = (True, 0)
+
+    records = list(scan_tree(tmp_path, workers=workers))
+
+    top = {r.name: (r.is_dir, r.size) for r in records if r.parent == str(tmp_path)}
+    assert top == expected
+    assert top["file_link"] == (False, 100) and top["dir_link"] == (True, 0)
+    assert "broken_link" not in top
+    # like os.walk, the scan does not go through the directory link
+    assert str(tmp_path / "target" / "kept.txt") in {r.path for r in records}
+    assert not any(r.parent == str(tmp_path / "dir_link") for r in records)
+    grouped = [d for d, _ in group_by_directory(tmp_path, records)]
+    assert sorted(grouped) == sorted(d for d, _, _ in os.walk(tmp_path))
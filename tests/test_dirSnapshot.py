@@ -0,0 +1,109 @@
+import os
+import random
+
+import pytest
+
+import dirSnapshot
+from dirSnapshot import Snapshot, diff, refresh
+
+
+def touch(path, content=b""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "root"
+    for i in range(30):
+        touch(root / f"d{i % 4}" / f"sub{i % 3}" / f"f{i}.txt", b"x" * i)
+    touch(root / "top.zip", b"zip")
+    return root
+
+
+def as_sets(changes):
+    return (
+        {r.path for r in changes.added},
+        set(changes.removed),
+        {r.path for r in changes.modified},
+    )
+
+
+def test_save_and_load_round_trip(tree, tmp_path):
+    snapshot = Snapshot.take(tree)
+    snapshot.save(tmp_path / "tree.snapshot")
+    loaded = Snapshot.load(tmp_path / "tree.snapshot", tree)
+
+    assert loaded.paths == snapshot.paths
+    assert (loaded.inodes, loaded.sizes, loaded.mtimes, loaded.dirs) == (
+        snapshot.inodes,
+        snapshot.sizes,
+        snapshot.mtimes,
+        snapshot.dirs,
+    )
+    assert loaded.root_mtime == snapshot.root_mtime
+    assert Snapshot.load(tmp_path / "missing.snapshot", tree) is None
+    (tmp_path / "torn.snapshot").write_bytes(
+        (tmp_path / "tree.snapshot").read_bytes()[:-3]
+    )
+    assert Snapshot.load(tmp_path / "torn.snapshot", tree) is None
+
+
+def test_refresh_without_changes_reports_nothing(tree):
+    snapshot = Snapshot.take(tree)
+    current, changes = refresh(snapshot)
+    assert not changes
+    assert current.paths == snapshot.paths
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_refresh_matches_a_full_walk(tree, seed, monkeypatch):
+    rng = random.Random(seed)
+    monkeypatch.setattr(dirSnapshot, "STAT_CHUNK", 5)  # exercise the threaded stat
+    before = Snapshot.take(tree)
+    files = [p for p in tree.rglob("*") if p.is_file()]
+    for path in rng.sample(files, 4):
+        path.unlink()
+    for path in rng.sample([p for p in files if p.exists()], 4):
+        path.write_bytes(path.read_bytes() + b"more")
+    touch(tree / "d1" / "new.zip", b"new")
+    touch(tree / "fresh" / "deep" / "a.txt", b"a")
+    os.rename(tree / "d2" / "sub0", tree / "d2" / "renamed")
+
+    current, changes = refresh(before, workers=seed % 3 + 1)
+
+    expected = diff(before, Snapshot.take(tree))
+    assert as_sets(changes) == as_sets(expected)
+    assert sorted(current.paths) == sorted(Snapshot.take(tree).paths)
+    assert not refresh(current)[1]
+
+
+def test_refresh_follows_symlinks_like_the_scan(tree):
+    (tree / "target").mkdir()
+    os.symlink(tree / "top.zip", tree / "zip_link")
+    os.symlink(tree / "target", tree / "dir_link")
+    snapshot = Snapshot.take(tree)
+    assert refresh(snapshot, workers=1)[1] == diff(snapshot, Snapshot.take(tree))
+    assert not refresh(snapshot, workers=1)[1]
+
+    (tree / "top.zip").write_bytes(b"a longer zip")
+    touch(tree / "target" / "new.txt")  # seen under target, not under the link
+    os.remove(tree / "d0" / "sub0" / "f0.txt")
+    os.symlink(tree / "d0" / "sub0" / "f0.txt", tree / "broken_link")
+    _, changes = refresh(snapshot, workers=1)
+    assert as_sets(changes) == (
+        {str(tree / "target" / "new.txt")},
+        {str(tree / "d0" / "sub0" / "f0.txt")},
+        {str(tree / "top.zip"), str(tree / "zip_link")},
+    )
+
+
+def test_excluded_paths_are_not_reported(tree):
+    snapshot_path = tree / "state.snapshot"
+    before = Snapshot.take(tree, exclude={str(snapshot_path)})
+    before.save(snapshot_path)
+
+    current, changes = refresh(before, exclude={str(snapshot_path)})
+    assert str(snapshot_path) not in {r.path for r in changes.added}
+    current.save(snapshot_path)
+    assert not refresh(current, exclude={str(snapshot_path)})[1]
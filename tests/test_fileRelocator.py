@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+import fileRelocator
+from dirScanner import scan_tree
+from fileRelocator import plan_moves, relocate
+
+
+@pytest.fixture
+def source(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for name, size in [("a.zip", 10), ("b.ZIP", 3), ("c.tar.gz", 7), ("d.txt", 1)]:
+        (src / name).write_bytes(b"x" * size)
+    (src / "folder.zip").mkdir()
+    return src
+
+
+def test_plan_moves_matches_patterns_case_sensitively(source, tmp_path):
+    records = scan_tree(source, recursive=False)
+    moves = plan_moves(records, tmp_path / "dst", ("*.zip", "*.tar.gz"))
+    assert sorted((os.path.basename(m.src), m.size) for m in moves) == [
+        ("a.zip", 10),
+        ("c.tar.gz", 7),
+    ]
+    assert all(m.dst == str(tmp_path / "dst" / os.path.basename(m.src)) for m in moves)
+
+
+@pytest.mark.parametrize("cross_device", [False, True])
+def test_relocate_moves_files_and_counts(source, tmp_path, monkeypatch, cross_device):
+    if cross_device:
+        monkeypatch.setattr(fileRelocator, "_st_dev", lambda d: hash(d))
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    moves = plan_moves(scan_tree(source), dst, ("*.zip", "*.gz"))
+    seen = []
+
+    stats = relocate(moves, workers=2, progress=seen.append)
+
+    assert sorted(os.listdir(dst)) == ["a.zip", "c.tar.gz"]
+    assert sorted(os.listdir(source)) == ["b.ZIP", "d.txt", "folder.zip"]
+    assert (dst / "a.zip").read_bytes() == b"x" * 10
+    assert (stats.files, stats.bytes, stats.errors) == (2, 17, ())
+    assert (stats.copied, stats.renamed) == ((2, 0) if cross_device else (0, 2))
+    assert [s.files for s in seen] == [1, 2]
+
+
+def test_existing_destination_is_reported_not_overwritten(source, tmp_path):
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    (dst / "a.zip").write_bytes(b"keep")
+
+    stats = relocate(plan_moves(scan_tree(source), dst))
+
+    assert stats.files == 0
+    assert [src for src, _ in stats.errors] == [str(source / "a.zip")]
+    assert (dst / "a.zip").read_bytes() == b"keep"
+    assert (source / "a.zip").exists()
+
+
+def test_repeated_destinations_are_rejected(source, tmp_path):
+    (source / "nested").mkdir()
+    (source / "nested" / "a.zip").write_bytes(b"other")
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    with pytest.raises(ValueError, match="a.zip"):
+        plan_moves(scan_tree(source), dst)
+
+    # hand-built moves are checked by relocate: the second one is not run
+    moves = [
+        fileRelocator.Move(str(source / "a.zip"), str(dst / "a.zip"), 10),
+        fileRelocator.Move(str(source / "nested" / "a.zip"), str(dst / "a.zip"), 5),
+    ]
+    stats = relocate(moves)
+    assert stats.files == 1
+    assert [src for src, _ in stats.errors] == [str(source / "nested" / "a.zip")]
+    assert (dst / "a.zip").read_bytes() == b"x" * 10
+    assert (source / "nested" / "a.zip").exists()
+
+
+def test_dry_run_changes_nothing(source, tmp_path, capsys):
+    stats = relocate(plan_moves(scan_tree(source), tmp_path / "dst"), dry_run=True)
+    assert stats.files == 0
+    assert "[DRY-RUN] move:" in capsys.readouterr().out
+    assert (source / "a.zip").exists() and not (tmp_path / "dst").exists()
@@ -0,0 +1,144 @@
+import errno
+import os
+import shutil
+
+import pytest
+
+import fileUtils
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"a", b"a\n", b"a\nb", b"one\r\ntwo\r\n", b"\n\n\n", b"x" * 5000 + b"\ny"],
+)
+def test_fast_line_counts_match_text_mode(tmp_path, content):
+    path = tmp_path / "data.txt"
+    path.write_bytes(content)
+    expected = fileUtils.count_lines_in_file(path)
+    assert fileUtils.count_lines_fast(path, buffer_size=7) == expected
+    assert fileUtils.count_lines_mmap(path, buffer_size=7) == expected
+
+
+def test_read_chunks_and_mmap_view_return_file_bytes(tmp_path):
+    path = tmp_path / "data.bin"
+    content = bytes(range(256)) * 40
+    path.write_bytes(content)
+
+    assert (
+        b"".join(bytes(chunk) for chunk in fileUtils.read_chunks(path, 1000)) == content
+    )
+    with fileUtils.mmap_view(path) as view:
+        assert view[100:110] == content[100:110]
+
+
+def test_read_line_at_offset(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_bytes(b"first\nsecond\nthird")
+    assert fileUtils.read_line_at(path, 6) == b"second\n"
+    assert fileUtils.read_line_at(path, 13) == b"third"
+
+
+def test_line_index_random_access(tmp_path):
+    path = tmp_path / "log.txt"
+    lines = [f"line {i}\n" for i in range(5000)]
+    path.write_text("".join(lines))
+
+    assert fileUtils.get_line(path, 4321) == "line 4321\n"
+    assert fileUtils.get_lines(path, 10, 13) == lines[10:13]
+    assert (tmp_path / "log.txt.lidx").exists()
+    with pytest.raises(IndexError):
+        fileUtils.get_line(path, 5000)
+
+
+def test_line_index_follows_appends_and_rewrites(tmp_path):
+    path = tmp_path / "log.txt"
+    fileUtils.write_file(path, "a\nb")
+    index = fileUtils.build_line_index(path)
+    assert len(index) == 2
+
+    fileUtils.append_to_file(path, "c\nd\n")  # continues line "b", then adds "d"
+    assert list(fileUtils.load_line_index(path).offsets) == [0, 2, 5]
+    assert fileUtils.get_lines(path, 0, None) == ["a\n", "bc\n", "d\n"]
+
+    fileUtils.append_to_file(path, "e")
+    assert fileUtils.get_line(path, 3) == "e"
+
+    fileUtils.write_file(path, "x\ny\n" * 10)  # not an append: size/mtime invalidate it
+    assert fileUtils.get_line(path, 19) == "y\n"
+
+
+@pytest.mark.parametrize("strategies", ["all", "partial", "sendfile", "buffered"])
+def test_copy_file_fast_matches_copy2(tmp_path, monkeypatch, strategies):
+    if strategies == "partial":  # copy_file_range gives up midway, sendfile resumes
+        calls = []
+        real_copy_file_range = os.copy_file_range
+
+        def flaky(src, dst, count, offset_src, offset_dst):
+            calls.append(offset_src)
+            if len(calls) > 1:
+                raise OSError(errno.EXDEV, "cross-device")
+            return real_copy_file_range(src, dst, 1000, offset_src, offset_dst)
+
+        monkeypatch.setattr(fileUtils.os, "copy_file_range", flaky)
+    elif strategies != "all":
+
+        def unsupported(*args):
+            raise OSError(errno.ENOSYS, "not supported")
+
+        monkeypatch.setattr(fileUtils.os, "copy_file_range", unsupported, raising=False)
+        if strategies == "buffered":
+            monkeypatch.setattr(fileUtils.os, "sendfile", unsupported, raising=False)
+    source = tmp_path / "source.bin"
+    source.write_bytes(os.urandom(3 * fileUtils.DEFAULT_BUFFER_SIZE + 17))
+    os.chmod(source, 0o640)
+    os.utime(source, ns=(1_000_000_000, 2_000_000_000))
+    (tmp_path / "out").mkdir()
+
+    destination = fileUtils.copy_file_fast(source, tmp_path / "out")
+
+    assert destination == str(tmp_path / "out" / "source.bin")
+    assert (tmp_path / "out" / "source.bin").read_bytes() == source.read_bytes()
+    copied = os.stat(destination)
+    assert copied.st_mtime_ns == 2_000_000_000
+    assert copied.st_mode == os.stat(source).st_mode
+
+
+def test_bulk_copy_and_move_report_totals(tmp_path):
+    sources = []
+    for i in range(20):
+        path = tmp_path / f"f{i}.dat"
+        path.write_bytes(bytes([i]) * (i * 1000))
+        sources.append(path)
+    (tmp_path / "copies").mkdir()
+    (tmp_path / "moved").mkdir()
+
+    stats = fileUtils.bulk_copy(
+        [(p, tmp_path / "copies" / p.name) for p in sources], workers=4
+    )
+    assert (stats.files, stats.bytes) == (20, sum(i * 1000 for i in range(20)))
+    assert stats.bytes_per_second > 0
+
+    stats = fileUtils.bulk_move([(p, tmp_path / "moved") for p in sources], workers=4)
+    assert stats.files == 20
+    assert not any(p.exists() for p in sources)
+    for i in range(20):
+        expected = bytes([i]) * (i * 1000)
+        assert (tmp_path / "copies" / f"f{i}.dat").read_bytes() == expected
+        assert (tmp_path / "moved" / f"f{i}.dat").read_bytes() == expected
+
+
+def test_bulk_copy_raises_on_missing_source(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        fileUtils.bulk_copy([(tmp_path / "missing", tmp_path / "copy")])
+
+
+def test_copy_onto_itself_raises_and_keeps_the_data(tmp_path, monkeypatch):
+    source = tmp_path / "a.txt"
+    source.write_bytes(b"keep me")
+    monkeypatch.chdir(tmp_path)
+    for destination in (source, tmp_path, "."):
+        with pytest.raises(shutil.SameFileError):
+            fileUtils.copy_file_fast(source, destination)
+    with pytest.raises(shutil.SameFileError):
+        fileUtils.bulk_copy([(source, tmp_path)])
+    assert source.read_bytes() == b"keep me"
@@ -0,0 +1,92 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from glossarySearch import (
+    DEFINITION,
+    EXACT,
+    FUZZY,
+    PREFIX,
+    GlossarySearch,
+    TermIndex,
+    did_you_mean,
+    edit_distance,
+)
+
+INPUT_TXT = (
+    Path(__file__).resolve().parents[1] / "core_python" / "2_fundamental" / "input.txt"
+)
+
+
+def osa_distance(a, b):
+    """Textbook optimal string alignment distance, the reference for edit_distance."""
+    d = [
+        [i + j if i * j == 0 else 0 for j in range(len(b) + 1)]
+        for i in range(len(a) + 1)
+    ]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(
+                d[i - 1][j] + 1,
+                d[i][j - 1] + 1,
+                d[i - 1][j - 1] + (a[i - 1] != b[j - 1]),
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[-1][-1]
+
+
+def test_edit_distance_matches_reference():
+    rng = random.Random(7)
+    for _ in range(3000):
+        a = "".join(rng.choice("abc") for _ in range(rng.randint(0, 7)))
+        b = "".join(rng.choice("abc") for _ in range(rng.randint(0, 7)))
+        for limit in (1, 2):
+            assert edit_distance(a, b, limit) == min(osa_distance(a, b), limit + 1)
+
+
+def test_term_index_fuzzy_is_exact():
+    rng = random.Random(11)
+    terms = {
+        "".join(rng.choice("abcd") for _ in range(rng.randint(1, 6)))
+        for _ in range(300)
+    }
+    index = TermIndex(terms, 2)
+    for _ in range(200):
+        query = "".join(rng.choice("abcd") for _ in range(rng.randint(1, 6)))
+        for limit in (1, 2):
+            expected = {t for t in terms if osa_distance(query, t) <= limit}
+            assert {index.terms[i] for _, i in index.fuzzy(query, limit)} == expected
+
+
+def test_prefix_search_is_sorted_and_limited():
+    search = GlossarySearch([("API", "a"), ("APR", "b"), ("APIM", "c"), ("BPI", "d")])
+    assert [s.acronym for s in search.prefix("ap")] == ["API", "APIM", "APR"]
+    assert [s.acronym for s in search.prefix("AP", limit=2)] == ["API", "APIM"]
+    assert all(s.kind == PREFIX for s in search.prefix("ap"))
+
+
+@pytest.fixture(scope="module")
+def glossary():
+    return GlossarySearch.from_file(INPUT_TXT)
+
+
+def test_suggest_ranks_exact_prefix_fuzzy_then_definitions(glossary):
+    assert glossary.suggest("cpu")[0][:3] == ("CPU", "Central Processing Unit", EXACT)
+    kinds = [s.kind for s in glossary.suggest("CPX")]
+    assert kinds == sorted(kinds)
+    assert ("CPU", FUZZY) in [(s.acronym, s.kind) for s in glossary.suggest("CPX")]
+    by_word = glossary.suggest("procesing")
+    assert "CPU" in [s.acronym for s in by_word if s.kind == DEFINITION]
+
+
+def test_short_queries_do_not_match_everything(glossary):
+    assert glossary.fuzzy("zq") == []
+
+
+def test_did_you_mean():
+    acronyms = {"API": "x", "OOP": "y", "IDE": "z"}
+    assert did_you_mean("APY", acronyms) == ["API"]
+    assert did_you_mean("API", acronyms) == []
+    assert did_you_mean("XYZ", acronyms) == []
@@ -0,0 +1,143 @@
+import builtins
+import random
+
+import pytest
+
+import writeFile
+from glossaryStore import GlossaryStore, parse_glossary_line
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("ML: Machine Learning\n", ("ML", "Machine Learning")),
+        (
+            "IDE - Integrated Development Environment\n",
+            ("IDE", "Integrated Development Environment"),
+        ),
+        ("RE: Re - send: again", ("RE", "Re - send: again")),
+        ("UX - User: experience", ("UX", "User: experience")),
+        ("\n", None),
+        ("no separator here", None),
+    ],
+)
+def test_parse_both_glossary_formats(line, expected):
+    assert parse_glossary_line(line) == expected
+
+
+def test_import_lookup_and_reload(tmp_path):
+    (tmp_path / "output.txt").write_text("ML: Machine Learning\nTBH: To be honest\n")
+    (tmp_path / "input.txt").write_text(
+        "API - Application Programming Interface\nML - Markup Language\n"
+    )
+    path = tmp_path / "glossary.log"
+
+    with GlossaryStore(path) as store:
+        assert store.import_file(tmp_path / "output.txt") == 2
+        assert store.import_file(tmp_path / "input.txt") == 2
+        assert store["ML"] == "Markup Language"  # the later import wins
+        assert store.get("NOPE") is None
+        with pytest.raises(KeyError):
+            store["NOPE"]
+
+    reopened = GlossaryStore(path)
+    assert dict(reopened.items()) == {
+        "ML": "Markup Language",
+        "TBH": "To be honest",
+        "API": "Application Programming Interface",
+    }
+    assert reopened.garbage == 1
+
+
+def test_random_operations_match_a_dict_and_compaction_bounds_the_log(tmp_path):
+    rng = random.Random(7)
+    path = tmp_path / "glossary.log"
+    store = GlossaryStore(path, min_garbage=50)
+    expected = {}
+    for step in range(5000):
+        key = f"K{rng.randrange(100)}"
+        if rng.random() < 0.2:
+            assert store.delete(key) == (key in expected)
+            expected.pop(key, None)
+        else:
+            store[key] = expected[key] = f"definition {step} ünïcode"
+        if step % 997 == 0:
+            assert dict(store.items()) == expected
+    store.close()
+
+    assert dict(GlossaryStore(path).items()) == expected
+    # 5000 writes over 100 keys: without compaction the log would hold all of them
+    assert path.read_text(encoding="utf-8").count("\n") < 300
+
+
+def test_torn_last_record_is_dropped(tmp_path):
+    path = tmp_path / "glossary.log"
+    with GlossaryStore(path) as store:
+        store.update([("A", "first"), ("B", "second")])
+    with open(path, "ab") as file:
+        file.write(b"S\tC\tnever fini")
+
+    store = GlossaryStore(path)
+    assert dict(store.items()) == {"A": "first", "B": "second"}
+    store["C"] = "third"
+    store.close()
+    assert dict(GlossaryStore(path).items()) == {
+        "A": "first",
+        "B": "second",
+        "C": "third",
+    }
+
+
+def test_readers_leave_a_torn_record_alone(tmp_path):
+    # the tail may be a record another writer is still appending
+    path = tmp_path / "glossary.log"
+    with GlossaryStore(path) as store:
+        store["A"] = "first"
+    with open(path, "ab") as file:
+        file.write(b"S\tB\tsecond, half writ")
+    size = path.stat().st_size
+
+    reader = GlossaryStore(path)
+    assert reader["A"] == "first" and "B" not in reader
+    assert dict(reader.items()) == {"A": "first"}
+    reader.close()
+    assert path.stat().st_size == size
+
+
+def test_malformed_lines_are_skipped(tmp_path):
+    path = tmp_path / "glossary.log"
+    path.write_bytes(
+        b"S\tA\tfirst\nno separator\nX\tB\tunknown\nS\t\tno key\n"
+        b"D\tA\textra\nS\t\xff\tbad utf-8\nS\tC\tthird\n"
+    )
+    store = GlossaryStore(path, min_garbage=1)
+    assert dict(store.items()) == {"A": "first", "C": "third"}
+    assert store.garbage == 5
+    store["D"] = "fourth"  # compacts the malformed lines away
+    store.close()
+    assert path.read_bytes() == b"S\tA\tfirst\nS\tC\tthird\nS\tD\tfourth\n"
+
+
+def test_demo_reprompts_after_an_invalid_acronym(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(writeFile, "glossary_file", str(tmp_path / "glossary.log"))
+    monkeypatch.setattr(writeFile, "output_file", str(tmp_path / "output.txt"))
+    answers = iter(
+        ["a", " ", "blank", "a", "ML", "Machine Learning"]
+        + ["i", "", "x", "l", "ML", "q"]
+    )
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+
+    writeFile.main()
+
+    output = capsys.readouterr().out
+    assert "Not added: invalid acronym ''" in output
+    assert "Not initialized: invalid acronym ''" in output
+    assert "ML: Machine Learning" in output  # the failed initialize kept it
+
+
+def test_invalid_entries_are_rejected(tmp_path):
+    store = GlossaryStore(tmp_path / "glossary.log")
+    with pytest.raises(ValueError):
+        store["A\tB"] = "x"
+    with pytest.raises(ValueError):
+        store["A"] = "two\nlines"
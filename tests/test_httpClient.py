@@ -0,0 +1,245 @@
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+
+import dicJsonAndPip
+from httpClient import AsyncHttpClient, HttpClient
+
+ASTROS = {
+    "number": 2,
+    "people": [
+        {"name": "Alice", "craft": "ISS"},
+        {"name": "Bob", "craft": "Tiangong"},
+    ],
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = (
+        True  # headers and body go out in separate writes  # keep-alive
+    )
+    hits = Counter()
+    version = "v1"
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, data, status=200, headers=()):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.hits[url.path] += 1
+        if url.path == "/etag":
+            etag = f'"{Handler.version}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            else:
+                self.send_json({"version": Handler.version}, headers=[("ETag", etag)])
+        elif url.path == "/lowercase":
+            # header names are case-insensitive, some servers send them in lowercase
+            headers = [("etag", '"v1"'), ("cache-control", "max-age=0")]
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            else:
+                self.send_json({"version": "v1"}, headers=headers)
+        elif url.path == "/not-modified":
+            # a 304 the client has no entry for
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif url.path == "/no-store":
+            self.send_json(
+                {"n": self.hits[url.path]}, headers=[("Cache-Control", "no-store")]
+            )
+        elif url.path == "/flaky":
+            self.send_json(
+                {"ok": self.hits[url.path] > 2},
+                503 if self.hits[url.path] <= 2 else 200,
+            )
+        elif url.path == "/missing":
+            self.send_json({}, 404)
+        elif url.path == "/slow":
+            time.sleep(0.5)
+            self.send_json({})
+        elif url.path == "/astros.json":
+            self.send_json(ASTROS)
+        elif url.path == "/weather":
+            lat = float(parse_qs(url.query)["latitude"][0])
+            self.send_json({"current_weather": {"temperature": lat, "windspeed": 1.0}})
+        else:
+            self.send_json({"path": url.path, "n": self.hits[url.path]})
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client():
+    Handler.hits.clear()
+    Handler.version = "v1"
+    with HttpClient(backoff=0, timeout=2) as client:
+        yield client
+
+
+def test_fresh_responses_come_from_the_cache(server, client):
+    first = client.get(server + "/data")
+    second = client.get(server + "/data")
+    assert not first.from_cache and second.from_cache
+    assert second.json() == {"path": "/data", "n": 1}
+    assert Handler.hits["/data"] == 1
+    assert client.cache.hits == 1
+
+
+def test_params_are_part_of_the_cache_key(server, client):
+    client.get(server + "/data", {"q": 1})
+    client.get(server + "/data", {"q": 2})
+    assert Handler.hits["/data"] == 2
+
+
+def test_stale_entries_are_revalidated_with_etag(server, client):
+    client.cache_ttl = 0.05
+    assert client.get_json(server + "/etag") == {"version": "v1"}
+    time.sleep(0.1)
+    revalidated = client.get(server + "/etag")
+    assert revalidated.from_cache and revalidated.json() == {"version": "v1"}
+    assert client.cache.revalidated == 1
+    Handler.version = "v2"
+    time.sleep(0.1)
+    assert client.get_json(server + "/etag") == {"version": "v2"}
+    assert Handler.hits["/etag"] == 3
+
+
+def test_lowercase_headers_are_understood(server, client):
+    first = client.get(server + "/lowercase")
+    assert first.etag == '"v1"' and first.headers["Cache-Control"] == "max-age=0"
+    # max-age=0: the next get revalidates instead of serving the stale entry
+    second = client.get(server + "/lowercase")
+    assert second.from_cache and second.json() == {"version": "v1"}
+    assert second.etag == '"v1"'
+    assert client.cache.revalidated == 1 and client.cache.hits == 0
+
+
+def test_304_without_a_cached_entry_is_not_cached(server, client):
+    response = client.get(server + "/not-modified")
+    assert response.status == 304 and response.content == b""
+    assert not response.from_cache and len(client.cache) == 0
+    client.get(server + "/not-modified")
+    assert Handler.hits["/not-modified"] == 2
+
+
+def test_cache_counters_are_exact_across_threads(server, client):
+    client.get(server + "/counted")
+    threads = [
+        threading.Thread(
+            target=lambda: [client.get(server + "/counted") for _ in range(500)]
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert (client.cache.misses, client.cache.hits) == (1, 4000)
+
+
+def test_no_store_is_not_cached(server, client):
+    assert client.get_json(server + "/no-store") == {"n": 1}
+    assert client.get_json(server + "/no-store") == {"n": 2}
+
+
+def test_server_errors_are_retried(server, client):
+    assert client.get_json(server + "/flaky") == {"ok": True}
+    assert Handler.hits["/flaky"] == 3
+
+
+def test_client_errors_raise(server, client):
+    with pytest.raises(requests.HTTPError):
+        client.get(server + "/missing")
+    assert Handler.hits["/missing"] == 1
+
+
+def test_timeout(server):
+    with HttpClient(timeout=0.1, retries=0) as client:
+        with pytest.raises(requests.Timeout):
+            client.get(server + "/slow")
+
+
+def test_get_many_keeps_order(server, client):
+    urls = [f"{server}/item{i}" for i in range(20)]
+    responses = client.get_many(urls, workers=5)
+    assert [r.json()["path"] for r in responses] == [f"/item{i}" for i in range(20)]
+
+
+def test_async_client_shares_the_cache(server, client):
+    async def run():
+        fetcher = AsyncHttpClient(client, concurrency=4)
+        urls = [f"{server}/async{i % 5}" for i in range(5)]
+        first = await fetcher.get_many(urls)
+        second = await fetcher.get_many(urls + [server + "/missing"], True)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert [r.json()["path"] for r in first] == [f"/async{i}" for i in range(5)]
+    assert all(r.from_cache for r in second[:5])
+    assert isinstance(second[5], requests.HTTPError)
+
+
+def test_iter_json_array_streams_the_response(server, client):
+    people = list(client.iter_json_array(server + "/astros.json", key="people"))
+    assert people == ASTROS["people"]
+    assert len(client.cache) == 0
+
+
+def test_demos_use_the_client(server, client, capsys):
+    assert (
+        dicJsonAndPip.request_astronauts_in_space(client, server + "/astros.json")
+        == ASTROS
+    )
+    weather = dicJsonAndPip.request_whether(
+        {"A": (1.5, 2.0), "B": (3.5, 4.0)}, client, server + "/weather"
+    )
+    assert {
+        city: w["current_weather"]["temperature"] for city, w in weather.items()
+    } == {
+        "A": 1.5,
+        "B": 3.5,
+    }
+    output = capsys.readouterr().out
+    assert "- Alice on the ISS" in output and "B: 3.5°C" in output
+    # the weather fetcher's worker threads are gone, the shared client still works
+    assert not [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("ThreadPoolExecutor")
+    ]
+    assert client.get(server + "/astros.json").json() == ASTROS
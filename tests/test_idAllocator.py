@@ -0,0 +1,102 @@
+import multiprocessing
+import os
+import pickle
+import threading
+
+import pytest
+
+from classesAndObjects import Robot, Robot_Dog
+from idAllocator import (
+    FileBlockSource,
+    IdAllocator,
+    LocalBlockSource,
+    SharedBlockSource,
+)
+
+
+def draw_in_threads(allocator, threads, count):
+    results = [[] for _ in range(threads)]
+    start = threading.Barrier(threads)
+
+    def work(out):
+        start.wait()
+        out.extend(allocator.next_id() for _ in range(count))
+
+    workers = [threading.Thread(target=work, args=(out,)) for out in results]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+
+def test_ids_are_unique_and_increasing_per_thread():
+    allocator = IdAllocator(block_size=7)
+    results = draw_in_threads(allocator, 16, 500)
+    everything = [number for ids in results for number in ids]
+    assert len(set(everything)) == len(everything) == 16 * 500
+    assert all(ids == sorted(ids) for ids in results)
+    # unused block ends are skipped, never handed out again
+    top = max(everything)
+    assert top < allocator.reserve(3)[0] <= top + 16 * 7
+    with pytest.raises(ValueError):
+        IdAllocator(block_size=0)
+
+
+def test_single_thread_counts_like_the_old_counter():
+    allocator = IdAllocator(LocalBlockSource(start=10), block_size=2)
+    assert [allocator.next_id() for _ in range(5)] == [10, 11, 12, 13, 14]
+
+
+def draw_in_process(allocator, count, queue):
+    queue.put([allocator.next_id() for _ in range(count)])
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+@pytest.mark.parametrize("shared", ["file", "memory"])
+def test_ids_are_unique_across_processes(tmp_path, shared):
+    context = multiprocessing.get_context("fork")
+    if shared == "file":
+        source = FileBlockSource(tmp_path / "robot.ids")
+    else:
+        source = SharedBlockSource(context=context)
+    allocator = IdAllocator(source, block_size=16)
+    held = [allocator.next_id()]  # the parent holds a block while forking
+    queue = context.Queue()
+    processes = [
+        context.Process(target=draw_in_process, args=(allocator, 100, queue))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    results = [queue.get(timeout=30) for _ in processes]
+    for process in processes:
+        process.join()
+    held += [allocator.next_id() for _ in range(100)]
+    everything = held + [number for ids in results for number in ids]
+    assert len(set(everything)) == len(everything) == 501
+
+
+def test_file_source_continues_where_it_stopped(tmp_path):
+    path = tmp_path / "robot.ids"
+    assert FileBlockSource(path).take(5) == 1
+    assert FileBlockSource(path, start=100).take(5) == 6
+    copy = pickle.loads(pickle.dumps(IdAllocator(FileBlockSource(path))))
+    assert copy.next_id() == 11
+    assert os.path.getsize(path) == 20
+
+
+def test_each_robot_class_counts_on_its_own():
+    class Scout(Robot_Dog):
+        pass
+
+    start = Robot_Dog.increment_sequence()
+    # a new subclass starts from its parent's number, as cls.sequence_number += 1 did
+    assert Scout.increment_sequence() == start + 1
+    assert Scout.increment_sequence() == Scout.sequence_number == start + 2
+    assert Robot_Dog.increment_sequence() == Robot_Dog.sequence_number == start + 1
+    robot = Robot.increment_sequence()
+    assert Robot.increment_sequence() == Robot.sequence_number == robot + 1
+    assert Robot_Dog.sequence_number == start + 1
@@ -0,0 +1,105 @@
+import io
+import json
+import random
+
+import pytest
+
+import jsonCodec
+from jsonCodec import (
+    available_backends,
+    dump_lines,
+    get_backend,
+    iter_array,
+    iter_lines,
+)
+
+DOCUMENT = {
+    "message": "success, [not] an {array}",
+    "skipped": {"nested": [1, 2, {"deep": None}]},
+    "people": [
+        {"name": "Zoë Ølsen", "craft": "ISS", "age": 123456789},
+        -1.5e-3,
+        'a "quoted" ] string, with commas',
+        [],
+        {},
+        True,
+        None,
+        1234567890123,
+        "雪",
+    ],
+    "number": 9,
+}
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_backends_round_trip(name):
+    codec = get_backend(name)
+    data = codec.dumps(DOCUMENT)
+    assert isinstance(data, bytes)
+    assert codec.loads(data) == DOCUMENT
+    assert codec.loads(codec.dumps({2: 3})) == {"2": 3}
+
+
+def test_json_is_always_available_and_big_ints_encode():
+    assert available_backends()[-1] == "json"
+    assert jsonCodec.loads(jsonCodec.dumps([2**70])) == [2**70]
+    with pytest.raises(ValueError):
+        get_backend("yaml")
+
+
+def test_json_lines_round_trip():
+    records = [{"id": i, "name": f"n{i}"} for i in range(10_000)]
+    file = io.BytesIO()
+    assert dump_lines(records, file) == len(records)
+    file.seek(0)
+    assert list(iter_lines(io.BytesIO(file.getvalue() + b"\n\n"))) == records
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 64, 1 << 16])
+def test_iter_array_matches_json_loads(chunk_size):
+    encoded = json.dumps(DOCUMENT, indent=2, ensure_ascii=False).encode("utf-8")
+    streamed = iter_array(io.BytesIO(encoded), key="people", chunk_size=chunk_size)
+    assert list(streamed) == DOCUMENT["people"]
+    plain = json.dumps(DOCUMENT["people"])
+    assert list(iter_array(io.StringIO(plain), chunk_size=chunk_size)) == (
+        DOCUMENT["people"]
+    )
+
+
+def test_numbers_split_across_chunks_are_not_truncated():
+    rng = random.Random(5)
+    numbers = [rng.randrange(10**12) for _ in range(500)] + [0.5, -12.25e10]
+    encoded = json.dumps(numbers).encode()
+    for chunk_size in range(1, 12):
+        assert list(iter_array(io.BytesIO(encoded), chunk_size=chunk_size)) == numbers
+    assert list(iter_array(io.BytesIO(b"[12345]"), chunk_size=3)) == [12345]
+
+
+def test_iter_array_reads_lazily():
+    encoded = b"[" + b",".join(b'{"i": %d}' % i for i in range(100_000)) + b"]"
+    file = io.BytesIO(encoded)
+    items = iter_array(file, chunk_size=1024)
+    assert next(items) == {"i": 0}
+    assert file.tell() <= 2048
+
+
+@pytest.mark.parametrize(
+    "data, key, error",
+    [
+        (b'{"number": 1}', "people", KeyError),
+        (b"{}", "people", KeyError),
+        (b'{"people": 3}', "people", json.JSONDecodeError),
+        (b"[1, 2", None, json.JSONDecodeError),
+        (b'[1, 2, {"a": ', None, json.JSONDecodeError),
+        (b"[1 2]", None, json.JSONDecodeError),
+        (b"", None, json.JSONDecodeError),
+    ],
+)
+def test_iter_array_errors(data, key, error):
+    with pytest.raises(error):
+        list(iter_array(io.BytesIO(data), key=key, chunk_size=2))
+
+
+def test_empty_arrays():
+    assert list(iter_array(io.BytesIO(b"  [ ] "))) == []
+    assert list(iter_array(io.BytesIO(b'{"people": []}'), key="people")) == []
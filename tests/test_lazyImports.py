@@ -0,0 +1,90 @@
+import subprocess
+import sys
+import tomllib
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def run(code):
+    # a fresh interpreter: this test session has imported plenty already
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+LOADED = "print(sorted(m for m in sys.modules if m.startswith('core_python')))"
+
+
+def test_importing_core_python_imports_no_submodules():
+    result = run(
+        "import sys, builtins\n"
+        "builtins.input = lambda prompt='': sys.exit('input() called')\n"
+        "import core_python\n"
+        f"{LOADED}\n"
+        "package = core_python.fundamentals_2\n"
+        f"{LOADED}\n"
+        "assert package.decades.__module__ == 'core_python.2_fundamental.dataTypes'\n"
+        f"{LOADED}\n"
+        "assert 'decades' in vars(package) and 'decades' in dir(package)\n"
+        "assert core_python.fundamentals_2 is sys.modules['core_python.2_fundamental']\n"
+        "print('logging' in sys.modules)\n"
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == [
+        "['core_python', 'core_python._lazy']",
+        "['core_python', 'core_python.2_fundamental', 'core_python._lazy']",
+        "['core_python', 'core_python.2_fundamental',"
+        " 'core_python.2_fundamental.dataTypes', 'core_python._lazy']",
+        "False",
+    ]
+
+
+def test_unknown_names_raise_attribute_error():
+    result = run(
+        "import core_python\n"
+        "for name in ('nothing', '__wrapped__'):\n"
+        "    try:\n"
+        "        getattr(core_python.fundamentals_2, name)\n"
+        "    except AttributeError as error:\n"
+        "        print(error)\n"
+    )
+    assert result.stdout.splitlines() == [
+        "module 'core_python.2_fundamental' has no attribute 'nothing'",
+        "module 'core_python.2_fundamental' has no attribute '__wrapped__'",
+    ]
+
+
+def test_import_time_budget_check():
+    tool = str(ROOT / "benchmarks" / "check_import_time.py")
+    within = subprocess.run(
+        [sys.executable, tool, "--runs", "1", "--budget-ms", "1000"],
+        capture_output=True,
+        text=True,
+    )
+    assert within.returncode == 0, within.stderr
+    assert "import core_python:" in within.stdout and "OK" in within.stdout
+    over = subprocess.run(
+        [sys.executable, tool, "--runs", "1", "--budget-ms", "0", "--top", "1"],
+        capture_output=True,
+        text=True,
+    )
+    assert over.returncode == 1 and "OVER BUDGET" in over.stdout
+    assert over.stdout.splitlines()[-1].split()[-1].startswith("core_python")
+
+
+def test_import_time_is_within_the_configured_budget():
+    # no options: module, budget and runs come from [tool.import-budget]
+    with open(ROOT / "pyproject.toml", "rb") as file:
+        budget_ms = tomllib.load(file)["tool"]["import-budget"]["budget_ms"]
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "benchmarks" / "check_import_time.py")],
+        capture_output=True,
+        text=True,
+    )
+    assert f"budget {budget_ms:g} ms" in result.stdout, result.stderr
+    assert result.returncode == 0, result.stdout
@@ -0,0 +1,172 @@
+import io
+import math
+import random
+
+import pytest
+
+import company as companyModule
+import payroll
+from company import KIND_NAMES, Company
+from employee import CommissionEmployee, HourlyEmployee, SalaryEmployee
+
+
+def _random_employee(rng, i):
+    kind = rng.randrange(3)
+    if kind == 0:
+        return SalaryEmployee(f"S{i}", "Doe", rng.randint(20000, 200000))
+    if kind == 1:
+        return HourlyEmployee(f"H{i}", "Doe", rng.uniform(10, 80), rng.randint(1, 60))
+    return CommissionEmployee(
+        f"C{i}", "Doe", rng.randint(20000, 90000), rng.random() / 5, rng.uniform(0, 1e6)
+    )
+
+
+def test_batched_paychecks_match_calculate_paycheck():
+    rng = random.Random(42)
+    company = Company()
+    for i in range(2000):
+        company.add_employee(_random_employee(rng, i))
+
+    expected = [emp.calculate_paycheck() for emp in company.employees]
+    assert company.paychecks() == expected
+
+
+def test_pure_python_path_matches_calculate_paycheck(monkeypatch):
+    monkeypatch.setattr(payroll, "_np", None)
+    rng = random.Random(7)
+    company = Company()
+    for i in range(500):
+        company.add_employee(_random_employee(rng, i))
+
+    expected = [emp.calculate_paycheck() for emp in company.employees]
+    assert company.paychecks() == expected
+
+
+def test_unknown_subclass_falls_back_to_calculate_paycheck():
+    class Intern(SalaryEmployee):
+        def calculate_paycheck(self):
+            return 100
+
+    company = Company()
+    company.add_employee(Intern("Ada", "Byron", 1))
+    company.add_employee(HourlyEmployee("Jane", "Smith", 25, 40))
+    assert company.paychecks() == [100, 1000]
+
+
+def test_compact_company_views_behave_like_employees():
+    company = Company(compact=True)
+    company.add_employee(SalaryEmployee("John", "Doe", 60000))
+    company.add_employee(HourlyEmployee("Jane", "Smith", 25, 40))
+    company.add_employee(CommissionEmployee("Alice", "Johnson", 50000, 0.10, 20000))
+
+    john, jane, alice = company.employees
+    assert isinstance(john, SalaryEmployee) and not isinstance(john, CommissionEmployee)
+    assert isinstance(alice, CommissionEmployee)
+    assert (jane.first_name, jane.weekly_hours) == ("Jane", 40)
+    assert company.paychecks() == [e.calculate_paycheck() for e in company.employees]
+
+    jane.weekly_hours = 20  # writes go to the columns
+    assert company.paychecks()[1] == 500
+    assert not hasattr(SalaryEmployee("A", "B", 1), "__dict__")
+
+
+def test_streamed_text_report_matches_joined_report(monkeypatch):
+    rng = random.Random(3)
+    company = Company()
+    for i in range(1234):
+        company.add_employee(_random_employee(rng, i))
+    expected = "\n".join(
+        f"{emp.first_name} {emp.last_name}: ${emp.calculate_paycheck():,.2f}"
+        for emp in company.employees
+    )
+
+    for numpy in (payroll._np, None):
+        monkeypatch.setattr(payroll, "_np", numpy)
+        sink = io.StringIO()
+        stats = company.write_report(sink, chunk_size=100)
+        assert sink.getvalue() == expected + "\n"
+        assert stats.rows == 1234
+
+
+def _mutate(rng, emp):
+    if isinstance(emp, HourlyEmployee):
+        if rng.random() < 0.5:
+            emp.hourly_rate = rng.uniform(10, 80)
+        else:
+            emp.weekly_hours = rng.randint(0, 60)
+    elif isinstance(emp, CommissionEmployee) and rng.random() < 0.5:
+        emp.sales_amount = rng.uniform(0, 1e6)
+    else:
+        emp.salary = rng.randint(20000, 200000)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_incremental_totals_match_full_recompute(compact):
+    rng = random.Random(2024)
+    company = Company(compact=compact)
+    for step in range(3000):
+        if not company.employees or rng.random() < 0.3:
+            company.add_employee(_random_employee(rng, step))
+        else:
+            _mutate(rng, company.employees[rng.randrange(len(company.employees))])
+
+        if step % 100 == 0 or step == 2999:
+            pays = [emp.calculate_paycheck() for emp in company.employees]
+            assert company.total_payroll == math.fsum(pays)
+            by_kind = {}
+            for emp, pay in zip(company.employees, pays):
+                by_kind.setdefault(KIND_NAMES[payroll.kind_of(emp)], []).append(pay)
+            for name, total in company.totals_by_type().items():
+                assert total == math.fsum(by_kind.get(name, []))
+            assert company.highest_paid()[1] == max(pays)
+            assert company.lowest_paid()[1] == min(pays)
+            assert [pay for _, pay in company.top_earners(5)] == sorted(pays)[::-1][:5]
+            assert company.paychecks() == pays
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_parallel_paychecks_match_serial(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(payroll, "_np", None)
+    rng = random.Random(11)
+    company = Company()
+    for i in range(1000):
+        company.add_employee(_random_employee(rng, i))
+
+    assert company.paychecks(workers=2, chunk_size=97) == company.paychecks()
+
+
+def test_parallel_report_shards_by_chunk_size(monkeypatch):
+    chunk_sizes = []
+
+    def spy(table, workers, chunk_size):
+        chunk_sizes.append(chunk_size)
+        return parallel(table, workers, chunk_size)
+
+    parallel = companyModule.parallel_paychecks
+    monkeypatch.setattr(companyModule, "parallel_paychecks", spy)
+    rng = random.Random(12)
+    company = Company()
+    for i in range(300):
+        company.add_employee(_random_employee(rng, i))
+
+    serial, sharded = io.StringIO(), io.StringIO()
+    company.write_report(serial, chunk_size=64)
+    company.write_report(sharded, chunk_size=64, workers=2)
+    assert sharded.getvalue() == serial.getvalue()
+    assert chunk_sizes == [64]
+
+
+def test_adding_an_employee_twice_is_rejected():
+    company = Company()
+    jane = HourlyEmployee("Jane", "Smith", 25, 40)
+    company.add_employee(jane)
+    with pytest.raises(ValueError, match="Jane Smith"):
+        company.add_employee(jane)
+    other = Company()
+    with pytest.raises(ValueError, match="another company"):
+        other.add_employee(jane)
+    jane.weekly_hours = 10
+    assert company.paychecks() == [250]
+    assert company.total_payroll == 250
+    assert other.paychecks() == [] and other.total_payroll == 0
@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from recordStore import CATEGORY, FLOAT, INT, OBJECT, RecordStore
+
+
+def make_contacts(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"Person {rng.randrange(count)}",
+            "phone": f"555-{i:07d}",
+            "age": rng.randrange(18, 90),
+            "score": rng.random(),
+            "city": rng.choice(["Oslo", "Lima", "Pune"]),
+        }
+        for i in range(count)
+    ]
+
+
+def test_round_trip_and_column_kinds():
+    records = make_contacts(500)
+    store = RecordStore.from_records(records)
+    assert len(store) == 500
+    assert store.to_dicts() == records
+    assert [view.to_dict() for view in store] == records
+    assert store[-1] == records[-1]
+    assert dict(store[3]) == records[3]
+    kinds = {field: store.kind(field) for field in store.fields}
+    assert kinds == {
+        "name": OBJECT,
+        "phone": OBJECT,
+        "age": INT,
+        "score": FLOAT,
+        "city": CATEGORY,
+    }
+    assert list(store.values("phone", "age"))[7] == (
+        records[7]["phone"],
+        records[7]["age"],
+    )
+
+
+def test_values_that_do_not_fit_a_column_keep_their_type():
+    store = RecordStore.from_records(make_contacts(100))
+    store.append({**make_contacts(1)[0], "age": True, "score": 3})
+    store[0]["age"] = 2**70
+    assert store.kind("age") == OBJECT and store.kind("score") == OBJECT
+    assert store[-1]["age"] is True and type(store[-1]["score"]) is int
+    assert store[0]["age"] == 2**70
+
+
+def test_indexes_follow_appends_and_assignments():
+    records = make_contacts(1000, seed=1)
+    store = RecordStore.from_records(records)
+    store.create_index("name")
+    store.create_index("phone", unique=True)
+    rng = random.Random(2)
+    for step in range(300):
+        i = rng.randrange(len(store))
+        if step % 3 == 0:
+            record = {**records[i], "phone": f"556-{step:07d}"}
+            store.append(record)
+            records.append(record)
+        else:
+            name = f"Person {rng.randrange(50)}"
+            store[i]["name"] = name
+            records[i]["name"] = name
+    for name in {r["name"] for r in records}:
+        expected = [r for r in records if r["name"] == name]
+        assert [view.to_dict() for view in store.find("name", name)] == expected
+    assert store.find_one("phone", records[42]["phone"]) == records[42]
+    assert store.find_one("phone", "nobody") is None
+    assert store.find("city", "Lima") == [r for r in records if r["city"] == "Lima"]
+
+
+def test_unique_index_rejects_duplicates():
+    store = RecordStore.from_records(make_contacts(10))
+    store.create_index("phone", unique=True)
+    with pytest.raises(ValueError):
+        store.append(make_contacts(1)[0] | {"phone": store[0]["phone"]})
+    with pytest.raises(ValueError):
+        store[1]["phone"] = store[2]["phone"]
+    assert len(store) == 10
+    with pytest.raises(ValueError):
+        store.create_index("city", unique=True)
+
+
+def test_records_must_have_the_store_fields():
+    store = RecordStore(["name", "phone"])
+    with pytest.raises(KeyError):
+        store.append({"name": "Alice", "mobile": "1"})
+    with pytest.raises(ValueError):
+        store.append({"name": "Alice", "phone": "1", "email": "a@b"})
+    with pytest.raises(IndexError):
+        store[0]
+    assert RecordStore.from_records([]).to_dicts() == []
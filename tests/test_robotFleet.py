@@ -0,0 +1,133 @@
+import io
+import random
+
+import pytest
+
+import robotFleet
+from classesAndObjects import Robot, Robot_Dog
+from robotFleet import PrintSink, RobotFleet
+
+BACKEND_MODULES = [robotFleet]
+
+
+def test_batched_walk_matches_per_robot_moves(backend):
+    rng = random.Random(1)
+    fleet = RobotFleet()
+    fleet.spawn(f"R{i}" for i in range(300))
+    expected = [[0, 0] for _ in range(300)]
+    for _ in range(20):
+        if rng.random() < 0.5:
+            dx = rng.randrange(-5, 6)
+            dy = [rng.randrange(-5, 6) for _ in range(300)]
+            fleet.walk(dx, dy)
+            for position, step in zip(expected, dy):
+                position[0] += dx
+                position[1] += step
+        else:
+            rows = rng.sample(range(300), rng.choice([3, 100]))
+            dx = [rng.randrange(-5, 6) for _ in rows]
+            fleet.walk(dx, 2, rows=rows)
+            for row, step in zip(rows, dx):
+                expected[row][0] += step
+                expected[row][1] += 2
+    assert [list(p) for p in fleet.positions()] == expected
+
+
+def test_fractional_positions(backend):
+    fleet = RobotFleet("d")
+    fleet.spawn(["a", "b"])
+    fleet.walk(0.5, [0.25, -0.25])
+    assert list(fleet.positions()) == [(0.5, 0.25), (0.5, -0.25)]
+    with pytest.raises(ValueError):
+        RobotFleet("i")
+
+
+def test_walk_rejects_steps_of_the_wrong_length(backend):
+    fleet = RobotFleet()
+    fleet.spawn(f"R{i}" for i in range(100))
+    fleet.walk(1, 2)
+    for dx, dy, rows in [
+        ([1, 2], 0, None),
+        ([1], 0, None),
+        (0, [1] * 101, None),
+        (1, [1, 2], range(80)),
+        ([1] * 81, 0, range(80)),
+    ]:
+        with pytest.raises(ValueError, match="steps for"):
+            fleet.walk(dx, dy, rows=rows)
+    assert len(fleet.xs) == len(fleet.ys) == 100
+    assert set(fleet.positions()) == {(1, 2)}
+
+
+def test_print_sink_is_buffered():
+    out = io.StringIO()
+    fleet = RobotFleet(sink=PrintSink(out, buffer_lines=4))
+    fleet.spawn(["a", "b", "c"])
+    fleet.walk(1)
+    assert out.getvalue() == ""
+    fleet.walk(1, rows=[2])
+    assert out.getvalue().splitlines() == [
+        "a walked to position [1, 0]",
+        "b walked to position [1, 0]",
+        "c walked to position [1, 0]",
+        "c walked to position [2, 0]",
+    ]
+    fleet.walk(1, rows=[0])
+    fleet.flush()
+    assert out.getvalue().endswith("a walked to position [2, 0]\n")
+
+
+def test_standalone_robot_prints_like_before(capsys):
+    robot = Robot("Rex")
+    robot.walk(3)
+    robot.walk(-1)
+    assert capsys.readouterr().out == (
+        "My name is Rex\n"
+        "Rex walked to position [3, 0]\n"
+        "Rex walked to position [2, 0]\n"
+    )
+    assert robot.position == [2, 0]
+    robot.position[1] += 5
+    assert robot.position == [2, 5] and robot.position[-1] == 5
+    robot.position = (7, 8)
+    assert list(robot.position) == [7, 8]
+    assert capsys.readouterr().out == ""
+    with pytest.raises(ValueError):
+        robot.name = " "
+    with pytest.raises(ValueError):
+        Robot("")
+
+
+def test_robots_are_views_of_their_fleet(capsys):
+    fleet = RobotFleet()
+    dog = Robot_Dog("Buddy", "Beagle", fleet=fleet)
+    robots = [Robot.view(fleet, row) for row in fleet.spawn(["A", "B"])]
+    fleet.walk(4, [1, 2, 3])
+    assert dog.position == [4, 1] and dog.breed == "Beagle"
+    assert [r.position for r in robots] == [[4, 2], [4, 3]]
+    robots[0].name = "Ace"
+    assert fleet.names == ["Buddy", "Ace", "B"]
+    robots[1].walk(1)
+    assert fleet.position(2) == [5, 3]
+    assert capsys.readouterr().out == "My name is Buddy\n"  # no sink, no events
+
+
+def test_robots_walk_by_fractions_like_before(backend, capsys):
+    robot = Robot("Rex")
+    robot.walk(2)
+    robot.walk(0.5)
+    assert robot.position == [2.5, 0]
+    robot.position = [1.5, 2]
+    assert robot.position == [1.5, 2]
+    robot.position[1] = 0.25
+    assert capsys.readouterr().out == (
+        "My name is Rex\n"
+        "Rex walked to position [2, 0]\n"
+        "Rex walked to position [2.5, 0.0]\n"
+    )
+    fleet = RobotFleet()
+    fleet.spawn(["a", "b"])
+    fleet.walk(1, [2, 3])
+    assert fleet.typecode == "q"
+    fleet.walk(0, [0.5, 1])
+    assert fleet.typecode == "d" and list(fleet.positions()) == [(1, 2.5), (1, 4)]
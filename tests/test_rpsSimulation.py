@@ -0,0 +1,68 @@
+import builtins
+import random
+
+import conditionalsAndImports
+import rpsSimulation
+from rpsSimulation import (
+    MOVES,
+    PAPER,
+    ROCK,
+    SCISSORS,
+    SHARD_ROUNDS,
+    Constant,
+    Cycle,
+    RandomMoves,
+    Tally,
+    outcome,
+    simulate,
+)
+
+BACKEND_MODULES = [rpsSimulation]
+
+
+def test_payoff_table_matches_the_rules():
+    beats = {("rock", "scissors"), ("scissors", "paper"), ("paper", "rock")}
+    for a, mine in enumerate(MOVES):
+        for b, theirs in enumerate(MOVES):
+            expected = "TIE" if a == b else "WIN" if (mine, theirs) in beats else "LOSS"
+            assert outcome(a, b) == getattr(rpsSimulation, expected)
+
+
+def test_scripted_players_give_exact_counts_across_shards(backend):
+    rounds = SHARD_ROUNDS + 10
+    tally = simulate(Constant(ROCK), Cycle([ROCK, PAPER, SCISSORS]), rounds)
+    # Cycle plays round n's move from n alone, so shards join seamlessly
+    thirds = [len(range(k, rounds, 3)) for k in range(3)]
+    assert tally == Tally(wins=thirds[2], ties=thirds[0], losses=thirds[1])
+    assert tally.rounds == rounds
+
+
+def test_random_play_is_reproducible_from_the_seed(backend):
+    def run(seed):
+        return simulate(RandomMoves(), RandomMoves(), 200_000, seed, batch_size=4096)
+
+    first = run(7)
+    assert first == run(7) and first != run(8)
+    assert first.rounds == 200_000
+    assert all(abs(count - 200_000 / 3) < 2000 for count in first)
+
+
+def test_pure_and_numpy_paths_and_workers_agree(monkeypatch):
+    rounds = 2 * SHARD_ROUNDS + 3
+    serial = simulate(RandomMoves(), Cycle([PAPER, ROCK]), rounds, seed=3)
+    monkeypatch.setattr(rpsSimulation, "_np", None)
+    assert simulate(RandomMoves(), Cycle([PAPER, ROCK]), rounds, seed=3) == serial
+    monkeypatch.undo()
+    pooled = simulate(RandomMoves(), Cycle([PAPER, ROCK]), rounds, seed=3, workers=2)
+    assert pooled == serial
+
+
+def test_interactive_game_uses_the_payoff_table(monkeypatch, capsys):
+    monkeypatch.setattr(builtins, "input", lambda prompt="": "Paper")
+    monkeypatch.setattr(conditionalsAndImports.random, "choice", lambda seq: "rock")
+    conditionalsAndImports.rock_paper_scissors()
+    assert capsys.readouterr().out == "YOU WIN\nComputer chose: rock\n"
+    monkeypatch.undo()
+    monkeypatch.setattr(builtins, "input", lambda prompt="": "lizard")
+    conditionalsAndImports.rock_paper_scissors(random.Random(1))
+    assert capsys.readouterr().out.startswith("YOU LOSE\n")
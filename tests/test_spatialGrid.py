@@ -0,0 +1,117 @@
+import math
+import random
+
+import pytest
+
+import robotFleet
+import spatialGrid
+from robotFleet import RobotFleet
+from spatialGrid import SpatialGrid
+
+BACKEND_MODULES = [robotFleet, spatialGrid]
+
+
+def brute_within(fleet, x, y, radius):
+    return sorted(
+        row
+        for row, (px, py) in enumerate(fleet.positions())
+        if (px - x) ** 2 + (py - y) ** 2 <= radius * radius
+    )
+
+
+def brute_nearest(fleet, x, y, k):
+    found = sorted(
+        ((px - x) ** 2 + (py - y) ** 2, row)
+        for row, (px, py) in enumerate(fleet.positions())
+    )[:k]
+    return [(math.sqrt(d2), row) for d2, row in found]
+
+
+def assert_same_neighbours(found, expected):
+    assert [row for _, row in found] == [row for _, row in expected]
+    assert [d for d, _ in found] == pytest.approx([d for d, _ in expected])
+
+
+def assert_consistent(grid):
+    filed = sorted(row for bucket in grid.buckets.values() for row in bucket)
+    assert filed == list(range(len(grid.fleet)))
+    for key, bucket in grid.buckets.items():
+        for slot, row in enumerate(bucket):
+            assert grid.cell_of[row] == key and grid.slot_of[row] == slot
+    assert grid.cell_of.tolist() == grid._keys(None)
+
+
+@pytest.mark.parametrize("typecode, cell_size", [("q", 10), ("d", 7.5)])
+def test_grid_follows_the_fleet_and_answers_like_brute_force(
+    backend, typecode, cell_size
+):
+    rng = random.Random(3)
+    number = (lambda: rng.randrange(-30, 31)) if typecode == "q" else rng.uniform
+    fleet = RobotFleet(typecode)
+    fleet.spawn(f"R{i}" for i in range(150))
+    fleet.walk([number(-30, 30) if typecode == "d" else number() for _ in range(150)])
+    grid = SpatialGrid(fleet, cell_size)
+
+    def step():
+        return number(-9, 9) if typecode == "d" else rng.randrange(-9, 10)
+
+    for turn in range(40):
+        choice = turn % 5
+        if choice == 0:
+            fleet.walk([step() for _ in range(len(fleet))], step())
+        elif choice == 1:
+            rows = rng.sample(range(len(fleet)), rng.choice([5, 100]))
+            fleet.walk(step(), [step() for _ in rows], rows=rows)
+        elif choice == 2:
+            fleet.position(rng.randrange(len(fleet)))[rng.randrange(2)] = step() * 5
+        elif choice == 3:
+            fleet.move_to(rng.randrange(len(fleet)), step() * 5, step() * 5)
+        else:
+            fleet.add(f"New{turn}", step(), step())
+        assert_consistent(grid)
+        for _ in range(5):
+            x, y = step() * 5, step() * 5
+            radius = rng.choice([0, 3, 12.5, 40, 500])
+            assert sorted(grid.within(x, y, radius)) == brute_within(
+                fleet, x, y, radius
+            )
+            k = rng.choice([1, 3, 20, 500])
+            assert_same_neighbours(grid.nearest(x, y, k), brute_nearest(fleet, x, y, k))
+
+
+def test_far_away_queries_and_empty_grid():
+    fleet = RobotFleet()
+    grid = SpatialGrid(fleet, 5)
+    assert grid.nearest(0, 0) == [] and grid.within(0, 0, 10) == []
+    fleet.add("a", 1, 1)
+    fleet.add("b", 2, 2)
+    assert grid.nearest(10**6, -(10**6), 1) == brute_nearest(fleet, 10**6, -(10**6), 1)
+    grid.close()
+    fleet.walk(100)
+    assert grid.within(101, 101, 0) == []
+    with pytest.raises(ValueError):
+        SpatialGrid(fleet, 0)
+
+
+@pytest.mark.parametrize("typecode, cell_size", [("q", 1), ("d", 0.5)])
+def test_huge_cell_coordinates_give_the_same_keys_on_both_backends(
+    monkeypatch, typecode, cell_size
+):
+    fleet = RobotFleet(typecode)
+    for i in range(100):
+        # cells around +-2**31, 2**32 apart and beyond int64 (for floats)
+        x = [2**31 + i, -(2**31) - i, 2**32 + i, i, 2**62 + i][i % 5]
+        y = [i, 2**31 - 1 + i, -(2**33) - i, -(2**31) + i, 2**62][i % 5]
+        if typecode == "d":
+            x, y = x * 4.0, y * 4.0
+        fleet.add(f"R{i}", x, y)
+    grid = SpatialGrid(fleet, cell_size)
+    assert_consistent(grid)
+    keys = grid._keys(None)
+    assert all(-(2**63) <= key < 2**63 for key in keys)
+
+    monkeypatch.setattr(spatialGrid, "_np", None)
+    assert grid._keys(None) == keys
+    for x, y in list(fleet.positions())[:10]:
+        assert sorted(grid.within(x, y, 3)) == brute_within(fleet, x, y, 3)
+        assert_same_neighbours(grid.nearest(x, y, 2), brute_nearest(fleet, x, y, 2))